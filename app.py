@@ -1,29 +1,19 @@
 import streamlit as st  # Web app framework for creating interactive interfaces
-import matplotlib.pyplot as plt  # Library for creating visualizations like bar charts
-from src.analyzer import length_checker, entropy_calculator, pattern_detector, frequency_checker, name_detector, score_aggregator
+from src.analyzer.engine import get_engine
+
+@st.cache_resource
+def load_engine():
+    """Keep one loaded engine alive across Streamlit reruns."""
+    return get_engine()
 
 st.title("Password Strength Analyzer")  # Sets the main title of the web app
 
 password = st.text_input("Enter a password to analyze:", type="password")  # Creates a password input field that hides the text
 
 if password:  # Only run analysis if a password is entered
-    # Run individual analyzer modules on the password
-    length_res = length_checker.evaluate([password])  # Checks password length strength
-    entropy_res = entropy_calculator.evaluate([password])  # Calculates randomness/entropy
-    patterns_res = pattern_detector.evaluate([password])[0]  # Detects weak patterns
-    freq_res = frequency_checker.evaluate([password])[0]  # Checks against common password lists
-    names_res = name_detector.NameDetector().analyze(password)  # Detects personal names
-
-    # Convert analyzer results to strength scores (0-1, higher is better)
-    results = {
-        "length": length_res[password],  # Length score (0-1)
-        "entropy": entropy_res[password],  # Entropy score (0-1)
-        "patterns": 1 - min(patterns_res["pattern_score"] / 5, 1),  # Invert pattern penalty to strength
-        "frequency": 1 - freq_res["frequency_score"],  # Invert frequency penalty to strength
-        "names": 1 - min(names_res["name_score"] / 5, 1)  # Invert name penalty to strength
-    }
-
-    final_result = score_aggregator.combine_results(results)  # Aggregate all scores into final result
+    # Run all analyzer modules and aggregate into a final result (0-1, higher is better)
+    final_result = load_engine().analyze(password)
+    results = final_result['components']  # Per-component strength scores
 
     st.subheader(f"Overall Strength Score: {final_result['final_score']:.2f}")  # Display overall score
 
@@ -32,7 +22,11 @@ if password:  # Only run analysis if a password is entered
     for key, value in final_result['components'].items():
         st.write(f"- {key.capitalize()}: {value:.2f}")
 
+    if final_result['skipped']:
+        st.caption(f"Skipped (result already decided): {', '.join(final_result['skipped'])}")
+
     # Create and display a bar chart of the component scores
+    import matplotlib.pyplot as plt  # Imported on first use; it is slow to import and only needed here
     fig, ax = plt.subplots()
     ax.bar(final_result['components'].keys(), final_result['components'].values())
     ax.set_ylim(0, 1)
@@ -59,7 +53,7 @@ if password:  # Only run analysis if a password is entered
         suggestions.append("Avoid common patterns like sequences or repeats.")
     if results['frequency'] < 1:
         suggestions.append("Avoid common passwords.")
-    if results['names'] < 1:
+    if results['names'] < 1:  # 1.0 when the name scan was skipped
         suggestions.append("Avoid using personal names.")
 
     if suggestions:
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Name Detector Benchmark
+
+Measures per-password latency of NameDetector as the name list grows, for
+the linear fuzzy scan, the bigram-indexed fuzzy scan and the Aho-Corasick
+exact mode. Larger name lists are synthesized
+from the bundled common-names.txt so the character distribution stays realistic.
+
+Usage: python benchmarks/bench_name_detector.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.analyzer.name_detector import NameDetector
+
+SIZES = [2000, 10000, 50000, 100000]
+PASSWORDS_FILE = ROOT / "data" / "blocklists" / "rockyou_sample.txt"
+NAMES_FILE = ROOT / "data" / "common-names.txt"
+
+
+def synthesize_names(size: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    base = [line.strip().lower() for line in NAMES_FILE.open(encoding="utf-8") if line.strip()]
+    names = set(base[:size])
+    while len(names) < size:
+        a, b = rng.sample(base, 2)
+        names.add(a[: rng.randint(2, len(a))] + b[rng.randint(0, len(b) - 1):])
+    return sorted(names)
+
+
+def time_per_password(detector: NameDetector, passwords: list[str]) -> float:
+    start = time.perf_counter()
+    for pw in passwords:
+        detector.analyze(pw)
+    return (time.perf_counter() - start) / len(passwords)
+
+
+def main():
+    with PASSWORDS_FILE.open(encoding="utf-8", errors="ignore") as f:
+        passwords = [line.strip() for line in f if line.strip()][:500]
+
+    print(f"{'names':>8} {'linear (ms/pw)':>16} {'indexed (ms/pw)':>16} {'speedup':>8} {'exact (ms/pw)':>14}")
+    for size in SIZES:
+        with tempfile.NamedTemporaryFile("w", delete=False, encoding="utf-8", suffix=".txt") as tmp:
+            tmp.write("\n".join(synthesize_names(size)))
+        try:
+            linear = NameDetector(name_file_path=tmp.name, use_index=False, mode="fuzzy")
+            indexed = NameDetector(name_file_path=tmp.name, use_index=True, mode="fuzzy")
+            exact = NameDetector(name_file_path=tmp.name, mode="exact")
+            sample = passwords[:100] if size > 10000 else passwords
+            linear_t = time_per_password(linear, sample)
+            indexed_t = time_per_password(indexed, sample)
+            exact_t = time_per_password(exact, passwords)
+        finally:
+            os.remove(tmp.name)
+        print(f"{size:>8} {linear_t * 1000:>16.3f} {indexed_t * 1000:>16.3f} {linear_t / indexed_t:>7.1f}x {exact_t * 1000:>14.4f}")
+
+
+if __name__ == "__main__":
+    main()
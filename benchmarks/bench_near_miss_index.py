@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Near-Miss Index Benchmark
+
+Builds NearMissIndex over the bundled blocklists and reports build time,
+memory, snapshot size and load time, and lookup latency for near misses
+(entries with one or two random edits) and unrelated passwords. For
+comparison it also times a brute-force edit distance scan over every entry.
+
+Usage: python benchmarks/bench_near_miss_index.py [lookups]
+"""
+
+import pickle
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.analyzer import frequency_checker
+from src.analyzer.near_miss_index import MAX_ENTRIES, MIN_LENGTH, NearMissIndex, edit_distance
+
+ALPHABET = string.ascii_lowercase + string.digits
+
+
+def mutate(word: str, edits: int, rng: random.Random) -> str:
+    for _ in range(edits):
+        i = rng.randrange(len(word))
+        op = rng.choice("isd")
+        if op == "i":
+            word = word[:i] + rng.choice(ALPHABET) + word[i:]
+        elif op == "s":
+            word = word[:i] + rng.choice(ALPHABET) + word[i + 1:]
+        else:
+            word = word[:i] + word[i + 1:]
+    return word
+
+
+def time_lookups(index, queries) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        index.lookup(query)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def brute_force(entries, query: str):
+    """(distance, rank) of the closest indexable entry, by scanning every entry."""
+    limit = 2 if len(query) >= 8 else 1
+    return min(((edit_distance(query, entry, limit), rank) for rank, entry in enumerate(entries)
+                if len(entry) >= MIN_LENGTH and 1 <= edit_distance(query, entry, limit) <= limit),
+               default=None)
+
+
+def main():
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    entries = frequency_checker._build_rank_index().ranked_entries(MAX_ENTRIES)
+
+    start = time.perf_counter()
+    index = NearMissIndex(entries)
+    build_s = time.perf_counter() - start
+
+    data = pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL)
+    start = time.perf_counter()
+    pickle.loads(data)
+    load_ms = (time.perf_counter() - start) * 1e3
+
+    print(f"entries indexed:   {len(index)} of {len(entries)}")
+    print(f"deletion keys:     {len(index._keys)}")
+    print(f"build:             {build_s:.2f} s")
+    print(f"memory:            {index.nbytes() / 1e6:.1f} MB ({index.nbytes() / len(index):.1f} B/entry)")
+    print(f"snapshot:          {len(data) / 1e6:.1f} MB, loads in {load_ms:.1f} ms")
+
+    rng = random.Random(0)
+    long_entries = [entry for entry in entries if len(entry) >= 8]
+    one_edit = [mutate(rng.choice(entries), 1, rng) for _ in range(lookups)]
+    two_edits = [mutate(rng.choice(long_entries), 2, rng) + "x" for _ in range(lookups)]
+    unrelated = ["".join(rng.choice(ALPHABET + "!@#$") for _ in range(rng.randint(8, 14)))
+                 for _ in range(lookups)]
+    print(f"lookup, 1 edit:    {time_lookups(index, one_edit):.1f} us")
+    print(f"lookup, 2 edits:   {time_lookups(index, two_edits):.1f} us")
+    print(f"lookup, unrelated: {time_lookups(index, unrelated):.1f} us")
+
+    samples = one_edit[:20] + two_edits[:20]
+    start = time.perf_counter()
+    mismatches = 0
+    for query in samples:
+        result = index.lookup(query)
+        expected = brute_force(entries, query)
+        mismatches += (None if result is None else (result["distance"], result["rank"])) != expected
+    scan_ms = (time.perf_counter() - start) / len(samples) * 1e3
+    print(f"brute-force scan:  {scan_ms:.0f} ms per lookup, {mismatches} mismatches in {len(samples)}")
+
+
+if __name__ == "__main__":
+    main()
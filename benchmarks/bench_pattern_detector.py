@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Pattern Detector Benchmark
+
+Compares the per-password cost of the original pattern detector (uncompiled
+re.search calls and repeated lowercasing inside loops) with the precompiled
+PatternEngine, and counts passwords where they report different categories
+(expected since sequence_detector: it finds runs the old fixed lists missed).
+
+Usage: python benchmarks/bench_pattern_detector.py
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.analyzer import pattern_detector
+
+PASSWORDS_FILE = ROOT / "data" / "blocklists" / "rockyou_sample.txt"
+PATTERNS = pattern_detector.PATTERNS
+PATTERN_WEIGHTS = pattern_detector.PATTERN_WEIGHTS
+
+# Removed from common_patterns.json in favour of repeat_detector and sequence_detector
+LEGACY_PATTERNS = dict(
+    PATTERNS,
+    repeated_substrings=[r"(..+)\1+"],
+    sequences_alpha=[
+        "(abc|bcd|cde|def|efg|fgh|ghi|hij|ijk|jkl|klm|lmn|mno|nop|opq|pqr|qrs|rst|stu|tuv|uvw|vwx|wxy|xyz)",
+        "(zyx|yxw|xwv|wvu|vut|uts|tsr|srq|rqp|qpo|pon|onm|nml|mlk|lkj|kji|jih|ihg|hgf|gfe|fed|edc|dcb|cba)",
+    ],
+    sequences_numeric=[
+        "(012|123|234|345|456|567|678|789|890)",
+        "(987|876|765|654|543|432|321|210|098)",
+    ],
+    keyboard_patterns=["qwerty", "asdfgh", "zxcvbn", "1q2w3e", "qazwsx", "qwe", "asd", "zxc"],
+)
+
+
+def legacy_detect_patterns(password):
+    """The detector as it was before PatternEngine, kept for comparison."""
+    detected = []
+    score = 0.0
+
+    for seq in LEGACY_PATTERNS.get("sequences_numeric", []):
+        for i in range(len(seq) - 2):
+            if seq[i:i+3] in password or seq[i:i+3][::-1] in password:
+                detected.append("sequential_numbers")
+                score += PATTERN_WEIGHTS["sequential_numbers"]
+                break
+        if "sequential_numbers" in detected:
+            break
+
+    for seq in LEGACY_PATTERNS.get("sequences_alpha", []):
+        for i in range(len(seq) - 2):
+            sub = seq[i:i+3]
+            if sub.lower() in password.lower() or sub[::-1].lower() in password.lower():
+                detected.append("sequential_letters")
+                score += PATTERN_WEIGHTS["sequential_letters"]
+                break
+        if "sequential_letters" in detected:
+            break
+
+    for seq in LEGACY_PATTERNS.get("keyboard_patterns", []):
+        if seq.lower() in password.lower():
+            detected.append("keyboard_pattern")
+            score += PATTERN_WEIGHTS["keyboard_pattern"]
+            break
+
+    for key, name, flags in [("repeated_chars", "repeated_chars", 0),
+                             ("repeated_substrings", "repeated_substring", 0),
+                             ("dates_numeric", "date_numeric", 0),
+                             ("dates_alphanumeric", "date_alphanumeric", re.IGNORECASE)]:
+        for pattern in LEGACY_PATTERNS.get(key, []):
+            if re.search(pattern, password, flags):
+                detected.append(name)
+                score += PATTERN_WEIGHTS[name]
+                break
+
+    return {"patterns": detected, "pattern_score": score}
+
+
+def time_per_password(detect, passwords) -> float:
+    start = time.perf_counter()
+    for pw in passwords:
+        detect(pw)
+    return (time.perf_counter() - start) / len(passwords)
+
+
+def main():
+    with PASSWORDS_FILE.open(encoding="utf-8", errors="ignore") as f:
+        passwords = [line.rstrip("\n") for line in f if line.strip()]
+
+    pattern_detector.compile_patterns()
+    mismatches = sum(
+        sorted(legacy_detect_patterns(pw)["patterns"]) != sorted(pattern_detector.detect_patterns(pw)["patterns"])
+        for pw in passwords
+    )
+
+    legacy = time_per_password(legacy_detect_patterns, passwords)
+    compiled = time_per_password(pattern_detector.detect_patterns, passwords)
+
+    print(f"passwords:         {len(passwords)}")
+    print(f"category mismatches: {mismatches}")
+    print(f"before (us/pw):    {legacy * 1e6:.2f}")
+    print(f"after  (us/pw):    {compiled * 1e6:.2f}")
+    print(f"speedup:           {legacy / compiled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
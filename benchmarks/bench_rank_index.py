@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Rank Index Benchmark
+
+Builds RankIndex over the bundled blocklists and over synthetic lists of
+up to several million entries, and reports build time, memory beyond the
+entry strings, and lookup latency for hits and misses. For comparison it
+also reports the size of a dict mapping each entry to its rank.
+
+Usage: python benchmarks/bench_rank_index.py [max_entries]
+"""
+
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.analyzer import frequency_checker
+from src.analyzer.rank_index import RankIndex
+
+LOOKUPS = 100000
+
+
+def dict_bytes(entries) -> int:
+    """Approximate size of {entry: rank} beyond the entry strings (dict table plus int objects)."""
+    ranks = {entry: rank for rank, entry in enumerate(entries)}
+    return sys.getsizeof(ranks) + sum(sys.getsizeof(rank) for rank in ranks.values() if rank > 256)
+
+
+def report(label: str, tiers):
+    entries = [entry for _, tier_entries in tiers for entry in tier_entries]
+
+    start = time.perf_counter()
+    index = RankIndex(tiers)
+    build_s = time.perf_counter() - start
+
+    extra = index.nbytes() - len(index._blob)
+    rng = random.Random(0)
+    hits = [rng.choice(entries) for _ in range(LOOKUPS)]
+    misses = [entry + "\x00" for entry in hits]
+
+    start = time.perf_counter()
+    for entry in hits:
+        index.rank(entry)
+    hit_us = (time.perf_counter() - start) / LOOKUPS * 1e6
+
+    start = time.perf_counter()
+    for entry in misses:
+        index.rank(entry)
+    miss_us = (time.perf_counter() - start) / LOOKUPS * 1e6
+
+    print(f"{label:>22} {len(index):>10} {build_s:>9.2f} {extra / len(index):>12.1f} "
+          f"{dict_bytes(entries) / len(index):>12.1f} {hit_us:>8.2f} {miss_us:>8.2f}")
+
+
+def synthetic(count: int) -> list:
+    rng = random.Random(count)
+    alphabet = string.ascii_lowercase + string.digits
+    return [f"{i}{''.join(rng.choice(alphabet) for _ in range(6))}" for i in range(count)]
+
+
+def main():
+    max_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 4000000
+
+    print(f"{'list':>22} {'entries':>10} {'build (s)':>9} {'B/entry idx':>12} {'B/entry dict':>12} "
+          f"{'hit (us)':>8} {'miss (us)':>8}")
+    bundled = [(tier, frequency_checker._read_list(path))
+               for tier, path in frequency_checker.BLOCKLIST_SOURCES]
+    report("bundled blocklists", bundled)
+
+    count = 250000
+    while count <= max_entries:
+        report(f"synthetic {count}", [("synthetic", synthetic(count))])
+        count *= 4
+
+
+if __name__ == "__main__":
+    main()
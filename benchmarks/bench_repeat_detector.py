@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Repeat Detector Benchmark
+
+Times repeated-substring detection with the old backtracking regex
+`(..+)\\1+` and with repeat_detector for inputs from 8 to 100k characters.
+The regex is only run on inputs up to REGEX_LIMIT characters, since beyond
+that a single call takes longer than the whole benchmark.
+
+Usage: python benchmarks/bench_repeat_detector.py
+"""
+
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.analyzer import repeat_detector
+
+SIZES = [8, 16, 64, 256, 1024, 4096, 16384, 100000]
+REGEX_LIMIT = 1024
+REPEATED_SUBSTRING = re.compile(r"(..+)\1+")
+
+
+def timed(func, arg) -> float:
+    start = time.perf_counter()
+    func(arg)
+    return time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'length':>8} {'input':>8} {'regex (ms)':>12} {'detector (ms)':>14}")
+    for size in SIZES:
+        inputs = {
+            "random": "".join(rng.choice(string.ascii_letters + string.digits) for _ in range(size)),
+            "periodic": ("abc" * size)[:size],
+        }
+        for kind, text in inputs.items():
+            regex_ms = f"{timed(REPEATED_SUBSTRING.search, text) * 1000:.3f}" if size <= REGEX_LIMIT else "skipped"
+            detector_ms = timed(repeat_detector.find_repeated_substring, text) * 1000
+            print(f"{size:>8} {kind:>8} {regex_ms:>12} {detector_ms:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+
+Measures, each in a fresh interpreter:
+- the import time of the analyzer engine and the Flask app
+- loading the engine's data (names, blocklists, patterns) with snapshots
+  disabled (parse every text file) and with a current snapshot in place
+
+Usage: python benchmarks/bench_startup.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+IMPORT_ENGINE = """
+import time
+start = time.perf_counter()
+import src.analyzer.engine
+print(time.perf_counter() - start)
+"""
+
+IMPORT_FLASK_APP = """
+import time
+start = time.perf_counter()
+import flask_app
+print(time.perf_counter() - start)
+"""
+
+LOAD_ENGINE = """
+import time
+from src.analyzer.engine import AnalyzerEngine
+start = time.perf_counter()
+AnalyzerEngine().load()
+print(time.perf_counter() - start)
+"""
+
+
+def run(code: str, snapshot_dir: str) -> float:
+    env = dict(os.environ, PASSWORD_ANALYZER_SNAPSHOT_DIR=snapshot_dir)
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    return float(out.strip().splitlines()[-1])
+
+
+def median_ms(code: str, snapshot_dir: str, runs: int) -> float:
+    return statistics.median(run(code, snapshot_dir) for _ in range(runs)) * 1000
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        run(LOAD_ENGINE, snapshot_dir)  # write the snapshots
+
+        print(f"median of {runs} fresh interpreters")
+        print(f"import src.analyzer.engine (ms):   {median_ms(IMPORT_ENGINE, snapshot_dir, runs):8.1f}")
+        print(f"import flask_app (ms):             {median_ms(IMPORT_FLASK_APP, snapshot_dir, runs):8.1f}")
+        print(f"engine load, no snapshot (ms):     {median_ms(LOAD_ENGINE, '', runs):8.1f}")
+        print(f"engine load, from snapshot (ms):   {median_ms(LOAD_ENGINE, snapshot_dir, runs):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Substring Blocklist Benchmark
+
+Builds the substring automaton over the bundled blocklists and reports its
+size, build time and memory (traced Python allocations), the size of its
+snapshot, and scan latency for passwords with and without embedded entries.
+
+Usage: python benchmarks/bench_substring_blocklist.py
+"""
+
+import pickle
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.analyzer import frequency_checker
+from src.analyzer import substring_blocklist as substrings
+from src.analyzer.rank_index import RankIndex
+
+SCANS = 20000
+PASSWORDS = ["password2024!", "xxdragonxx", "zq8maria!", "x9$kl2mp8qr5nt1wv4yz", "correcthorsebatterystaple"]
+
+
+def main():
+    index = RankIndex([(tier, frequency_checker._read_list(path))
+                       for tier, path in frequency_checker.BLOCKLIST_SOURCES])
+    entries = index.ranked_entries(substrings.MAX_ENTRIES)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    blocklist = substrings.SubstringBlocklist(entries)
+    build_s = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    data = pickle.dumps(blocklist, protocol=pickle.HIGHEST_PROTOCOL)
+    start = time.perf_counter()
+    pickle.loads(data)
+    load_s = time.perf_counter() - start
+
+    print(f"blocklist entries:          {len(index):>10}")
+    print(f"entries >= {substrings.MIN_LENGTH} chars:         {len(blocklist):>10}")
+    print(f"automaton nodes:            {blocklist.automaton.node_count:>10}")
+    print(f"build (s):                  {build_s:>10.2f}")
+    print(f"memory (MiB):               {memory / 2**20:>10.1f}")
+    print(f"snapshot size (MiB):        {len(data) / 2**20:>10.1f}")
+    print(f"snapshot load (s):          {load_s:>10.2f}")
+    print()
+    print(f"{'password':>26} {'scan (us)':>10}  longest embedded entry")
+    for password in PASSWORDS:
+        start = time.perf_counter()
+        for _ in range(SCANS):
+            result = blocklist.scan([password])
+        scan_us = (time.perf_counter() - start) / SCANS * 1e6
+        longest = result["longest"]["entry"] if result else "-"
+        print(f"{password:>26} {scan_us:>10.2f}  {longest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,51 +1,127 @@
-from flask import Flask, request, jsonify, render_template
+import os
+import threading
+import time
+
+from flask import Flask, Response, g, request, jsonify, render_template
 from flask_cors import CORS
-from src.analyzer import length_checker, entropy_calculator, pattern_detector, frequency_checker, name_detector, score_aggregator
+from src.analyzer import score_aggregator
+from src.analyzer.engine import get_engine
+from src.utils import metrics
+from src.utils.deadline import Deadline
+from src.utils.result_cache import ResultCache
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
-@app.route('/')
-def index():
-    return render_template('index.html')
+MAX_BATCH_SIZE = 10000  # default passwords per /analyze/batch request
+MAX_PASSWORD_LENGTH = 1024  # default characters; longer inputs are rejected before analysis
+MAX_DEADLINE_MS = 60000  # largest accepted per-request time budget
 
-@app.route('/analyze', methods=['POST'])
-def analyze():
-    data = request.get_json()
-    password = data.get('password', '')
+# Reject oversized request bodies before they are parsed
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
+# Input limits, overridable through the environment or app.config
+app.config['MAX_BATCH_SIZE'] = int(os.environ.get('PASSWORD_ANALYZER_MAX_BATCH_SIZE', MAX_BATCH_SIZE))
+app.config['MAX_PASSWORD_LENGTH'] = int(os.environ.get('PASSWORD_ANALYZER_MAX_PASSWORD_LENGTH',
+                                                       MAX_PASSWORD_LENGTH))
 
-    if not password:
-        return jsonify({'error': 'No password provided'}), 400
+# Final responses for recently analyzed passwords, keyed by HMAC of the password
+RESULT_CACHE_SIZE = 10000
+RESULT_CACHE_TTL = 300  # seconds
+result_cache = ResultCache(max_size=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL)
 
-    # Run individual analyzer modules
-    length_res = length_checker.evaluate([password])
-    entropy_res = entropy_calculator.evaluate([password])
-    patterns_res = pattern_detector.evaluate([password])[0]
-    freq_res = frequency_checker.evaluate([password])[0]
-    names_res = name_detector.NameDetector().analyze(password)
-
-    # Convert to strength scores
-    results = {
-        "length": length_res[password],
-        "entropy": entropy_res[password],
-        "patterns": 1 - min(patterns_res["pattern_score"] / 5, 1),
-        "frequency": 1 - freq_res["frequency_score"],
-        "names": 1 - min(names_res["name_score"] / 5, 1)
-    }
+# Request metrics; only lengths and timings are recorded, never password contents
+REQUEST_SECONDS = metrics.REGISTRY.histogram(
+    "password_analyzer_request_seconds", "HTTP request latency", ["endpoint"]
+)
+REQUESTS = metrics.REGISTRY.counter(
+    "password_analyzer_requests_total", "HTTP requests by endpoint and status", ["endpoint", "status"]
+)
+PASSWORD_LENGTH = metrics.REGISTRY.histogram(
+    "password_analyzer_password_length_chars", "Length of submitted passwords in characters",
+    buckets=(4, 6, 8, 10, 12, 16, 20, 32, 64, 128, 256, 1024)
+)
+BATCH_SIZE = metrics.REGISTRY.histogram(
+    "password_analyzer_batch_size", "Passwords per analyzed request",
+    buckets=(1, 10, 100, 1000, 10000)
+)
+metrics.REGISTRY.gauge("password_analyzer_result_cache_hits", "Result cache hits", lambda: result_cache.hits)
+metrics.REGISTRY.gauge("password_analyzer_result_cache_misses", "Result cache misses", lambda: result_cache.misses)
+metrics.REGISTRY.gauge(
+    "password_analyzer_result_cache_hit_ratio", "Share of result cache lookups that hit",
+    lambda: result_cache.hits / max(result_cache.hits + result_cache.misses, 1)
+)
+metrics.REGISTRY.gauge("password_analyzer_result_cache_entries", "Entries in the result cache", lambda: len(result_cache))
+
+# Offline breach corpus (SHA-1 range files), opened by the engine when it has
+# been built and reopened by reload_if_stale() after a rebuild
+def _breach_cache_info(field):
+    breach = get_engine().breach
+    return getattr(breach.cache_info(), field) if breach is not None else 0
 
-    final_result = score_aggregator.combine_results(results)
+metrics.REGISTRY.gauge("password_analyzer_breach_range_cache_hits", "Breach range LRU hits",
+                       lambda: _breach_cache_info("hits"))
+metrics.REGISTRY.gauge("password_analyzer_breach_range_cache_misses", "Breach range LRU misses",
+                       lambda: _breach_cache_info("misses"))
 
-    # Check for breaches (simplified)
+@app.before_request
+def start_timer():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def record_request(response):
+    endpoint = request.endpoint or "unknown"
+    if "request_start" in g:
+        REQUEST_SECONDS.observe(time.perf_counter() - g.request_start, endpoint=endpoint)
+    REQUESTS.inc(endpoint=endpoint, status=str(response.status_code))
+    return response
+
+# Startup warm-up: "pending" -> "warming_up" -> "ready" or "failed"; read by /ready
+warm_up_state = {'status': 'pending', 'error': None, 'load_timings': {}}
+
+def warm_up():
+    """Preload and validate all analyzer data (names, blocklists, patterns)."""
+    warm_up_state['status'] = 'warming_up'
+    try:
+        timings = get_engine().warm_up()
+    except Exception as e:
+        app.logger.exception("Analyzer warm-up failed")
+        warm_up_state.update(status='failed', error=str(e))
+    else:
+        warm_up_state.update(status='ready', error=None, load_timings=timings)
+
+def start_warm_up():
+    """Run warm_up() in the background so /health answers while data loads."""
+    thread = threading.Thread(target=warm_up, name="analyzer-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+def build_response(final_result):
+    """Turn an engine analysis result into the JSON response body."""
+    results = final_result['components']
+    freq_res = final_result['raw_data']['frequency']
+
+    # Check for breaches: against the breach index when one is built, then
+    # against the common password lists, which also catch leetspeak variants
+    breach = get_engine().breach
     breach_warning = ""
-    if freq_res["frequency_score"] > 0.5:
+    breach_count = breach.lookup(final_result['password']) if breach is not None else None
+    if breach_count:
+        breach_warning = "This password appears in a breached password corpus and may have been compromised."
+    elif freq_res["frequency_score"] > 0.5:
         breach_warning = "This password appears in common password lists and may have been compromised."
 
     response = {
         'overall_score': final_result['final_score'],
         'components': final_result['components'],
-        'strength': 'Strong' if final_result['final_score'] >= 0.8 else 'Moderate' if final_result['final_score'] >= 0.6 else 'Weak',
+        'strength': score_aggregator.strength_label(final_result['final_score']),
         'breach_warning': breach_warning,
-        'suggestions': []
+        'breach_count': breach_count,
+        'suggestions': [],
+        # A skipped analyzer scores its skipped_strength, so list it to tell
+        # a skipped scan apart from a clean one
+        'skipped_analyzers': final_result['skipped'],
+        'degraded': bool(final_result['degraded']),
+        'degraded_analyzers': final_result['degraded']
     }
 
     # Generate suggestions
@@ -57,10 +133,124 @@ def analyze():
         response['suggestions'].append("Avoid common patterns like sequences or repeats")
     if results['frequency'] < 0.8:
         response['suggestions'].append("Avoid common passwords")
-    if results['names'] < 0.8:
+    if results['names'] < 0.8:  # 1.0 when the name scan was skipped
         response['suggestions'].append("Avoid using personal names")
 
-    return jsonify(response)
+    return response
+
+def parse_deadline(data):
+    """
+    Read the optional "deadline_ms" time budget from a request body.
+
+    Returns:
+        Deadline or None. Raises ValueError for a budget that isn't a positive
+        number of milliseconds up to MAX_DEADLINE_MS.
+    """
+    deadline_ms = data.get('deadline_ms')
+    if deadline_ms is None:
+        return None
+    if isinstance(deadline_ms, bool) or not isinstance(deadline_ms, (int, float)) \
+            or not 0 < deadline_ms <= MAX_DEADLINE_MS:
+        raise ValueError(f'deadline_ms must be a number between 0 and {MAX_DEADLINE_MS}')
+    return Deadline.from_ms(deadline_ms)
+
+def analyze_cached(passwords, deadline=None):
+    """
+    Build responses for passwords, reusing cached responses where possible.
+
+    Cache misses are analyzed together in one engine batch. The cache is
+    dropped whenever the engine's data or weights change. Responses computed
+    in degraded mode (to meet a deadline) are not cached.
+    """
+    engine = get_engine()
+    engine.reload_if_stale()
+    version = engine.generation
+
+    BATCH_SIZE.observe(len(passwords))
+    for pw in passwords:
+        PASSWORD_LENGTH.observe(len(pw))
+
+    responses = [result_cache.get(pw, version) for pw in passwords]
+    missing = [i for i, response in enumerate(responses) if response is None]
+    if missing:
+        final_results = engine.analyze_batch([passwords[i] for i in missing], deadline)
+        for i, final_result in zip(missing, final_results):
+            responses[i] = build_response(final_result)
+            if not final_result['degraded']:
+                result_cache.put(passwords[i], responses[i], version)
+    return responses
+
+@app.route('/')
+def index():
+    return render_template('index.html')
+
+@app.route('/analyze', methods=['POST'])
+def analyze():
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        data = {}
+    password = data.get('password', '')
+
+    if not password:
+        return jsonify({'error': 'No password provided'}), 400
+    if not isinstance(password, str):
+        return jsonify({'error': 'The password must be a string'}), 400
+    max_length = app.config['MAX_PASSWORD_LENGTH']
+    if len(password) > max_length:
+        return jsonify({'error': f'Passwords are limited to {max_length} characters'}), 413
+    try:
+        deadline = parse_deadline(data)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    # Run all analyzer modules on the shared, preloaded engine
+    return jsonify(analyze_cached([password], deadline)[0])
+
+@app.route('/analyze/batch', methods=['POST'])
+def analyze_batch():
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        data = {}
+    passwords = data.get('passwords')
+
+    if not isinstance(passwords, list) or not passwords:
+        return jsonify({'error': 'No passwords provided'}), 400
+    max_batch, max_length = app.config['MAX_BATCH_SIZE'], app.config['MAX_PASSWORD_LENGTH']
+    if len(passwords) > max_batch:
+        return jsonify({'error': f'At most {max_batch} passwords per batch'}), 413
+    if not all(isinstance(pw, str) and pw for pw in passwords):
+        return jsonify({'error': 'Every password must be a non-empty string'}), 400
+    if any(len(pw) > max_length for pw in passwords):
+        return jsonify({'error': f'Passwords are limited to {max_length} characters'}), 413
+    try:
+        deadline = parse_deadline(data)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    # Results are returned in the same order as the submitted passwords
+    return jsonify({'results': analyze_cached(passwords, deadline)})
+
+@app.route('/health')
+def health():
+    # Liveness only: the process is up and serving requests
+    return jsonify({'status': 'ok'})
+
+@app.route('/ready')
+def ready():
+    # Readiness: 200 only once warm-up has loaded and validated all data
+    if warm_up_state['status'] == 'ready':
+        return jsonify({'status': 'ready', 'load_timings': warm_up_state['load_timings']})
+    body = {'status': warm_up_state['status']}
+    if warm_up_state['error']:
+        body['error'] = warm_up_state['error']
+    return jsonify(body), 503
+
+@app.route('/metrics')
+def metrics_endpoint():
+    return Response(metrics.REGISTRY.render(), content_type=metrics.CONTENT_TYPE)
+
+# Start loading data as soon as the app is imported (by `python flask_app.py` or a WSGI server)
+warm_up_thread = start_warm_up()
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    app.run(debug=True)
@@ -0,0 +1,230 @@
+"""
+Audit Module
+------------
+Streams newline-delimited password dumps through the analyzer engine as a
+generator pipeline and writes results incrementally, so memory use stays
+bounded by the chunk size regardless of input size.
+
+Every result carries the byte offset just past its input line. After an
+interruption, passing the offset of the last written record as
+start_offset resumes the audit where it stopped; trim_partial_record()
+first drops a record the interruption left half written.
+
+Lines longer than MAX_PASSWORD_LENGTH characters (the API's default limit)
+are never held in memory whole: they are skipped and reported with an
+error record.
+"""
+
+import csv
+import json
+import sys
+import time
+
+from src.analyzer import score_aggregator
+
+CHUNK_SIZE = 1000           # passwords analyzed per engine batch
+PROGRESS_INTERVAL = 5.0     # seconds between progress reports
+MAX_PASSWORD_LENGTH = 1024  # characters; longer lines are skipped
+
+CSV_FIELDS = ["offset", "password", "final_score", "strength", "matched_list",
+              "length", "entropy", "patterns", "frequency", "names", "error"]
+
+
+def read_passwords(stream, start_offset: int = 0, max_length: int = MAX_PASSWORD_LENGTH):
+    """
+    Yield (end_offset, password) for each non-empty line of a binary stream.
+
+    Parameters:
+        stream: Binary file object (file opened with "rb" or sys.stdin.buffer).
+        start_offset (int): Byte offset to resume from.
+        max_length (int): Longest password in characters; longer lines are
+            yielded with password None, and read in pieces rather than whole.
+    """
+    offset = start_offset
+    if start_offset:
+        if stream.seekable():
+            stream.seek(start_offset)
+        else:
+            # Pipes can't seek; discard the already-audited prefix
+            remaining = start_offset
+            while remaining:
+                skipped = stream.read(min(remaining, 1 << 20))
+                if not skipped:
+                    break
+                remaining -= len(skipped)
+
+    # Enough bytes for max_length characters of UTF-8 plus a CRLF
+    limit = 4 * max_length + 2
+    while True:
+        raw = stream.readline(limit)
+        if not raw:
+            break
+        offset += len(raw)
+        if len(raw) == limit and not raw.endswith(b"\n"):
+            # Too long to be analyzed: discard the rest of the line piece by piece
+            while True:
+                rest = stream.readline(1 << 16)
+                offset += len(rest)
+                if not rest or rest.endswith(b"\n"):
+                    break
+            yield offset, None
+            continue
+        password = raw.rstrip(b"\r\n").decode("utf-8", errors="replace")
+        if len(password) > max_length:
+            yield offset, None
+        elif password:
+            yield offset, password
+
+
+def chunked(items, size: int = CHUNK_SIZE):
+    """Group an iterable into lists of at most `size` items."""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def audit_stream(entries, engine, chunk_size: int = CHUNK_SIZE):
+    """
+    Analyze (end_offset, password) pairs in chunks.
+
+    Yields:
+        list: One chunk of (end_offset, result) pairs at a time, in input order;
+        result is None where password is None (a skipped line).
+    """
+    for chunk in chunked(entries, chunk_size):
+        passwords = [password for _, password in chunk if password is not None]
+        results = iter(engine.analyze_batch(passwords) if passwords else ())
+        yield [(offset, None if password is None else next(results)) for offset, password in chunk]
+
+
+def to_record(offset: int, result: dict, redact: bool = False) -> dict:
+    """Flatten an engine result into one output record."""
+    record = {
+        "offset": offset,
+        "password": None if redact else result["password"],
+        "final_score": round(result["final_score"], 4),
+        "strength": score_aggregator.strength_label(result["final_score"]),
+        "matched_list": result["raw_data"]["frequency"]["matched_list"],
+    }
+    for component, score in result["components"].items():
+        record[component] = round(score, 4)
+    return record
+
+
+def skipped_record(offset: int, max_length: int = MAX_PASSWORD_LENGTH) -> dict:
+    """Output record for a line too long to analyze."""
+    return {"offset": offset, "password": None, "error": f"longer than {max_length} characters"}
+
+
+def trim_partial_record(path: str) -> int:
+    """
+    Truncate an output file after its last complete line, dropping a record
+    an interruption left half written. Call before appending on resume.
+
+    Returns:
+        int: Number of bytes removed.
+    """
+    with open(path, "rb+") as f:
+        size = f.seek(0, 2)
+        end = size
+        while end:
+            f.seek(max(end - (1 << 16), 0))
+            block = f.read(end - max(end - (1 << 16), 0))
+            newline = block.rfind(b"\n")
+            if newline >= 0:
+                end = end - len(block) + newline + 1
+                break
+            end -= len(block)
+        f.truncate(end)
+    return size - end
+
+
+class JsonlWriter:
+    def __init__(self, out):
+        self.out = out
+
+    def write(self, record: dict):
+        self.out.write(json.dumps(record) + "\n")
+
+
+class CsvWriter:
+    def __init__(self, out, write_header: bool = True):
+        self.writer = csv.DictWriter(out, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        if write_header:
+            self.writer.writeheader()
+
+    def write(self, record: dict):
+        self.writer.writerow(record)
+
+
+def run_audit(stream, out, engine, fmt: str = "jsonl", start_offset: int = 0,
+              chunk_size: int = CHUNK_SIZE, redact: bool = False,
+              progress=sys.stderr, progress_interval: float = PROGRESS_INTERVAL,
+              max_length: int = MAX_PASSWORD_LENGTH) -> dict:
+    """
+    Audit every password in `stream` and write one record per password to `out`.
+
+    Parameters:
+        stream: Binary input stream of newline-delimited passwords.
+        out: Text output stream for JSONL or CSV records.
+        engine: AnalyzerEngine or AnalyzerPool used for analysis.
+        fmt (str): "jsonl" or "csv".
+        start_offset (int): Byte offset to resume from.
+        chunk_size (int): Passwords analyzed per batch.
+        redact (bool): Omit plaintext passwords from the output.
+        progress: Text stream for progress reports, or None to disable.
+        max_length (int): Longest password analyzed, in characters.
+
+    Returns:
+        dict: {"processed": count, "skipped": too long lines, "offset": resume
+        offset, "seconds": elapsed}. The offset is that of the last record
+        written, also when interrupted partway through a chunk.
+    """
+    if fmt == "jsonl":
+        writer = JsonlWriter(out)
+    elif fmt == "csv":
+        writer = CsvWriter(out, write_header=start_offset == 0)
+    else:
+        raise ValueError(f"Unknown output format: {fmt!r}")
+
+    processed = skipped = 0
+    offset = start_offset
+    start = time.perf_counter()
+    last_report = start
+
+    try:
+        entries = read_passwords(stream, start_offset, max_length)
+        for chunk in audit_stream(entries, engine, chunk_size):
+            for end_offset, result in chunk:
+                if result is None:
+                    writer.write(skipped_record(end_offset, max_length))
+                    skipped += 1
+                else:
+                    writer.write(to_record(end_offset, result, redact))
+                    processed += 1
+                # Advanced per record, so an interruption mid-chunk reports
+                # the offset of the last record actually written
+                offset = end_offset
+            out.flush()
+
+            now = time.perf_counter()
+            if progress is not None and now - last_report >= progress_interval:
+                rate = processed / (now - start)
+                progress.write(f"processed={processed} rate={rate:.0f}/s offset={offset}\n")
+                last_report = now
+    except KeyboardInterrupt:
+        if progress is not None:
+            progress.write(f"Interrupted; resume with --resume-from {offset}\n")
+        raise
+
+    elapsed = time.perf_counter() - start
+    if progress is not None:
+        rate = processed / elapsed if elapsed else 0.0
+        progress.write(f"done processed={processed} rate={rate:.0f}/s offset={offset}\n")
+
+    return {"processed": processed, "skipped": skipped, "offset": offset, "seconds": elapsed}
@@ -0,0 +1,274 @@
+"""
+Breach Index Module
+-------------------
+Offline k-anonymity style breach lookups over SHA-1 hash-prefix ranges.
+
+A breach corpus is stored the way the public Pwned Passwords range API
+serves it: passwords are SHA-1 hashed as their exact UTF-8 bytes (so case
+matters, as it does in the public API) and grouped by the first 5 hex
+digits of the hash, and each range is a block of "SUFFIX:COUNT" lines (the other
+35 hex digits, uppercase, and how often the password was seen). A lookup
+hashes the password, reads the one range its prefix selects and scans it
+for the suffix, so the corpus itself never has to be loaded into memory.
+Recently read ranges are kept in an LRU.
+
+Index directory layout:
+    ranges-<id>.txt  every non-empty range, in prefix order, CRLF-terminated
+                     lines; <id> is derived from the file's contents
+    directory.bin    the prefix directory (integers little-endian):
+        magic        8 bytes   b"PWRANGE2"
+        flags        uint32    bit 0: passwords were lowercased before hashing
+                               (only when built with lowercase=True)
+        count        uint32    number of non-empty prefixes
+        ranges_id    8 bytes   the <id> of the ranges file the offsets point into
+        prefixes     uint32 * count, sorted (the 5 hex digits as an integer)
+        offsets      uint64 * (count + 1), byte offsets of each range
+
+A build never holds the corpus in memory: digests are spilled into one
+temporary bucket file per leading digest byte, and each bucket is sorted
+and counted on its own. A rebuild writes its ranges under a new name, then replaces directory.bin
+in one rename, so a reader always pairs a directory with the ranges file it
+was built for; ranges files no directory names any more are then removed.
+
+Build the index from data/blocklists/*.txt with:
+    python -m src.analyzer.breach_index [output_dir]
+"""
+
+import bisect
+import glob
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from functools import lru_cache
+from itertools import groupby
+
+MAGIC = b"PWRANGE2"
+_HEADER = struct.Struct("<8sII8s")
+FLAG_LOWERCASE = 1
+
+PREFIX_LENGTH = 5  # hex digits, as in the public range API
+DIRECTORY_FILE = "directory.bin"
+OPEN_ATTEMPTS = 3  # directory reads before giving up on a ranges file replaced under us
+BUCKETS = 256      # temporary bucket files a build spills digests into, one per leading byte
+
+DEFAULT_INDEX_DIR = os.path.join(os.path.dirname(__file__), "../../data/breach")
+DEFAULT_SOURCES = os.path.join(os.path.dirname(__file__), "../../data/blocklists/*.txt")
+
+
+def sha1_hex(password: str) -> str:
+    return hashlib.sha1(password.encode("utf-8", errors="surrogatepass")).hexdigest().upper()
+
+
+def ranges_file(ranges_id: bytes) -> str:
+    """Name of the ranges file with this id."""
+    return f"ranges-{ranges_id.hex()}.txt"
+
+
+def _spill_digests(sources, bucket_dir, lowercase: bool) -> list:
+    # Append every line's raw SHA-1 digest to the bucket file of its first byte
+    paths = [os.path.join(bucket_dir, f"{bucket:02x}.bin") for bucket in range(BUCKETS)]
+    buckets = [open(path, "wb") for path in paths]
+    try:
+        for path in sources:
+            with open(path, "rb") as f:
+                for line in f:
+                    entry = line.rstrip(b"\r\n")
+                    if not entry:
+                        continue
+                    if lowercase:
+                        entry = entry.decode("utf-8", errors="surrogateescape").lower().encode(
+                            "utf-8", errors="surrogateescape")
+                    digest = hashlib.sha1(entry).digest()
+                    buckets[digest[0]].write(digest)
+    finally:
+        for bucket in buckets:
+            bucket.close()
+    return paths
+
+
+def build_index(sources, output_dir, lowercase: bool = False) -> int:
+    """
+    Hash plaintext password lists into a range-file breach index.
+
+    Parameters:
+        sources (list): Paths of password lists, one password per line.
+        output_dir (str): Directory to write the ranges file and directory.bin into.
+        lowercase (bool): Lowercase passwords before hashing, so lookups match
+            any capitalization. Off by default: like the public API, the
+            index then holds the hashes of the exact bytes of each line.
+
+    Returns:
+        int: Number of unique passwords written. A password's count is the
+        number of times it appears across the sources.
+    """
+    prefixes = array("I")
+    offsets = array("Q")
+
+    os.makedirs(output_dir, exist_ok=True)
+    ranges_tmp = os.path.join(output_dir, "ranges.tmp")
+    directory_path = os.path.join(output_dir, DIRECTORY_FILE)
+
+    written = 0
+    offset = 0
+    content_hash = hashlib.sha1()
+    with tempfile.TemporaryDirectory(dir=output_dir, prefix=".buckets-") as bucket_dir, \
+            open(ranges_tmp, "wb") as out:
+        current = None
+        # Buckets are in digest order, so sorting each one sorts the corpus
+        for bucket_path in _spill_digests(sources, bucket_dir, lowercase):
+            with open(bucket_path, "rb") as f:
+                data = f.read()
+            os.remove(bucket_path)
+            digests = sorted(data[i:i + 20] for i in range(0, len(data), 20))
+            del data
+            for raw, run in groupby(digests):
+                digest = raw.hex().upper()
+                prefix = int(digest[:PREFIX_LENGTH], 16)
+                if prefix != current:
+                    prefixes.append(prefix)
+                    offsets.append(offset)
+                    current = prefix
+                line = f"{digest[PREFIX_LENGTH:]}:{sum(1 for _ in run)}\r\n".encode("ascii")
+                out.write(line)
+                content_hash.update(line)
+                offset += len(line)
+                written += 1
+    offsets.append(offset)
+    ranges_id = content_hash.digest()[:8]
+    ranges_name = ranges_file(ranges_id)
+    os.replace(ranges_tmp, os.path.join(output_dir, ranges_name))
+
+    if sys.byteorder != "little":
+        prefixes.byteswap()
+        offsets.byteswap()
+    with open(f"{directory_path}.tmp", "wb") as out:
+        out.write(_HEADER.pack(MAGIC, FLAG_LOWERCASE if lowercase else 0, len(prefixes), ranges_id))
+        out.write(prefixes.tobytes())
+        out.write(offsets.tobytes())
+
+    # The directory rename is the one step that switches readers to the new
+    # ranges; the ones they may still have mapped are removed only after it
+    os.replace(f"{directory_path}.tmp", directory_path)
+    for name in os.listdir(output_dir):
+        if name.startswith("ranges-") and name.endswith(".txt") and name != ranges_name:
+            try:
+                os.remove(os.path.join(output_dir, name))
+            except OSError:
+                pass  # still open where open files can't be removed; the next build retries
+    return written
+
+
+class BreachIndex:
+    def __init__(self, index_dir: str = None, cache_size: int = 1024):
+        """
+        Open a breach index built by build_index().
+
+        index_dir: directory holding directory.bin and its ranges file.
+        cache_size: number of recently read ranges kept in memory.
+        """
+        self.index_dir = index_dir or DEFAULT_INDEX_DIR
+
+        # A rebuild may remove the ranges file named by the directory we just
+        # read; the new directory then names the new one
+        for attempt in range(OPEN_ATTEMPTS):
+            try:
+                self._open()
+                break
+            except FileNotFoundError:
+                if attempt == OPEN_ATTEMPTS - 1:
+                    raise
+        self._cached_range = lru_cache(maxsize=cache_size)(self._read_range)
+
+    def _open(self):
+        with open(os.path.join(self.index_dir, DIRECTORY_FILE), "rb") as f:
+            directory = f.read()
+        if len(directory) < _HEADER.size:
+            raise ValueError(f"{self.index_dir} does not hold a breach index")
+        magic, flags, count, ranges_id = _HEADER.unpack_from(directory, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.index_dir} does not hold a breach index in this format; rebuild it")
+        self.lowercase = bool(flags & FLAG_LOWERCASE)
+
+        start = _HEADER.size
+        self._prefixes = array("I", directory[start:start + 4 * count])
+        start += 4 * count
+        self._offsets = array("Q", directory[start:start + 8 * (count + 1)])
+        if sys.byteorder != "little":
+            self._prefixes.byteswap()
+            self._offsets.byteswap()
+
+        with open(os.path.join(self.index_dir, ranges_file(ranges_id)), "rb") as f:
+            # mmap refuses empty files; an index of nothing has no ranges to read
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if count else b""
+        if len(self._mm) != self._offsets[-1]:
+            raise ValueError(f"{self.index_dir}: ranges file does not match its directory")
+
+    def __len__(self) -> int:
+        """Number of non-empty ranges."""
+        return len(self._prefixes)
+
+    def _read_range(self, prefix: int) -> bytes:
+        i = bisect.bisect_left(self._prefixes, prefix)
+        if i == len(self._prefixes) or self._prefixes[i] != prefix:
+            return b""
+        return self._mm[self._offsets[i]:self._offsets[i + 1]]
+
+    def range(self, prefix: str) -> str:
+        """
+        The range for a 5 hex digit SHA-1 prefix, as "SUFFIX:COUNT" lines
+        (the same body the public range API returns; empty if no password
+        in the corpus has that prefix).
+        """
+        if len(prefix) != PREFIX_LENGTH:
+            raise ValueError(f"Hash prefix must be {PREFIX_LENGTH} hex digits")
+        return self._cached_range(int(prefix, 16)).decode("ascii")
+
+    def lookup_hash(self, digest: str) -> int:
+        """How many times the corpus saw the password with this SHA-1 hex digest (0 if never)."""
+        digest = digest.upper()
+        block = self._cached_range(int(digest[:PREFIX_LENGTH], 16))
+        needle = digest[PREFIX_LENGTH:].encode("ascii") + b":"
+        # Every line starts right after a CRLF (or at the start of the range)
+        pos = block.find(b"\n" + needle)
+        if pos >= 0:
+            pos += 1
+        elif block.startswith(needle):
+            pos = 0
+        else:
+            return 0
+        end = block.find(b"\r\n", pos)
+        return int(block[pos + len(needle):end if end >= 0 else len(block)])
+
+    def lookup(self, password: str) -> int:
+        """How many times the corpus saw this password (0 if never)."""
+        if self.lowercase:
+            password = password.lower()
+        return self.lookup_hash(sha1_hex(password))
+
+    def __contains__(self, password: str) -> bool:
+        return self.lookup(password) > 0
+
+    def cache_info(self):
+        """Hit/miss statistics of the hot range LRU."""
+        return self._cached_range.cache_info()
+
+    def close(self):
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+
+
+def open_default():
+    """Open the index in the default location, or return None if it hasn't been built."""
+    if not os.path.exists(os.path.join(DEFAULT_INDEX_DIR, DIRECTORY_FILE)):
+        return None
+    return BreachIndex(DEFAULT_INDEX_DIR)
+
+
+if __name__ == "__main__":
+    output = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_INDEX_DIR
+    written = build_index(sorted(glob.glob(DEFAULT_SOURCES)), output)
+    print(f"Wrote {written} hashed passwords to {output}")
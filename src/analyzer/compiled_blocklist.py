@@ -0,0 +1,179 @@
+"""
+Compiled Blocklist Module
+-------------------------
+Compiles the plain-text password blocklists into one sorted binary file and
+looks passwords up in it through mmap, so large lists (e.g. the full RockYou
+dump) are shared by every worker process through the OS page cache instead
+of being loaded into per-process Python sets.
+
+File layout (all integers little-endian):
+    magic      8 bytes   b"PWBLIST2"
+    count      uint64    number of entries
+    tiers_len  uint32    length of the tier name block
+    tiers      bytes     tier names, newline separated (index 0 = most common list)
+    tier ids   uint8 * count
+    ranks      uint32 * count, popularity rank of each entry (0 = most common)
+    offsets    uint64 * (count + 1), relative to the start of the data block
+    data       UTF-8 entries, sorted bytewise, concatenated
+
+Compile with:
+    python -m src.analyzer.compiled_blocklist [output_path]
+"""
+
+import mmap
+from bisect import bisect_right
+from itertools import accumulate
+import os
+import struct
+import sys
+
+MAGIC = b"PWBLIST2"
+_HEADER = struct.Struct("<8sQI")
+_OFFSET = struct.Struct("<Q")
+_RANK = struct.Struct("<I")
+
+
+def compile_blocklists(sources, output_path):
+    """
+    Compile blocklist text files into a sorted binary blocklist.
+
+    Parameters:
+        sources (list): [(tier_name, path), ...] ordered from most to least common list,
+            each file ordered most common first. An entry present in several lists
+            keeps the first tier and position it appears at.
+        output_path (str): Where to write the compiled file.
+
+    Returns:
+        int: Number of unique entries written.
+    """
+    first_seen = {}  # entry -> (tier id, rank)
+    for tier_id, (_, path) in enumerate(sources):
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            for line in f:
+                entry = line.strip().lower()
+                if entry and entry not in first_seen:
+                    first_seen[entry] = (tier_id, len(first_seen))
+
+    entries = sorted((entry.encode("utf-8"), tier_id, rank) for entry, (tier_id, rank) in first_seen.items())
+    del first_seen
+
+    tier_block = "\n".join(name for name, _ in sources).encode("utf-8")
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "wb") as out:
+        out.write(_HEADER.pack(MAGIC, len(entries), len(tier_block)))
+        out.write(tier_block)
+        out.write(bytes(tier_id for _, tier_id, _ in entries))
+        for _, _, rank in entries:
+            out.write(_RANK.pack(rank))
+
+        offset = 0
+        for entry, _, _ in entries:
+            out.write(_OFFSET.pack(offset))
+            offset += len(entry)
+        out.write(_OFFSET.pack(offset))
+
+        for entry, _, _ in entries:
+            out.write(entry)
+
+    # Atomic replace so running workers never map a half-written file
+    os.replace(tmp_path, output_path)
+    return len(entries)
+
+
+class MappedBlocklist:
+    def __init__(self, path):
+        """
+        Memory-map a compiled blocklist for read-only lookups.
+
+        path: file produced by compile_blocklists().
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.count, tiers_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a compiled blocklist")
+
+        tiers_start = _HEADER.size
+        self.tiers = self._mm[tiers_start:tiers_start + tiers_len].decode("utf-8").split("\n")
+        self._tier_ids_start = tiers_start + tiers_len
+        self._ranks_start = self._tier_ids_start + self.count
+        self._offsets_start = self._ranks_start + _RANK.size * self.count
+        self._data_start = self._offsets_start + _OFFSET.size * (self.count + 1)
+        self._tier_ends = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _bounds(self, index: int):
+        pos = self._offsets_start + index * _OFFSET.size
+        start = _OFFSET.unpack_from(self._mm, pos)[0]
+        end = _OFFSET.unpack_from(self._mm, pos + _OFFSET.size)[0]
+        return self._data_start + start, self._data_start + end
+
+    def _find(self, entry: str):
+        """Binary-search the mapped file for an already normalized entry; returns its index or None."""
+        key = entry.encode("utf-8", errors="surrogatepass")
+        mm = self._mm
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start, end = self._bounds(mid)
+            probe = mm[start:end]
+            if probe < key:
+                lo = mid + 1
+            elif probe > key:
+                hi = mid
+            else:
+                return mid
+        return None
+
+    def lookup(self, entry: str):
+        """
+        Look up an already normalized entry.
+
+        Returns:
+            str or None: Name of the tier the entry belongs to, or None if absent.
+        """
+        index = self._find(entry)
+        return None if index is None else self.tiers[self._mm[self._tier_ids_start + index]]
+
+    def rank(self, entry: str):
+        """Popularity rank of an already normalized entry (0 = most common), or None."""
+        index = self._find(entry)
+        return None if index is None else _RANK.unpack_from(self._mm, self._ranks_start + _RANK.size * index)[0]
+
+    def tier(self, rank: int) -> str:
+        """Name of the list a rank falls in (entries of earlier lists rank first)."""
+        if self._tier_ends is None:
+            # Ranks are assigned list by list, so each tier's entry count bounds its ranks
+            tier_ids = self._mm[self._tier_ids_start:self._ranks_start]
+            self._tier_ends = list(accumulate(tier_ids.count(bytes((i,))) for i in range(len(self.tiers))))
+        return self.tiers[bisect_right(self._tier_ends, rank)]
+
+    def ranked_entries(self, limit: int = None) -> list:
+        """Entries in rank order, the `limit` most common if given."""
+        limit = self.count if limit is None else min(limit, self.count)
+        entries = [None] * limit
+        for index in range(self.count):
+            rank = _RANK.unpack_from(self._mm, self._ranks_start + _RANK.size * index)[0]
+            if rank < limit:
+                start, end = self._bounds(index)
+                entries[rank] = self._mm[start:end].decode("utf-8")
+        return entries
+
+    def __contains__(self, entry: str) -> bool:
+        return self.lookup(entry) is not None
+
+    def close(self):
+        self._mm.close()
+
+
+if __name__ == "__main__":
+    from src.analyzer import frequency_checker
+
+    output = sys.argv[1] if len(sys.argv) > 1 else frequency_checker.COMPILED_FILE
+    written = compile_blocklists(frequency_checker.BLOCKLIST_SOURCES, output)
+    print(f"Wrote {written} entries to {output}")
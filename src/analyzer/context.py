@@ -0,0 +1,53 @@
+"""
+Analysis Context Module
+-----------------------
+An AnalysisContext holds what the analyzers derive from one password (the
+lowercased form, the leetspeak variants and the character histogram). Each
+value is computed the first time an analyzer asks for it and then shared,
+so the pipeline transforms every password at most once.
+
+Analyzer entry points accept either a plain password string or a context;
+as_context() turns the former into the latter.
+"""
+
+from collections import Counter
+from functools import cached_property
+
+from src.utils import normalization
+
+
+class AnalysisContext:
+    def __init__(self, password: str):
+        self.password = password if isinstance(password, str) else ""
+
+    def __len__(self) -> int:
+        return len(self.password)
+
+    def __repr__(self) -> str:
+        return f"AnalysisContext(length={len(self.password)})"  # never echo the password
+
+    @cached_property
+    def lowered(self) -> str:
+        return self.password.lower()
+
+    @cached_property
+    def variants(self) -> tuple:
+        """Leetspeak readings of the password, most likely first (see normalization.leet_variants)."""
+        return normalization.leet_variants(self.lowered)
+
+    @cached_property
+    def literal_variants(self) -> tuple:
+        """Like variants, but also reading each leetspeak character literally."""
+        return normalization.leet_variants(self.lowered, keep_literal=True)
+
+    @cached_property
+    def histogram(self) -> Counter:
+        """Occurrences of each character in the password."""
+        return Counter(self.password)
+
+
+def as_context(password) -> AnalysisContext:
+    """Return password itself if it is already an AnalysisContext, else wrap it in one."""
+    if isinstance(password, AnalysisContext):
+        return password
+    return AnalysisContext(password)
@@ -0,0 +1,392 @@
+"""
+Analyzer Engine Module
+----------------------
+This module keeps the analyzer data (personal names, password blocklists,
+compiled patterns and the offline breach index) loaded for the lifetime of
+the process, so that analyzing
+a password only costs CPU work instead of re-reading the data files.
+
+The Flask app, the Streamlit app and the command line demo all share the
+engine returned by get_engine().
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.analyzer import (
+    breach_index,
+    length_checker,
+    entropy_calculator,
+    pattern_detector,
+    frequency_checker,
+    score_aggregator,
+    vectorized
+)
+from src.analyzer.context import AnalysisContext
+from src.analyzer.name_detector import NameDetector, DEFAULT_NAMES_FILE
+from src.analyzer.registry import AnalyzerRegistry
+from src.utils import metrics
+
+STALE_CHECK_INTERVAL = 5.0  # seconds between data file change checks
+WARM_UP_PASSWORD = "Warm-up probe 1"  # analyzed once at warm-up to exercise every stage
+
+STAGE_SECONDS = metrics.REGISTRY.histogram(
+    "password_analyzer_stage_seconds", "Time spent in one analyzer stage for one batch",
+    ["analyzer", "mode"]
+)
+STAGE_PASSWORDS = metrics.REGISTRY.counter(
+    "password_analyzer_stage_passwords_total", "Passwords processed by each analyzer stage",
+    ["analyzer", "mode"]
+)
+STAGE_SKIPPED = metrics.REGISTRY.counter(
+    "password_analyzer_stage_skipped_total", "Passwords an analyzer was skipped for", ["analyzer"]
+)
+AGGREGATION_SECONDS = metrics.REGISTRY.histogram(
+    "password_analyzer_aggregation_seconds", "Time spent combining analyzer results for one batch"
+)
+LOAD_SECONDS = metrics.REGISTRY.histogram(
+    "password_analyzer_data_load_seconds", "Time spent loading each data set", ["dataset"]
+)
+
+
+class AnalyzerEngine:
+    def __init__(self, name_file_path=None):
+        """
+        Long-lived holder for all loaded analyzer data.
+
+        name_file_path: path to newline-delimited names. If None, defaults to repo data.
+        """
+        self.name_file_path = name_file_path
+        self.name_detector = None
+        self.breach = None      # BreachIndex, or None until one is built
+        self.weights = None     # score_aggregator weights; None = equal weights
+        self.registry = self._build_registry()  # analyzers run by analyze_batch()
+        self.generation = 0     # bumped whenever loaded data or weights change
+        self.load_timings = {}  # {data set: seconds spent loading it}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._fingerprint = None
+        self._last_stale_check = 0.0
+
+    def _timed_load(self, key, loader):
+        start = time.perf_counter()
+        result = loader()
+        self.load_timings[key] = time.perf_counter() - start
+        LOAD_SECONDS.observe(self.load_timings[key], dataset=key)
+        return result
+
+    def load(self):
+        """Load every data set exactly once; safe to call from many threads."""
+        if self._loaded:
+            return self
+
+        with self._lock:
+            if not self._loaded:
+                fingerprint = self._source_fingerprint()
+                # The data sets are independent; load them concurrently
+                with ThreadPoolExecutor(max_workers=3, thread_name_prefix="engine-load") as pool:
+                    names = pool.submit(self._timed_load, "names", lambda: NameDetector(
+                        name_file_path=self.name_file_path, use_snapshot=True
+                    ))
+                    blocklists = pool.submit(self._timed_load, "blocklists", frequency_checker.load_frequency_lists)
+                    patterns = pool.submit(self._timed_load, "patterns", pattern_detector.compile_patterns)
+                    blocklists.result()
+                    patterns.result()
+                    self.name_detector = names.result()
+                self.breach = self._timed_load("breach", breach_index.open_default)
+                self._fingerprint = fingerprint
+                self.generation += 1
+                self._loaded = True
+
+        return self
+
+    def warm_up(self) -> dict:
+        """
+        Load and validate every data set, then run one probe analysis so the
+        first real request doesn't pay for lazy initialization.
+
+        Returns:
+            dict: load_timings after warm-up.
+
+        Raises:
+            RuntimeError: If a data set loaded empty or the probe failed.
+        """
+        self.load()
+
+        problems = []
+        if not self.name_detector.names:
+            problems.append("no personal names loaded")
+        if frequency_checker.blocklist_size() == 0:
+            problems.append("no blocklist entries loaded")
+        if not pattern_detector.compile_patterns().combined:
+            problems.append("no patterns compiled")
+        if problems:
+            raise RuntimeError("Warm-up failed: " + "; ".join(problems))
+
+        result = self.analyze(WARM_UP_PASSWORD)
+        if not 0.0 <= result["final_score"] <= 1.0:
+            raise RuntimeError("Warm-up failed: probe analysis returned an invalid score")
+        return dict(self.load_timings)
+
+    def source_files(self) -> list:
+        """Data files the loaded state depends on."""
+        return [
+            self.name_file_path or DEFAULT_NAMES_FILE,
+            frequency_checker.ROCKYOU_FILE,
+            frequency_checker.TOP_10K_FILE,
+            frequency_checker.COMPILED_FILE,
+            # Replaced in one rename by every rebuild of the breach index
+            os.path.join(breach_index.DEFAULT_INDEX_DIR, breach_index.DIRECTORY_FILE),
+        ]
+
+    def _source_fingerprint(self) -> tuple:
+        fingerprint = []
+        for path in self.source_files():
+            try:
+                stat = os.stat(path)
+                fingerprint.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                fingerprint.append(None)
+        return tuple(fingerprint)
+
+    def reload(self):
+        """Re-read every data set from disk, replacing the loaded copies."""
+        with self._lock:
+            fingerprint = self._source_fingerprint()
+            name_detector = self._timed_load(
+                "names", lambda: NameDetector(name_file_path=self.name_file_path, use_snapshot=True)
+            )
+            self._timed_load("blocklists", frequency_checker.reload_frequency_lists)
+            # The old index is left open for requests still using it; its
+            # mmap is released once they drop it
+            self.breach = self._timed_load("breach", breach_index.open_default)
+            self.name_detector = name_detector
+            self._fingerprint = fingerprint
+            self.generation += 1
+            self._loaded = True
+        return self
+
+    def reload_if_stale(self) -> bool:
+        """
+        Reload if any data file changed since it was loaded.
+
+        The files are checked at most once every STALE_CHECK_INTERVAL seconds.
+
+        Returns:
+            bool: True if the data was reloaded.
+        """
+        now = time.monotonic()
+        if now - self._last_stale_check < STALE_CHECK_INTERVAL:
+            return False
+        self._last_stale_check = now
+
+        if self._source_fingerprint() != self._fingerprint:
+            self.reload()
+            return True
+        return False
+
+    def set_weights(self, weights: dict = None):
+        """Change the component weights used for the final score."""
+        self.weights = dict(weights) if weights else None
+        self.generation += 1
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def analyze(self, password: str, deadline=None) -> dict:
+        """
+        Analyze a single password using all analyzer modules.
+
+        Parameters:
+            password (str): The password to analyze.
+            deadline (Deadline, optional): Time budget; see analyze_batch().
+
+        Returns:
+            dict: {
+                "password": ...,
+                "final_score": 0.0-1.0,
+                "components": {component: strength score 0-1},
+                "raw_data": {component: raw analyzer output, None if skipped},
+                "skipped": [components whose analyzer was skipped],
+                "degraded": [components computed in degraded mode]
+            }
+        """
+        return self.analyze_batch([password], deadline)[0]
+
+    def analyze_batch(self, passwords: list, deadline=None) -> list:
+        """
+        Run the full analysis pipeline over many passwords in one call.
+
+        Analyzers run in registry cost order, each over the passwords its
+        skip rule doesn't exclude. With a deadline, an analyzer that has a
+        degraded mode only runs in full for as many passwords as its
+        observed cost fits into the remaining budget; the rest get the
+        degraded (cheaper, approximate) result.
+
+        Parameters:
+            passwords (list): Passwords to analyze.
+            deadline (Deadline, optional): Time budget for the whole batch.
+
+        Returns:
+            list: One result per password, in input order (see analyze()).
+        """
+        self.load()
+        # Shared per-password derivations (lowercasing, leet variants, histogram)
+        contexts = [AnalysisContext(pw) for pw in passwords]
+        raw = [{} for _ in passwords]        # per password: analyzer name -> raw result
+        skipped = [[] for _ in passwords]
+        degraded = [[] for _ in passwords]
+
+        for spec in self.registry.by_cost():
+            selected = []
+            for i in range(len(passwords)):
+                if spec.should_skip(raw[i]):
+                    skipped[i].append(spec.name)
+                else:
+                    selected.append(i)
+            if not selected:
+                continue
+
+            full = len(selected)
+            if deadline is not None:
+                full = spec.affordable(full, deadline.remaining())
+            if full:
+                start = time.perf_counter()
+                outputs = spec.run([contexts[i] for i in selected[:full]])
+                elapsed = time.perf_counter() - start
+                spec.observe(elapsed, full)
+                STAGE_SECONDS.observe(elapsed, analyzer=spec.name, mode="full")
+                STAGE_PASSWORDS.inc(full, analyzer=spec.name, mode="full")
+                for i, output in zip(selected, outputs):
+                    raw[i][spec.name] = output
+            if full < len(selected):
+                rest = selected[full:]
+                with STAGE_SECONDS.time(analyzer=spec.name, mode="degraded"):
+                    outputs = spec.degraded_run([contexts[i] for i in rest])
+                STAGE_PASSWORDS.inc(len(rest), analyzer=spec.name, mode="degraded")
+                for i, output in zip(rest, outputs):
+                    raw[i][spec.name] = output
+                    degraded[i].append(spec.name)
+            if len(selected) < len(passwords):
+                STAGE_SKIPPED.inc(len(passwords) - len(selected), analyzer=spec.name)
+
+        with AGGREGATION_SECONDS.time():
+            return [self._combine(pw, raw[i], skipped[i], degraded[i]) for i, pw in enumerate(passwords)]
+
+    def _strengths(self, raw) -> dict:
+        """Strength scores (0-1 scale) for the analyzers in raw, in registration order."""
+        return {name: self.registry.get(name).strength(raw[name]) for name in self.registry.names()
+                if name in raw}
+
+    def _combine(self, password, raw, skipped, degraded) -> dict:
+        order = self.registry.names()
+        results = self._strengths(raw)
+        for name in skipped:
+            bound = self.registry.get(name).skipped_strength
+            if bound is not None:
+                results[name] = bound
+        results = {name: results[name] for name in order if name in results}
+
+        final_result = score_aggregator.combine_results(results, self.weights)
+
+        return {
+            "password": password,
+            "final_score": final_result["final_score"],
+            "components": final_result["components"],
+            "raw_data": {name: raw.get(name) for name in order},
+            "skipped": [name for name in order if name in skipped],
+            "degraded": [name for name in order if name in degraded]
+        }
+
+    def _build_registry(self) -> AnalyzerRegistry:
+        registry = AnalyzerRegistry()
+        registry.register("length", _length_scores, strength=float, cost=1)
+        registry.register("entropy", _entropy_scores, strength=float, cost=2)
+        registry.register(
+            "patterns",
+            lambda contexts: [pattern_detector.detect_patterns(ctx) for ctx in contexts],
+            strength=lambda res: 1 - min(res["pattern_score"] / 5, 1),  # Convert penalty to strength
+            cost=5
+        )
+        registry.register(
+            "frequency",
+            frequency_checker.evaluate,
+            strength=lambda res: 1 - res["frequency_score"],  # Convert penalty to strength
+            cost=3
+        )
+        # A top 1k password is reported as compromised whatever names it
+        # contains, so the fuzzy name scan (the most expensive step) is skipped
+        # when no name score could change its verdict; the component is then
+        # scored as if no names were found
+        registry.register(
+            "names",
+            lambda contexts: self.name_detector.evaluate(contexts),
+            strength=lambda res: 1 - min(res["name_score"] / 5, 1),  # Convert penalty to strength
+            cost=10,
+            skip_if=lambda raw: raw.get("frequency", {}).get("matched_list") == "top_1k"
+                                and self._verdict_settled(raw, "names"),
+            skipped_strength=1.0,
+            # Exact-only matching when fuzzy matching would overrun a deadline
+            degraded_run=lambda contexts: self.name_detector.evaluate(contexts, exact=True)
+        )
+        return registry
+
+    def _verdict_settled(self, raw, name) -> bool:
+        """Whether the verdict is the same whatever strength analyzer `name` returns."""
+        if any(other not in raw for other in self.registry.names() if other != name):
+            return False
+        results = self._strengths(raw)
+        low = score_aggregator.aggregate_scores({**results, name: 0.0}, self.weights)
+        high = score_aggregator.aggregate_scores({**results, name: 1.0}, self.weights)
+        return score_aggregator.strength_label(low) == score_aggregator.strength_label(high)
+
+
+def _length_scores(contexts: list) -> list:
+    if vectorized.HAS_NUMPY and len(contexts) >= vectorized.MIN_BATCH_SIZE:
+        return vectorized.score_lengths([ctx.password for ctx in contexts])
+    return [length_checker.check_length(ctx) for ctx in contexts]
+
+
+def _entropy_scores(contexts: list) -> list:
+    if vectorized.HAS_NUMPY and len(contexts) >= vectorized.MIN_BATCH_SIZE:
+        return vectorized.score_entropies([ctx.password for ctx in contexts])
+    return [entropy_calculator.check_entropy(ctx) for ctx in contexts]
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> AnalyzerEngine:
+    """Return the process-wide engine, creating and loading it on first use."""
+    global _engine
+
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = AnalyzerEngine()
+    return _engine.load()
+
+
+def analyze_batch(passwords: list, workers: int = 1) -> list:
+    """
+    Analyze many passwords, serially or across a process pool.
+
+    Parameters:
+        passwords (list): Passwords to analyze.
+        workers (int): 1 runs in this process on the shared engine; N > 1 uses
+            N worker processes; None uses one worker per CPU. Worker processes
+            are started once and reused by later calls (see parallel.shared_pool).
+
+    Returns:
+        list: One result per password, in input order.
+    """
+    if workers == 1:
+        return get_engine().analyze_batch(passwords)
+
+    from src.analyzer.parallel import shared_pool
+
+    return shared_pool(workers).analyze_batch(passwords)
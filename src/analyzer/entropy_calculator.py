@@ -7,7 +7,8 @@ Higher entropy indicates a more unpredictable password.
 """
 
 import math
-from collections import Counter
+
+from src.analyzer.context import as_context
 
 # Entropy thresholds
 MIN_ENTROPY = 20      # less than = weak
@@ -18,19 +19,19 @@ def calculate_entropy(password: str) -> float:
     Calculate Shannon entropy of a password.
 
     Parameters:
-        password (str): The password to evaluate.
+        password (str or AnalysisContext): The password to evaluate.
 
     Returns:
         float: Shannon entropy of the password.
     """
-    if not password:
+    ctx = as_context(password)
+    if not ctx.password:
         return 0.0
 
-    length = len(password)
-    counts = Counter(password)
+    length = len(ctx.password)
     entropy = 0.0
 
-    for count in counts.values():
+    for count in ctx.histogram.values():
         p = count / length
         entropy -= p * math.log2(p)
 
@@ -58,7 +59,7 @@ def check_entropy(password: str) -> float:
     Compute normalized entropy score for a single password.
     
     Parameters:
-        password (str): Password to evaluate.
+        password (str or AnalysisContext): Password to evaluate.
     
     Returns:
         float: Normalized entropy score (0-1)
@@ -79,5 +80,6 @@ def evaluate(passwords: list) -> dict:
     """
     scores = {}
     for pwd in passwords:
-        scores[pwd] = check_entropy(pwd)
+        ctx = as_context(pwd)
+        scores[ctx.password] = check_entropy(ctx)
     return scores
\ No newline at end of file
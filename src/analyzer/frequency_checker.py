@@ -1,50 +1,253 @@
 import os
-from src.utils import normalization
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.analyzer import compiled_blocklist as compiled
+from src.analyzer.compiled_blocklist import MappedBlocklist
+from src.analyzer.context import as_context
+from src.analyzer import near_miss_index as near_misses
+from src.analyzer.near_miss_index import NearMissIndex
+from src.analyzer.rank_index import RankIndex
+from src.analyzer.substring_blocklist import SubstringBlocklist
+from src.analyzer import substring_blocklist as substrings
+from src.utils import snapshot
 
 ROCKYOU_FILE = os.path.join(os.path.dirname(__file__), "../../data/blocklists/rockyou_sample.txt")
 TOP_10K_FILE = os.path.join(os.path.dirname(__file__), "../../data/blocklists/top_10k_passwords.txt")
 
-rockyou_set = set()
-top1k_set = set()
+# Compiled artifact built by `python -m src.analyzer.compiled_blocklist`
+COMPILED_FILE = os.path.join(os.path.dirname(__file__), "../../data/blocklists/blocklists.bin")
+
+# Tier name and source file, from most to least common list
+BLOCKLIST_SOURCES = [
+    ("top_1k", TOP_10K_FILE),
+    ("rockyou", ROCKYOU_FILE),
+]
+
+# Scores of matched passwords fall linearly with their popularity percentile,
+# from MAX_SCORE for the most common entry to MIN_SCORE for the least common
+MAX_SCORE = 1.0
+MIN_SCORE = 0.5
+
+# A password that only embeds a common password is penalized by this share of
+# the embedded entry's score, scaled by how much of the password it covers
+EMBEDDED_WEIGHT = 0.5
+# ...and a password a few edits away from one by this share, per edit distance
+NEAR_MISS_WEIGHTS = {1: 0.5, 2: 0.3}
+
+
+class _BlocklistState:
+    """
+    One consistent set of loaded lists. Loads and reloads build a complete
+    new state and publish it with a single assignment, so a lookup that
+    reads the state once never pairs one list's ranks with another's.
+    """
+    __slots__ = ("rank_index", "compiled_blocklist", "substring_blocklist", "near_miss_index")
+
+    def __init__(self, rank_index, compiled_blocklist, substring_blocklist, near_miss_index):
+        self.rank_index = rank_index
+        self.compiled_blocklist = compiled_blocklist
+        self.substring_blocklist = substring_blocklist
+        self.near_miss_index = near_miss_index
+
+    @property
+    def index(self):
+        """The index exact lookups and ranks come from."""
+        return self.compiled_blocklist if self.compiled_blocklist is not None else self.rank_index
+
+
+_state = None  # the loaded _BlocklistState, None until load_frequency_lists()
+_load_lock = threading.Lock()
+
+def _unload():
+    """Drop the loaded lists so the next call loads them again; returns the old state for _restore()."""
+    global _state
+
+    state, _state = _state, None
+    return state
+
+def _restore(state):
+    global _state
+
+    _state = state
+
+def compiled_blocklist_is_current(path: str = None) -> bool:
+    """True if a compiled blocklist in the current format exists and is newer than every source list."""
+    path = path or COMPILED_FILE
+    if not os.path.exists(path):
+        return False
+    with open(path, "rb") as f:
+        if f.read(len(compiled.MAGIC)) != compiled.MAGIC:
+            return False  # written by an older version; recompile
+    compiled_mtime = os.path.getmtime(path)
+    return all(os.path.getmtime(src) <= compiled_mtime for _, src in BLOCKLIST_SOURCES)
+
+def _read_list(path) -> list:
+    """Normalized entries of a list file, in file (popularity) order."""
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return [line.strip().lower() for line in f if line.strip()]
+
+def _build_rank_index() -> RankIndex:
+    # The lists are independent, so read them concurrently
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="blocklist-load") as pool:
+        entries = [pool.submit(_read_list, path) for _, path in BLOCKLIST_SOURCES]
+        return RankIndex([(tier, future.result()) for (tier, _), future in zip(BLOCKLIST_SOURCES, entries)])
+
+def _load_rank_index() -> RankIndex:
+    return snapshot.load_or_build("blocklist_ranks", [path for _, path in BLOCKLIST_SOURCES], _build_rank_index)
+
+def _load_substring_blocklist(index) -> SubstringBlocklist:
+    """Automaton over the most common entries of an index (RankIndex or MappedBlocklist)."""
+    return snapshot.load_or_build(
+        "blocklist_substrings", [path for _, path in BLOCKLIST_SOURCES],
+        lambda: SubstringBlocklist(index.ranked_entries(substrings.MAX_ENTRIES)),
+        params=(substrings.MIN_LENGTH, substrings.MAX_ENTRIES),
+    )
+
+def _load_near_miss_index(index) -> NearMissIndex:
+    """Symmetric-deletion index over the most common entries of an index."""
+    return snapshot.load_or_build(
+        "blocklist_near_misses", [path for _, path in BLOCKLIST_SOURCES],
+        lambda: NearMissIndex(index.ranked_entries(near_misses.MAX_ENTRIES)),
+        params=(near_misses.MAX_DISTANCE, near_misses.MIN_LENGTH, near_misses.PREFIX_LENGTH,
+                near_misses.MAX_ENTRIES),
+    )
+
+def _build_state() -> _BlocklistState:
+    # Uses the memory-mapped compiled blocklist when it is up to date,
+    # otherwise reads the text lists into an in-memory rank index (from a
+    # snapshot when the lists haven't changed since it was taken)
+    if compiled_blocklist_is_current():
+        rank_index, compiled_blocklist = None, MappedBlocklist(COMPILED_FILE)
+    else:
+        rank_index, compiled_blocklist = _load_rank_index(), None
+    index = compiled_blocklist if compiled_blocklist is not None else rank_index
+    return _BlocklistState(rank_index, compiled_blocklist,
+                           _load_substring_blocklist(index), _load_near_miss_index(index))
 
 def load_frequency_lists():
-    """Load password frequency lists into memory."""
-    global rockyou_set, top1k_set
+    """
+    Load password frequency lists once; safe to call from many threads.
+
+    Callers arriving while a load is in progress wait for it instead of
+    starting another.
+    """
+    global _state
 
-    if not rockyou_set:
-        with open(ROCKYOU_FILE, "r", encoding="utf-8", errors="ignore") as f:
-            rockyou_set = set(line.strip().lower() for line in f if line.strip())
+    if _state is not None:
+        return
 
-    if not top1k_set:
-        with open(TOP_10K_FILE, "r", encoding="utf-8", errors="ignore") as f:
-            top1k_set = set(line.strip().lower() for line in f if line.strip())
+    with _load_lock:
+        if _state is None:
+            _state = _build_state()
 
-def check_frequency(password: str) -> dict:
+def reload_frequency_lists():
     """
-    Check if the password exists in common password lists.
-    Returns a dictionary with score and which list matched.
+    Re-read the frequency lists from disk.
+
+    The new lists are built in full before they replace the old ones in a
+    single assignment, so concurrent lookups see either the old lists or the
+    new ones, never empty lists or a mix of the two.
     """
+    global _state
+
+    with _load_lock:
+        # A replaced mapping is left to the garbage collector rather than closed,
+        # since a lookup on another thread may still be using it.
+        _state = _build_state()
+
+def _current_state() -> _BlocklistState:
     load_frequency_lists()
-    normalized_pw = normalization.normalize(password)
+    return _state
 
-    if normalized_pw in top1k_set:
-        return {
-            "password": password,
-            "frequency_score": 1.0,
-            "matched_list": "top_1k"
-        }
-    elif normalized_pw in rockyou_set:
-        return {
-            "password": password,
-            "frequency_score": 0.8,
-            "matched_list": "rockyou"
-        }
-    else:
+def blocklist_size() -> int:
+    """Number of loaded blocklist entries (0 if nothing is loaded)."""
+    state = _state
+    return len(state.index) if state is not None else 0
+
+def frequency_score(rank: int, total: int) -> float:
+    """Penalty for a password at popularity `rank` among `total` blocklist entries."""
+    percentile = rank / total
+    return round(MAX_SCORE - (MAX_SCORE - MIN_SCORE) * percentile, 4)
+
+def check_frequency(password) -> dict:
+    """
+    Check if the password (a string or AnalysisContext) exists in common password lists.
+
+    Returns a dictionary with the matched list, the password's popularity
+    rank and percentile among all blocklist entries (0 = most common), and
+    a frequency score between MIN_SCORE and MAX_SCORE that grows with its
+    popularity.
+
+    A password in no list is checked for near misses instead:
+    - "embedded": the longest and the most common entry inside it (see
+      SubstringBlocklist.scan), scored EMBEDDED_WEIGHT times the entry's
+      score, scaled by the share of the password it covers;
+    - "near_miss": the closest entry within edit distance 1-2 (see
+      NearMissIndex.lookup), scored NEAR_MISS_WEIGHTS[distance] times the
+      entry's score.
+    Its frequency score is the higher of the two (0.0 if neither is found).
+    """
+    state = _current_state()  # read once: lists from one load only
+    ctx = as_context(password)
+    password = ctx.password
+    index = state.index
+
+    # Test every plausible reading (e.g. "password1" literally and as "passwordi");
+    # the most popular match wins
+    best = None
+    for variant in ctx.literal_variants:
+        rank = index.rank(variant)
+        if rank is not None and (best is None or rank < best):
+            best = rank
+            if best == 0:
+                break
+
+    if best is None:
+        embedded = _scan_embedded(state, ctx)
+        near_miss = _find_near_miss(state, ctx)
+        scores = [0.0]
+        if embedded is not None:
+            scores.extend(EMBEDDED_WEIGHT * match["coverage"] * frequency_score(match["rank"], len(index))
+                          for match in embedded.values())
+        if near_miss is not None:
+            scores.append(NEAR_MISS_WEIGHTS[near_miss["distance"]]
+                          * frequency_score(near_miss["rank"], len(index)))
         return {
             "password": password,
-            "frequency_score": 0.0,
-            "matched_list": None
+            "frequency_score": round(max(scores), 4),
+            "matched_list": None,
+            "rank": None,
+            "percentile": None,
+            "embedded": embedded,
+            "near_miss": near_miss
         }
+    return {
+        "password": password,
+        "frequency_score": frequency_score(best, len(index)),
+        "matched_list": index.tier(best),
+        "rank": best,
+        "percentile": round(best / len(index), 4),
+        "embedded": None,
+        "near_miss": None
+    }
+
+def _readings(ctx) -> tuple:
+    # The literal lowercase reading catches "Password2024!", the leetspeak
+    # decoding catches "xxdr@g0nxx"
+    return tuple(dict.fromkeys((ctx.lowered, ctx.literal_variants[0])))
+
+def _scan_embedded(state, ctx):
+    if state.substring_blocklist is None:
+        return None
+    return state.substring_blocklist.scan(_readings(ctx))
+
+def _find_near_miss(state, ctx):
+    """Closest near miss over the password's readings: smallest distance, then most common."""
+    if state.near_miss_index is None:
+        return None
+    matches = [match for match in map(state.near_miss_index.lookup, _readings(ctx)) if match is not None]
+    return min(matches, key=lambda match: (match["distance"], match["rank"]), default=None)
 
 def evaluate(passwords: list) -> list:
     """
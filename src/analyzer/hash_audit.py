@@ -0,0 +1,403 @@
+"""
+Hash Audit Module
+-----------------
+Audits password hash dumps (SHA-1 or NTLM) against the blocklists when the
+plaintext passwords aren't available.
+
+Every blocklist entry, plus the case and leetspeak spellings produced by
+normalization.spelling_variants(), is hashed once into a sorted
+fixed-width index file per algorithm. A fan-out table of where each
+leading-bits bucket starts narrows every lookup to a binary search over a
+handful of records. A dump is streamed in chunks whose hashes are looked
+up in sorted order, so each chunk walks the memory-mapped index front to
+back once, and memory stays bounded by the chunk size whatever the dump
+size. Building an index is bounded the same way: hashes are sorted in runs
+of RUN_RECORDS, spilled to temporary files and merged, keeping the best
+tier of each hash as duplicates meet in the merge.
+
+Index file layout (all integers little-endian):
+    magic        8 bytes   b"PWHASH01"
+    digest_size  uint32    bytes per hash (20 for SHA-1, 16 for NTLM)
+    count        uint64    number of records
+    fanout_bits  uint32    leading digest bits the fan-out table is keyed by
+    tiers_len    uint32    length of the tier name block
+    tiers        bytes     tier names, newline separated (index 0 = most common list)
+    fanout       uint64 * (2 ** fanout_bits + 1), index of the first record in each bucket
+    records      count * (digest_size + 1), sorted by digest:
+                 digest, then a tier byte (tier index; high bit set for a spelling variant)
+
+Dump lines may be a bare hex hash, "account:hash", or pwdump format
+("account:rid:lmhash:nthash:::"). The algorithm is inferred from the hash
+length (40 hex digits: SHA-1, 32: NTLM).
+
+Build the indexes with:
+    python -m src.analyzer.hash_audit [output_dir]
+"""
+
+import bisect
+import hashlib
+import heapq
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+from array import array
+
+from src.analyzer import frequency_checker
+from src.analyzer.audit import JsonlWriter
+from src.utils.normalization import spelling_variants
+from src.utils.ntlm import ntlm_hash
+
+MAGIC = b"PWHASH01"
+_HEADER = struct.Struct("<8sIQII")
+VARIANT_FLAG = 0x80
+
+# Fan-out buckets hold about this many records; bits are capped to keep the table small
+RECORDS_PER_BUCKET = 8
+MAX_FANOUT_BITS = 20
+
+RUN_RECORDS = 1 << 19  # hashes sorted in memory per run while building an index
+
+CHUNK_SIZE = 100000  # dump lines looked up per sorted batch
+
+ALGORITHMS = {
+    "sha1": lambda password: hashlib.sha1(password.encode("utf-8", errors="surrogatepass")).digest(),
+    "ntlm": ntlm_hash,
+}
+HEX_LENGTHS = {40: "sha1", 32: "ntlm"}
+
+DEFAULT_INDEX_DIR = os.path.dirname(frequency_checker.COMPILED_FILE)
+
+
+def index_path(algorithm: str, index_dir: str = None) -> str:
+    return os.path.join(index_dir or DEFAULT_INDEX_DIR, f"hashes_{algorithm}.bin")
+
+
+def build_hash_index(sources, algorithm: str, output_path: str, max_variants: int = None) -> int:
+    """
+    Hash blocklist entries and their spelling variants into a sorted index.
+
+    Parameters:
+        sources (list): [(tier_name, path), ...] ordered from most to least common list.
+        algorithm (str): "sha1" or "ntlm".
+        output_path (str): Where to write the index.
+        max_variants (int): Spellings hashed per entry (default: spelling_variants' cap).
+
+    Returns:
+        int: Number of unique hashes written. A hash reachable from several
+        entries keeps the most common tier, preferring exact entries.
+    """
+    hash_password = ALGORITHMS[algorithm]
+    kwargs = {} if max_variants is None else {"max_variants": max_variants}
+    digest_size = len(hash_password(""))
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(output_dir, exist_ok=True)
+
+    with tempfile.TemporaryDirectory(dir=output_dir, prefix=".hash-runs-") as run_dir:
+        runs = []
+        records = []
+        for tier_id, (_, path) in enumerate(sources):
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                for line in f:
+                    entry = line.strip().lower()
+                    if not entry:
+                        continue
+                    for i, spelling in enumerate(spelling_variants(entry, **kwargs)):
+                        tier = tier_id | (VARIANT_FLAG if i else 0)
+                        # Sorted by digest, then tier index, then the variant flag:
+                        # the best record for a digest comes first
+                        records.append(hash_password(spelling) + bytes((tier_id, tier)))
+                    if len(records) >= RUN_RECORDS:
+                        runs.append(_write_run(records, run_dir, len(runs)))
+        if records:
+            runs.append(_write_run(records, run_dir, len(runs)))
+
+        # Merge the runs into the final records, counting each leading-bits
+        # bucket at the finest fan-out so the table can be sized afterwards
+        histogram = array("Q", [0] * (1 << MAX_FANOUT_BITS))
+        count = 0
+        records_path = os.path.join(run_dir, "records.bin")
+        with open(records_path, "wb") as out:
+            previous = None
+            for record in heapq.merge(*(_read_run(run, digest_size + 2) for run in runs)):
+                digest = record[:digest_size]
+                if digest == previous:
+                    continue
+                previous = digest
+                out.write(digest)
+                out.write(record[-1:])
+                histogram[_bucket(digest, MAX_FANOUT_BITS)] += 1
+                count += 1
+
+        fanout_bits = min(max((count // RECORDS_PER_BUCKET).bit_length() - 1, 0), MAX_FANOUT_BITS)
+        fanout = array("Q", [0] * ((1 << fanout_bits) + 1))
+        shift = MAX_FANOUT_BITS - fanout_bits
+        for bucket, records_in_bucket in enumerate(histogram):
+            if records_in_bucket:
+                fanout[(bucket >> shift) + 1] += records_in_bucket
+        for i in range(1, len(fanout)):
+            fanout[i] += fanout[i - 1]
+        if sys.byteorder != "little":
+            fanout.byteswap()
+
+        tier_block = "\n".join(name for name, _ in sources).encode("utf-8")
+        tmp_path = f"{output_path}.tmp"
+        with open(tmp_path, "wb") as out, open(records_path, "rb") as merged:
+            out.write(_HEADER.pack(MAGIC, digest_size, count, fanout_bits, len(tier_block)))
+            out.write(tier_block)
+            out.write(fanout.tobytes())
+            shutil.copyfileobj(merged, out, 1 << 20)
+
+    os.replace(tmp_path, output_path)
+    return count
+
+
+def _write_run(records: list, run_dir: str, number: int) -> str:
+    """Sort records into a run file and empty the list."""
+    records.sort()
+    path = os.path.join(run_dir, f"run-{number}.bin")
+    with open(path, "wb") as f:
+        f.write(b"".join(records))
+    records.clear()
+    return path
+
+
+def _read_run(path: str, width: int):
+    """Yield the fixed-width records of a run file, reading it in blocks."""
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(width * 4096), b""):
+            for i in range(0, len(block), width):
+                yield block[i:i + width]
+
+
+def _bucket(digest: bytes, bits: int) -> int:
+    return int.from_bytes(digest[:3], "big") >> (24 - bits)
+
+
+class _Digests:
+    """Read-only sequence view of the digests in a mapped index, for bisect."""
+
+    def __init__(self, mm, start: int, count: int, digest_size: int):
+        self._mm = mm
+        self._start = start
+        self._count = count
+        self._digest_size = digest_size
+        self._stride = digest_size + 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> bytes:
+        pos = self._start + i * self._stride
+        return self._mm[pos:pos + self._digest_size]
+
+
+class HashIndex:
+    def __init__(self, path):
+        """
+        Memory-map an index built by build_hash_index() for lookups.
+
+        path: index file to open.
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.digest_size, self.count, self.fanout_bits, tiers_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a hash index")
+
+        tiers_start = _HEADER.size
+        self.tiers = self._mm[tiers_start:tiers_start + tiers_len].decode("utf-8").split("\n")
+        fanout_start = tiers_start + tiers_len
+        fanout_end = fanout_start + 8 * ((1 << self.fanout_bits) + 1)
+        self._fanout = array("Q", self._mm[fanout_start:fanout_end])
+        if sys.byteorder != "little":
+            self._fanout.byteswap()
+        self._records_start = fanout_end
+        self._digests = _Digests(self._mm, self._records_start, self.count, self.digest_size)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _match(self, i: int) -> dict:
+        tier = self._mm[self._records_start + i * (self.digest_size + 1) + self.digest_size]
+        return {"matched_list": self.tiers[tier & 0x7F], "variant": bool(tier & VARIANT_FLAG)}
+
+    def find(self, digest: bytes, lo: int = 0):
+        """
+        Binary-search for a digest at or after record `lo`.
+
+        Returns:
+            tuple: (insertion position, match dict or None). Passing the
+            position back as `lo` for the next, larger digest resumes the
+            search there.
+        """
+        bucket = _bucket(digest, self.fanout_bits)
+        lo = max(lo, self._fanout[bucket])
+        hi = max(lo, self._fanout[bucket + 1])
+        i = bisect.bisect_left(self._digests, digest, lo, hi)
+        if i < self.count and self._digests[i] == digest:
+            return i, self._match(i)
+        return i, None
+
+    def lookup(self, digest: bytes):
+        """Return {"matched_list", "variant"} for a digest, or None if absent."""
+        return self.find(digest)[1]
+
+    def join(self, digests: list) -> list:
+        """
+        Look up many digests in one ordered pass over the index.
+
+        Returns:
+            list: One match dict or None per digest, in input order.
+        """
+        results = [None] * len(digests)
+        lo = 0
+        for i in sorted(range(len(digests)), key=digests.__getitem__):
+            lo, results[i] = self.find(digests[i], lo)
+        return results
+
+    def close(self):
+        self._mm.close()
+
+
+def parse_hash_line(line: str):
+    """
+    Split one dump line into (account, algorithm, digest bytes).
+
+    Returns None for blank lines and lines without a recognizable hash.
+    """
+    line = line.strip()
+    if not line:
+        return None
+    fields = line.split(":")
+    if len(fields) >= 4 and len(fields[3]) == 32:
+        account, hex_hash = fields[0], fields[3]  # pwdump: account:rid:lm:nt:::
+    elif len(fields) >= 2:
+        account, hex_hash = ":".join(fields[:-1]), fields[-1]
+    else:
+        account, hex_hash = None, fields[0]
+
+    algorithm = HEX_LENGTHS.get(len(hex_hash))
+    if algorithm is None:
+        return None
+    try:
+        return account, algorithm, bytes.fromhex(hex_hash)
+    except ValueError:
+        return None
+
+
+def index_is_current(algorithm: str, index_dir: str = None) -> bool:
+    """True if the algorithm's index exists and is newer than every blocklist."""
+    path = index_path(algorithm, index_dir)
+    if not os.path.exists(path):
+        return False
+    index_mtime = os.path.getmtime(path)
+    return all(os.path.getmtime(src) <= index_mtime for _, src in frequency_checker.BLOCKLIST_SOURCES)
+
+
+def open_indexes(index_dir: str = None, build_missing: bool = True) -> dict:
+    """
+    Open the SHA-1 and NTLM indexes, (re)building any that are missing or stale.
+
+    Returns:
+        dict: {algorithm: HashIndex}
+    """
+    indexes = {}
+    for algorithm in ALGORITHMS:
+        path = index_path(algorithm, index_dir)
+        if build_missing and not index_is_current(algorithm, index_dir):
+            build_hash_index(frequency_checker.BLOCKLIST_SOURCES, algorithm, path)
+        indexes[algorithm] = HashIndex(path)
+    return indexes
+
+
+def audit_hashes(lines, indexes: dict, chunk_size: int = CHUNK_SIZE):
+    """
+    Join dump lines against the hash indexes.
+
+    Parameters:
+        lines: Iterable of dump lines (text).
+        indexes (dict): {algorithm: HashIndex}, e.g. from open_indexes().
+        chunk_size (int): Lines sorted and looked up together.
+
+    Yields:
+        dict: One record per blocklisted hash, in input order:
+            {"line", "account", "algorithm", "matched_list", "variant"}
+    """
+    chunk = []
+    for line_no, line in enumerate(lines, start=1):
+        parsed = parse_hash_line(line)
+        if parsed is not None and parsed[1] in indexes:
+            chunk.append((line_no,) + parsed)
+        if len(chunk) >= chunk_size:
+            yield from _join_chunk(chunk, indexes)
+            chunk = []
+    if chunk:
+        yield from _join_chunk(chunk, indexes)
+
+
+def _join_chunk(chunk: list, indexes: dict):
+    matches = {}
+    for algorithm, index in indexes.items():
+        entries = [entry for entry in chunk if entry[2] == algorithm]
+        if not entries:
+            continue
+        for entry, match in zip(entries, index.join([entry[3] for entry in entries])):
+            if match is not None:
+                matches[entry[0]] = {"line": entry[0], "account": entry[1], "algorithm": algorithm, **match}
+    for line_no in sorted(matches):
+        yield matches[line_no]
+
+
+def run_hash_audit(stream, out, indexes: dict, chunk_size: int = CHUNK_SIZE, progress=sys.stderr) -> dict:
+    """
+    Audit a text stream of hashes and write one JSONL record per blocklisted hash to `out`.
+
+    Returns:
+        dict: {"processed": lines read, "matched": count, "by_list": {tier: count}, "seconds": elapsed}
+    """
+    writer = JsonlWriter(out)
+    counter = _LineCounter(stream)
+    by_list = {}
+    matched = 0
+    start = time.perf_counter()
+
+    for record in audit_hashes(counter, indexes, chunk_size):
+        writer.write(record)
+        matched += 1
+        by_list[record["matched_list"]] = by_list.get(record["matched_list"], 0) + 1
+    out.flush()
+
+    elapsed = time.perf_counter() - start
+    if progress is not None:
+        rate = counter.count / elapsed if elapsed else 0.0
+        progress.write(f"done processed={counter.count} matched={matched} rate={rate:.0f}/s\n")
+    return {"processed": counter.count, "matched": matched, "by_list": by_list, "seconds": elapsed}
+
+
+class _LineCounter:
+    """Iterates a stream's lines, counting them."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.count = 0
+
+    def __iter__(self):
+        for line in self.stream:
+            self.count += 1
+            yield line
+
+
+if __name__ == "__main__":
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_INDEX_DIR
+    for name in ALGORITHMS:
+        start = time.perf_counter()
+        written = build_hash_index(frequency_checker.BLOCKLIST_SOURCES, name, index_path(name, output_dir))
+        print(f"Wrote {written} {name} hashes to {index_path(name, output_dir)} "
+              f"in {time.perf_counter() - start:.1f}s")
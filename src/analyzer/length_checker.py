@@ -14,7 +14,7 @@ def check_length(password: str) -> float:
     Check password length and return a normalized score.
     
     Parameters:
-        password (str): The password to evaluate.
+        password (str or AnalysisContext): The password to evaluate.
     
     Returns:
         float: Score between 0 (very weak) and 1 (strong).
@@ -1,6 +1,13 @@
+import math
 import os
+from collections import Counter
+from functools import partial
 from pathlib import Path
 
+from src.analyzer.context import as_context
+from src.utils import snapshot
+from src.utils.aho_corasick import AhoCorasick
+
 try:
     # RapidFuzz gives us fast, fuzzy substring matches (e.g., "al3x" ~ "alex")
     from rapidfuzz import fuzz
@@ -9,12 +16,82 @@ except Exception:  # pragma: no cover - optional dependency
     HAS_RAPIDFUZZ = False
 
 
+# Bundled name list, resolved relative to this module
+DEFAULT_NAMES_FILE = Path(__file__).resolve().parents[2] / "data" / "common-names.txt"
+
+
+def _bigrams(text: str) -> list[str]:
+    return [text[i:i + 2] for i in range(len(text) - 1)]
+
+
+class NameIndex:
+    def __init__(self, names, fuzzy_threshold: int = 90):
+        """
+        Bigram postings over names, used to prefilter fuzzy match candidates.
+
+        A name can only reach partial_ratio >= fuzzy_threshold against a password
+        if they share enough bigrams (q-gram lemma), so candidates() never drops
+        a name that the full RapidFuzz scan would have matched.
+        """
+        self.fuzzy_threshold = fuzzy_threshold
+        self.names = sorted(names)
+        self.by_length: dict[int, list[int]] = {}
+        self.postings: dict[str, tuple[list[int], list[int]]] = {}  # bigram -> (name ids, counts)
+
+        for name_id, name in enumerate(self.names):
+            self.by_length.setdefault(len(name), []).append(name_id)
+            for gram, count in Counter(_bigrams(name)).items():
+                ids, counts = self.postings.setdefault(gram, ([], []))
+                ids.append(name_id)
+                counts.append(count)
+
+    def _required_shared(self, short_length: int) -> int:
+        # partial_ratio compares the shorter string against windows no longer than it,
+        # so the indel distance of any match is at most (100 - threshold)% of 2 * short_length.
+        # Each edit destroys at most two bigrams.
+        max_distance = math.floor((100 - self.fuzzy_threshold) * 2 * short_length / 100 + 1e-9)
+        return short_length - 1 - 2 * max_distance
+
+    def candidates(self, password: str) -> list[str]:
+        """Return the names that could pass the fuzzy threshold against a normalized password."""
+        n = len(password)
+        required = {length: self._required_shared(min(length, n)) for length in self.by_length}
+
+        # Names too short to be filtered by bigrams are always candidates
+        selected = set()
+        for length, ids in self.by_length.items():
+            if required[length] <= 0:
+                selected.update(ids)
+
+        shared = Counter()
+        for gram, pw_count in Counter(_bigrams(password)).items():
+            posting = self.postings.get(gram)
+            if posting is None:
+                continue
+            ids, counts = posting
+            if pw_count == 1:
+                shared.update(ids)
+            else:
+                for name_id, count in zip(ids, counts):
+                    shared[name_id] += min(count, pw_count)
+
+        names = self.names
+        for name_id, count in shared.items():
+            if count >= required[len(names[name_id])]:
+                selected.add(name_id)
+
+        return [names[name_id] for name_id in selected]
+
+
 class NameDetector:
     def __init__(
         self,
         name_file_path=None,
         fuzzy_threshold: int = 90,
         min_length: int = 3,
+        use_index: bool = True,
+        mode: str = "auto",
+        use_snapshot: bool = False,
     ):
         """
         Detect personal names inside passwords.
@@ -22,15 +99,57 @@ class NameDetector:
         name_file_path: path to newline-delimited names. If None, defaults to repo data.
         fuzzy_threshold: RapidFuzz partial_ratio score required to count as a match.
         min_length: ignore names shorter than this to reduce junk matches.
+        use_index: prefilter fuzzy candidates with a NameIndex instead of scanning every name.
+        mode: "fuzzy" (RapidFuzz partial_ratio), "exact" (Aho-Corasick substring scan),
+            or "auto": the exact scan first, falling back to fuzzy matching only for
+            passwords it finds no name in (exact alone without RapidFuzz). Most
+            names are caught by the cheap scan; only misspellings pay for fuzzy.
+        use_snapshot: reuse the parsed names and indexes from a snapshot (see
+            src.utils.snapshot) instead of rebuilding them when the file is unchanged.
         """
+        if mode not in ("auto", "fuzzy", "exact"):
+            raise ValueError(f"Unknown name detector mode: {mode!r}")
+        if not HAS_RAPIDFUZZ:
+            # Fuzzy matching needs RapidFuzz; the automaton covers everything else
+            mode = "exact"
+
+        self.mode = mode
         self.fuzzy_threshold = fuzzy_threshold
         self.min_length = min_length
 
         if name_file_path is None:
-            # Resolve to the bundled data file relative to this module.
-            name_file_path = Path(__file__).resolve().parents[2] / "data" / "common-names.txt"
-
-        self.names = self._load_names(name_file_path)
+            name_file_path = DEFAULT_NAMES_FILE
+
+        build = partial(self._build, name_file_path, use_index)
+        if use_snapshot and Path(name_file_path).exists():
+            params = (self.mode, self.fuzzy_threshold, self.min_length, use_index)
+            # One snapshot per names file, so detectors on different files don't evict each other
+            name = snapshot.key("names", [name_file_path])
+            state = snapshot.load_or_build(name, [name_file_path], build, params)
+        else:
+            state = build()
+        self.names, self.index, self.automaton, self._contained = state
+
+    def _build(self, name_file_path, use_index: bool) -> tuple:
+        names = self._load_names(name_file_path)
+        eligible = sorted(name for name in names if len(name) >= self.min_length)
+
+        index = None
+        if self.mode != "exact" and use_index:
+            index = NameIndex(eligible, fuzzy_threshold=self.fuzzy_threshold)
+
+        # The automaton is always built: it is the exact mode and a cheap fallback for fuzzy mode
+        automaton = AhoCorasick(eligible)
+        return names, index, automaton, self._build_containment(automaton)
+
+    @staticmethod
+    def _build_containment(automaton) -> list[set[int]]:
+        # For each name, the ids of other names that occur inside it
+        contained = []
+        for name_id, name in enumerate(automaton.words):
+            inner = {other for _, other in automaton.iter_matches(name) if other != name_id}
+            contained.append(inner)
+        return contained
 
     def _load_names(self, path: Path) -> set[str]:
         path = Path(path)
@@ -46,24 +165,50 @@ class NameDetector:
                     names.add(name)
         return names
 
-    def _match_names(self, password: str) -> list[str]:
-        # Normalize to catch leetspeak (e.g., p@ul -> paul)
-        from src.utils import normalization
+    def _match_exact(self, variants) -> list[str]:
+        """
+        Find every embedded name with one pass over each normalized variant.
 
-        pw = normalization.normalize(password)
-        matched: set[str] = set()
+        Names contained in a longer matched name are dropped during the scan,
+        matching the post-filter applied to fuzzy matches.
+        """
+        found: set[int] = set()
+        covered: set[int] = set()
+        contained = self._contained
 
-        if HAS_RAPIDFUZZ:
-            for name in self.names:
-                if len(name) < self.min_length:
+        for pw in variants:
+            for _, name_id in self.automaton.iter_longest(pw):
+                if name_id in covered or name_id in found:
+                    continue
+                found.add(name_id)
+                inner = contained[name_id]
+                if inner:
+                    covered |= inner
+                    found -= inner
+
+        words = self.automaton.words
+        return sorted(words[name_id] for name_id in found)
+
+    def _match_names(self, password, exact: bool = False) -> list[str]:
+        # Normalize to catch leetspeak (e.g., p@ul -> paul), including
+        # ambiguous readings (e.g., a1ex -> aiex or alex)
+        variants = as_context(password).variants
+        if exact or self.mode == "exact":
+            return self._match_exact(variants)
+        if self.mode == "auto":
+            found = self._match_exact(variants)
+            if found:
+                return found
+
+        matched: set[str] = set()
+        for pw in variants:
+            candidates = self.index.candidates(pw) if self.index is not None else self.names
+            for name in candidates:
+                if len(name) < self.min_length or name in matched:
                     continue
                 # partial_ratio catches substrings and minor substitutions
                 if fuzz.partial_ratio(name, pw) >= self.fuzzy_threshold:
                     matched.add(name)
-        else:
-            for name in self.names:
-                if len(name) >= self.min_length and name in pw:
-                    matched.add(name)
 
         # Drop shorter names that are substrings of longer matches to avoid double counting
         filtered = []
@@ -73,8 +218,9 @@ class NameDetector:
 
         return sorted(filtered)
 
-    def analyze(self, password: str):
-        found = self._match_names(password)
+    def analyze(self, password: str, exact: bool = False):
+        # exact=True forces the cheap exact scan (used when a time budget runs short)
+        found = self._match_names(password, exact)
 
         return {
             "contains_name": len(found) > 0,
@@ -82,6 +228,6 @@ class NameDetector:
             "name_score": len(found),   # 1 per unique hit
         }
 
-    def evaluate(self, passwords):
+    def evaluate(self, passwords, exact: bool = False):
         # Must return list of results, one per password
-        return [self.analyze(pw) for pw in passwords]
+        return [self.analyze(pw, exact) for pw in passwords]
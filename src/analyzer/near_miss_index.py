@@ -0,0 +1,199 @@
+"""
+Near-Miss Index Module
+----------------------
+Finds blocklisted passwords within a small edit distance of a password
+("passw0rdd", "qwerty12") with a symmetric-deletion index (as in SymSpell).
+
+Every entry is indexed under each string obtained by deleting up to
+MAX_DISTANCE characters of its first PREFIX_LENGTH characters. The
+prefixes of two strings within edit distance d always share such a
+deletion string, so a query only generates the deletions of its own prefix
+and looks each one up: the work per query is bounded by PREFIX_LENGTH,
+whatever the query length or the number of entries. Candidates are then
+confirmed with an exact edit distance over the whole strings (insertions,
+deletions, substitutions and adjacent transpositions).
+
+Deletion strings are stored as their CRC-32 packed with the number of
+deleted characters and the entry id into one sorted array of 64-bit
+integers (8 bytes per deletion); a CRC collision only adds a candidate that
+fails confirmation. The deletion count lets a lookup search distance 1
+first, touching only single-deletion keys, and stop there when it finds a
+match. Entries themselves are stored once in a bytes blob with an offsets
+array.
+
+Short passwords are within two edits of many unrelated entries, so only
+entries of at least MIN_LENGTH characters are indexed, and inputs shorter
+than TWO_EDIT_LENGTH are matched at distance 1 only. Only the MAX_ENTRIES
+most common entries are indexed, which bounds memory on multi-million
+entry lists (about 24 deletion strings per entry). The built index is
+plain bytes and arrays, so it pickles compactly into a snapshot; see
+benchmarks/bench_near_miss_index.py for build time, memory and latency.
+"""
+
+import zlib
+from array import array
+from bisect import bisect_left
+
+MAX_DISTANCE = 2
+MIN_LENGTH = 5
+TWO_EDIT_LENGTH = 8
+PREFIX_LENGTH = 7
+MAX_ENTRIES = 100000
+
+_ID_BITS = 30
+_ID_MASK = (1 << _ID_BITS) - 1
+
+
+def deletions(word: str, distance: int) -> dict:
+    """
+    Every string obtained by deleting up to `distance` characters of word.
+
+    Returns:
+        dict: {string: fewest characters deleted to get it}, word itself included (0).
+    """
+    result = {word: 0}
+    frontier = {word}
+    for count in range(1, min(distance, len(word)) + 1):
+        frontier = {text[:i] + text[i + 1:] for text in frontier for i in range(len(text))}
+        for text in frontier:
+            result.setdefault(text, count)
+    return result
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Optimal string alignment distance between a and b, or limit + 1 if it exceeds limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    # Near misses mostly differ in a few characters; strip the common prefix and
+    # suffix so the quadratic part only runs over the differing middle
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < len(a) - start and end < len(b) - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a, b = a[start:len(a) - end], b[start:len(b) - end]
+    if not a or not b:
+        return max(len(a), len(b))
+
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+
+def _key(text: str) -> int:
+    return zlib.crc32(text.encode("utf-8", errors="surrogatepass"))
+
+
+class NearMissIndex:
+    def __init__(self, entries, max_distance: int = MAX_DISTANCE, min_length: int = MIN_LENGTH,
+                 prefix_length: int = PREFIX_LENGTH):
+        """
+        Build the index.
+
+        entries: blocklist entries in rank order (most common first), already normalized.
+        max_distance: largest edit distance the index can answer.
+        min_length: shortest entry indexed.
+        prefix_length: characters of each entry the deletions are taken from.
+        """
+        self.max_distance = max_distance
+        self.min_length = min_length
+        self.prefix_length = prefix_length
+
+        chunks = []
+        offsets = [0]
+        ranks = []
+        packed = []
+        for rank, entry in enumerate(entries):
+            if len(entry) < min_length:
+                continue
+            entry_id = len(ranks)
+            encoded = entry.encode("utf-8")
+            chunks.append(encoded)
+            offsets.append(offsets[-1] + len(encoded))
+            ranks.append(rank)
+            packed.extend(_key(deleted) << 32 | count << _ID_BITS | entry_id
+                          for deleted, count in deletions(entry[:prefix_length], max_distance).items())
+
+        self._blob = b"".join(chunks)
+        self._offsets = array("Q", offsets)
+        self._ranks = array("I", ranks)
+        packed.sort()
+        self._keys = array("Q", packed)
+
+    def __len__(self) -> int:
+        """Number of indexed entries."""
+        return len(self._ranks)
+
+    def _entry(self, entry_id: int) -> str:
+        return self._blob[self._offsets[entry_id]:self._offsets[entry_id + 1]].decode("utf-8")
+
+    def _candidates(self, key: int, max_deleted: int):
+        """Ids of entries with a deletion string hashing to key, made by deleting at most max_deleted chars."""
+        keys = self._keys
+        i = bisect_left(keys, key << 32)
+        # Within one key, lower deletion counts sort first
+        end = (key << 32 | (max_deleted + 1) << _ID_BITS)
+        while i < len(keys) and keys[i] < end:
+            yield keys[i] & _ID_MASK
+            i += 1
+
+    def lookup(self, text: str, max_distance: int = None):
+        """
+        Find the closest indexed entry to an already normalized password.
+
+        Parameters:
+            text (str): The normalized password.
+            max_distance (int): Largest distance accepted (default: the index's
+                max_distance, lowered to 1 for inputs shorter than TWO_EDIT_LENGTH).
+
+        Returns:
+            dict or None: {"entry", "distance", "rank"} of the closest entry
+            (the most common one on ties) at distance 1 or more, or None.
+            Exact matches are left to the exact-match lookup.
+        """
+        if max_distance is None:
+            max_distance = self.max_distance if len(text) >= TWO_EDIT_LENGTH else 1
+        max_distance = min(max_distance, self.max_distance)
+        if max_distance < 1 or len(text) < self.min_length - max_distance:
+            return None
+
+        offsets, ranks = self._offsets, self._ranks
+        # Strings within distance d share a string made by deleting at most d
+        # characters from each, so search d = 1 before d = 2
+        for distance in range(1, max_distance + 1):
+            best = None
+            checked = set()
+            for deleted in deletions(text[:self.prefix_length], distance):
+                for entry_id in self._candidates(_key(deleted), distance):
+                    if entry_id in checked:
+                        continue
+                    checked.add(entry_id)
+                    if best is not None and ranks[entry_id] >= best[0]:
+                        continue  # can't beat the most common match found so far
+                    if offsets[entry_id + 1] - offsets[entry_id] < len(text) - distance:
+                        continue  # too short even if every byte is one character
+                    entry = self._entry(entry_id)
+                    if edit_distance(text, entry, distance) == distance:
+                        best = (ranks[entry_id], entry)
+            if best is not None:
+                return {"entry": best[1], "distance": distance, "rank": best[0]}
+        return None
+
+    def nbytes(self) -> int:
+        """Memory held by the index's buffers."""
+        return (len(self._blob) + self._offsets.itemsize * len(self._offsets)
+                + self._ranks.itemsize * len(self._ranks) + self._keys.itemsize * len(self._keys))
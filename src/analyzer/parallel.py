@@ -0,0 +1,123 @@
+"""
+Parallel Analysis Module
+------------------------
+Process-pool backend for batch analysis. Each worker process holds its own
+AnalyzerEngine, initialized once: where the platform supports fork, the
+parent loads the engine before starting the pool so workers inherit the
+blocklists, name index and compiled patterns copy-on-write.
+
+Work is sent to workers in chunks to keep IPC overhead low, and results are
+returned in input order. shared_pool() keeps one pool alive for repeated
+batches instead of forking new workers for each.
+"""
+
+import atexit
+import gc
+import multiprocessing
+import os
+import threading
+
+from src.analyzer.engine import get_engine
+
+CHUNK_SIZE = 500  # passwords per task sent to a worker
+
+
+def _init_worker():
+    # No-op when the engine was inherited from a forked parent
+    get_engine()
+
+
+def _analyze_chunk(passwords: list) -> list:
+    return get_engine().analyze_batch(passwords)
+
+
+class AnalyzerPool:
+    def __init__(self, workers: int = None, chunk_size: int = CHUNK_SIZE):
+        """
+        Pool of analyzer worker processes.
+
+        workers: number of processes. Defaults to the number of CPUs.
+        chunk_size: passwords per task sent to a worker.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+            # Load once in the parent and keep the loaded objects out of the
+            # collector's reach so workers don't dirty the shared pages. The
+            # workers inherit the frozen generation; the parent unfreezes once
+            # they have forked so its own garbage stays collectable.
+            get_engine()
+            gc.freeze()
+            try:
+                self._pool = context.Pool(self.workers, initializer=_init_worker)
+            finally:
+                gc.unfreeze()
+        else:
+            self._pool = multiprocessing.get_context().Pool(self.workers, initializer=_init_worker)
+
+    def analyze_batch(self, passwords: list) -> list:
+        """
+        Analyze passwords across the worker processes.
+
+        Returns:
+            list: One result per password, in input order (see AnalyzerEngine.analyze()).
+        """
+        chunks = [passwords[i:i + self.chunk_size] for i in range(0, len(passwords), self.chunk_size)]
+        results = []
+        for chunk_results in self._pool.imap(_analyze_chunk, chunks):
+            results.extend(chunk_results)
+        return results
+
+    def close(self):
+        """Wait for outstanding work and shut the workers down."""
+        self._pool.close()
+        self._pool.join()
+
+    def terminate(self):
+        """Stop the workers immediately, discarding outstanding work."""
+        self._pool.terminate()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared_pool(workers: int = None) -> AnalyzerPool:
+    """
+    Return a process-wide pool of `workers` processes, starting it on first use.
+
+    Asking for a different worker count replaces the pool. The pool is shut
+    down when the interpreter exits.
+    """
+    global _shared
+
+    count = workers or os.cpu_count() or 1
+    with _shared_lock:
+        if _shared is None or _shared.workers != count:
+            if _shared is None:
+                atexit.register(_close_shared_pool)
+            else:
+                _shared.close()
+            _shared = AnalyzerPool(count)
+        return _shared
+
+
+def _close_shared_pool():
+    global _shared
+
+    with _shared_lock:
+        if _shared is not None:
+            _shared.terminate()
+            _shared = None
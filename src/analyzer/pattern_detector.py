@@ -2,9 +2,26 @@ import json
 import re
 from pathlib import Path
 
+from src.analyzer import repeat_detector, sequence_detector
+from src.analyzer.context import as_context
+
 PATTERNS_FILE = Path(__file__).parent.parent.parent / "data" / "common_patterns.json"
-with open(PATTERNS_FILE, "r") as f:
-    PATTERNS = json.load(f)
+
+_patterns = None
+
+def load_patterns() -> dict:
+    """Read common_patterns.json on first use and cache it."""
+    global _patterns
+    if _patterns is None:
+        with open(PATTERNS_FILE, "r") as f:
+            _patterns = json.load(f)
+    return _patterns
+
+def __getattr__(name):
+    # PATTERNS is read lazily so importing this module doesn't touch the disk
+    if name == "PATTERNS":
+        return load_patterns()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Define weights for each pattern (how much they reduce password strength)
 PATTERN_WEIGHTS = {
@@ -17,78 +34,136 @@ PATTERN_WEIGHTS = {
     "date_alphanumeric": 0.7
 }
 
+# common_patterns.json category -> detected pattern name, in reporting order
+CATEGORY_PATTERNS = {
+    "sequences_numeric": "sequential_numbers",
+    "sequences_alpha": "sequential_letters",
+    "keyboard_patterns": "keyboard_pattern",
+    "repeated_chars": "repeated_chars",
+    "repeated_substrings": "repeated_substring",
+    "dates_numeric": "date_numeric",
+    "dates_alphanumeric": "date_alphanumeric"
+}
+
+# Categories matched without regard to case
+CASE_INSENSITIVE = {"sequences_alpha", "keyboard_patterns", "dates_alphanumeric"}
+
+# Categories whose entries are plain strings rather than regexes
+LITERAL_CATEGORIES = {"keyboard_patterns"}
+
+
+def _detect_repeats(password: str) -> dict:
+    found = repeat_detector.find_repeated_substring(password)
+    return {"repeated_substrings": found} if found is not None else {}
+
+# Detectors implemented in code rather than patterns from common_patterns.json.
+# Each returns {category: details} for the categories it found; entries for the
+# same categories in the JSON file (if any) are still matched as well
+BUILTIN_DETECTORS = [
+    sequence_detector.detect_sequences,
+    _detect_repeats,
+]
+
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+class PatternEngine:
+    def __init__(self, patterns: dict):
+        """
+        Compile pattern categories once for repeated detection.
+
+        Categories without backreferences are merged into a single regex of
+        optional lookaheads, one per category, so one match() call scans the
+        password for all of them. Categories with backreferences can't share
+        a regex (their group numbers would shift) and get one regex each.
+        """
+        self.combined = None
+        self.separate = {}       # category -> compiled regex
+        self._group_names = {}   # category -> named group in the combined regex
+
+        lookaheads = []
+        for category in CATEGORY_PATTERNS:
+            sources = self._sources(category, patterns.get(category, []))
+            if not sources:
+                continue
+            alternation = "|".join(f"(?:{src})" for src in sources)
+            if category in CASE_INSENSITIVE:
+                alternation = f"(?i:{alternation})"
+
+            if any(_BACKREFERENCE.search(src) for src in sources):
+                self.separate[category] = re.compile(alternation)
+            else:
+                group = f"g{len(self._group_names)}"
+                self._group_names[category] = group
+                lookaheads.append(f"(?=.*?(?P<{group}>{alternation}))?")
+
+        if lookaheads:
+            self.combined = re.compile("".join(lookaheads), re.DOTALL)
+
+    @staticmethod
+    def _sources(category: str, entries: list) -> list:
+        sources = []
+        for entry in entries:
+            if category in LITERAL_CATEGORIES:
+                sources.append(re.escape(entry))
+            else:
+                # Leading global flags aren't allowed mid-expression; the
+                # category's case handling already covers (?i)
+                sources.append(entry[4:] if entry.startswith("(?i)") else entry)
+        return sources
+
+    def detect(self, password) -> tuple:
+        """
+        Detect pattern categories in a password (a string or AnalysisContext).
+
+        Returns:
+            tuple: (detected pattern names in CATEGORY_PATTERNS order,
+                    {pattern name: details} for built-in detectors that fired)
+        """
+        password = as_context(password).password
+        found = set()
+        details = {}
+        if self.combined is not None:
+            groups = self.combined.match(password).groupdict()
+            found.update(category for category, group in self._group_names.items() if groups[group] is not None)
+        for category, regex in self.separate.items():
+            if regex.search(password):
+                found.add(category)
+        for detector in BUILTIN_DETECTORS:
+            for category, result in detector(password).items():
+                found.add(category)
+                details[CATEGORY_PATTERNS[category]] = result
+
+        detected = [name for category, name in CATEGORY_PATTERNS.items() if category in found]
+        return detected, details
+
+
+_engine = None
+
+def compile_patterns() -> PatternEngine:
+    """Compile common_patterns.json once and cache the engine at module level."""
+    global _engine
+    if _engine is None:
+        _engine = PatternEngine(load_patterns())
+    return _engine
+
 def detect_patterns(password):
     """Detect weak patterns in a password and calculate a pattern score."""
-    detected = []
-    score = 0.0
-
-    # Numeric sequences
-    for seq in PATTERNS.get("sequences_numeric", []):
-        for i in range(len(seq) - 2):
-            if seq[i:i+3] in password or seq[i:i+3][::-1] in password:
-                detected.append("sequential_numbers")
-                score += PATTERN_WEIGHTS["sequential_numbers"]
-                break
-        if "sequential_numbers" in detected:
-            break
-
-    # Alphabetic sequences
-    for seq in PATTERNS.get("sequences_alpha", []):
-        for i in range(len(seq) - 2):
-            sub = seq[i:i+3]
-            if sub.lower() in password.lower() or sub[::-1].lower() in password.lower():
-                detected.append("sequential_letters")
-                score += PATTERN_WEIGHTS["sequential_letters"]
-                break
-        if "sequential_letters" in detected:
-            break
-
-    # Keyboard patterns
-    for seq in PATTERNS.get("keyboard_patterns", []):
-        if seq.lower() in password.lower():
-            detected.append("keyboard_pattern")
-            score += PATTERN_WEIGHTS["keyboard_pattern"]
-            break
-
-    # Repeated characters
-    for pattern in PATTERNS.get("repeated_chars", []):
-        if re.search(pattern, password):
-            detected.append("repeated_chars")
-            score += PATTERN_WEIGHTS["repeated_chars"]
-            break
-
-    # Repeated substrings
-    for pattern in PATTERNS.get("repeated_substrings", []):
-        if re.search(pattern, password):
-            detected.append("repeated_substring")
-            score += PATTERN_WEIGHTS["repeated_substring"]
-            break
-
-    # Dates numeric
-    for pattern in PATTERNS.get("dates_numeric", []):
-        if re.search(pattern, password):
-            detected.append("date_numeric")
-            score += PATTERN_WEIGHTS["date_numeric"]
-            break
-
-    # Dates alphanumeric
-    for pattern in PATTERNS.get("dates_alphanumeric", []):
-        if re.search(pattern, password, re.IGNORECASE):
-            detected.append("date_alphanumeric")
-            score += PATTERN_WEIGHTS["date_alphanumeric"]
-            break
-
-    return {"patterns": detected, "pattern_score": score}
+    detected, details = compile_patterns().detect(password)
+    score = sum(PATTERN_WEIGHTS[name] for name in detected)
+    return {"patterns": detected, "pattern_score": score, "details": details}
 
 
 def evaluate(passwords):
     """Evaluate a list of passwords for patterns and return pattern scores."""
     results = []
     for pw in passwords:
-        result = detect_patterns(pw)
+        ctx = as_context(pw)
+        result = detect_patterns(ctx)
         results.append({
-            "password": pw,
+            "password": ctx.password,
             "patterns": result["patterns"],
-            "pattern_score": result["pattern_score"]
+            "pattern_score": result["pattern_score"],
+            "details": result["details"]
         })
-    return results
\ No newline at end of file
+    return results
@@ -0,0 +1,142 @@
+"""
+Rank Index Module
+-----------------
+Compact in-memory popularity ranks for blocklist entries.
+
+The blocklist files are ordered by popularity, so an entry's rank is its
+position across the lists (most common list first, an entry listed twice
+keeps its first position). Entries are stored UTF-8 encoded in rank order
+in one bytes blob, with an array of offsets into it, so an entry's rank is
+simply its index. Lookups go through an open-addressing hash table (an
+array of entry indexes, probed linearly from the entry's CRC-32), giving
+O(1) lookups without a Python object per entry: beyond the string bytes an
+entry costs one offset plus 1.4 to 2.9 hash slots, 2 or 4 bytes each
+depending on the entry count (about 7 to 16 bytes per entry in total).
+"""
+
+import zlib
+from array import array
+from bisect import bisect_right
+
+LOAD_FACTOR = 0.7  # maximum share of hash slots in use
+
+
+def _typecode(max_value: int) -> str:
+    """Smallest unsigned array typecode holding max_value."""
+    for code in ("H", "I", "Q"):
+        if max_value < 1 << (8 * array(code).itemsize):
+            return code
+    raise OverflowError(max_value)
+
+
+class RankIndex:
+    def __init__(self, tiers):
+        """
+        Build the index from lists ordered most common first.
+
+        tiers: [(tier_name, entries), ...], the most common list first; each
+            entries iterable is in popularity order and already normalized.
+
+        Entries are streamed straight into the blob, offsets and slot buffers;
+        the slot table itself detects duplicates, so building needs no Python
+        object per entry either.
+        """
+        tiers = list(tiers)
+        self._blob = bytearray()
+        self._offsets = array("I", [0])
+        # Size the table for every listed entry up front where the lists know
+        # their length, so it rarely has to grow
+        self._allocate_slots(sum(len(entries) for _, entries in tiers if hasattr(entries, "__len__")))
+        self.tier_names = []
+        self.tier_ends = []  # rank one past the last entry of each tier
+        for name, entries in tiers:
+            for entry in entries:
+                if entry:
+                    self._add(entry.encode("utf-8"))
+            self.tier_names.append(name)
+            self.tier_ends.append(len(self))
+
+    def _allocate_slots(self, capacity: int):
+        """(Re)build the slot table to hold at least `capacity` entries within LOAD_FACTOR."""
+        capacity = max(capacity, len(self), 1)
+        # Smallest power of two keeping the load at or under LOAD_FACTOR
+        size = 1 << (max(int(capacity / LOAD_FACTOR), 1) - 1).bit_length()
+        while int(size * LOAD_FACTOR) < capacity:
+            size *= 2
+        self._mask = size - 1
+        self._capacity = int(size * LOAD_FACTOR)
+        # Slots hold entry index + 1; 0 marks an empty slot
+        code = _typecode(self._capacity + 1)
+        slots = array(code, bytes(size * array(code).itemsize))
+        blob, offs, mask = self._blob, self._offsets, self._mask
+        for i in range(len(self)):
+            slot = zlib.crc32(blob[offs[i]:offs[i + 1]]) & mask
+            while slots[slot]:
+                slot = (slot + 1) & mask
+            slots[slot] = i + 1
+        self._slots = slots
+
+    def _add(self, key: bytes):
+        """Append an encoded entry unless it is already indexed."""
+        blob, offs, slots, mask = self._blob, self._offsets, self._slots, self._mask
+        slot = zlib.crc32(key) & mask
+        while slots[slot]:
+            index = slots[slot] - 1
+            if blob[offs[index]:offs[index + 1]] == key:
+                return
+            slot = (slot + 1) & mask
+
+        count = len(self)
+        if count >= self._capacity:
+            self._allocate_slots(2 * self._capacity)
+            slots, mask = self._slots, self._mask
+            slot = zlib.crc32(key) & mask
+            while slots[slot]:
+                slot = (slot + 1) & mask
+        blob += key
+        if len(blob) >= 1 << 32 and offs.typecode == "I":
+            self._offsets = offs = array("Q", offs)
+        offs.append(len(blob))
+        slots[slot] = count + 1
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __contains__(self, entry: str) -> bool:
+        return self.rank(entry) is not None
+
+    def entry(self, rank: int) -> str:
+        return self._blob[self._offsets[rank]:self._offsets[rank + 1]].decode("utf-8")
+
+    def rank(self, entry: str):
+        """Popularity rank of an already normalized entry (0 = most common), or None."""
+        key = entry.encode("utf-8", errors="surrogatepass")
+        blob, offs, slots, mask = self._blob, self._offsets, self._slots, self._mask
+        slot = zlib.crc32(key) & mask
+        while True:
+            index = slots[slot]
+            if not index:
+                return None
+            index -= 1
+            if blob[offs[index]:offs[index + 1]] == key:
+                return index
+            slot = (slot + 1) & mask
+
+    def tier(self, rank: int) -> str:
+        """Name of the list a rank falls in."""
+        return self.tier_names[bisect_right(self.tier_ends, rank)]
+
+    def lookup(self, entry: str):
+        """Return the name of the tier an entry is in, or None if absent."""
+        rank = self.rank(entry)
+        return None if rank is None else self.tier(rank)
+
+    def ranked_entries(self, limit: int = None) -> list:
+        """Entries in rank order, the `limit` most common if given."""
+        count = len(self) if limit is None else min(limit, len(self))
+        return [self.entry(rank) for rank in range(count)]
+
+    def nbytes(self) -> int:
+        """Memory held by the index's buffers."""
+        return (len(self._blob) + self._offsets.itemsize * len(self._offsets)
+                + self._slots.itemsize * len(self._slots))
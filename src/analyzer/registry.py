@@ -0,0 +1,107 @@
+"""
+Analyzer Registry Module
+------------------------
+The analyzers making up the scoring pipeline, each with a relative cost and
+an optional rule for skipping it.
+
+The engine runs analyzers cheapest first. Before running an analyzer on a
+password it asks the analyzer's skip rule whether the results gathered so
+far already decide the outcome (e.g. a password in the top 1k list is weak
+whatever names it contains). A skipped analyzer is reported in the result
+and scored at its skipped_strength, a fixed bound standing in for the
+result it would have returned; without one it is left out of the score.
+
+Analyzers may also provide a degraded run: a cheaper approximation used for
+the passwords a request's time budget can't cover at the analyzer's
+observed per-password cost. Until a full run has been timed, budgets are
+planned with a conservative expected cost instead.
+"""
+
+COST_SMOOTHING = 0.2  # weight of the newest sample in the per-password cost average
+DEFAULT_EXPECTED_SECONDS = 0.005  # per-password cost assumed before any run is timed
+
+
+class AnalyzerSpec:
+    def __init__(self, name: str, run, strength, cost: float = 1.0, skip_if=None, degraded_run=None,
+                 skipped_strength: float = None, expected_seconds: float = DEFAULT_EXPECTED_SECONDS):
+        """
+        One registered analyzer.
+
+        name: component name used in results and score weights.
+        run: callable(list of AnalysisContext) -> list of raw results, one per context.
+        strength: callable(raw result) -> strength score in [0, 1] (1 = strong).
+        cost: relative cost per password; lower runs earlier.
+        skip_if: optional callable({analyzer name: raw result so far}) -> bool.
+        degraded_run: optional cheaper stand-in for run, used when time runs short.
+        skipped_strength: optional strength score used for the component when skipped.
+        expected_seconds: conservative per-password cost of run() assumed until
+            the first run has been timed.
+        """
+        self.name = name
+        self.run = run
+        self.strength = strength
+        self.cost = cost
+        self.skip_if = skip_if
+        self.degraded_run = degraded_run
+        self.skipped_strength = skipped_strength
+        self.expected_seconds = expected_seconds
+        self.seconds_per_item = None  # running average of run()'s cost per password
+
+    def should_skip(self, raw_results: dict) -> bool:
+        return self.skip_if is not None and bool(self.skip_if(raw_results))
+
+    def observe(self, seconds: float, count: int):
+        """Record that run() took `seconds` for `count` passwords."""
+        if count <= 0:
+            return
+        sample = seconds / count
+        if self.seconds_per_item is None:
+            self.seconds_per_item = sample
+        else:
+            self.seconds_per_item += COST_SMOOTHING * (sample - self.seconds_per_item)
+
+    def affordable(self, count: int, budget: float) -> int:
+        """How many of `count` passwords run() is expected to finish within `budget` seconds."""
+        if self.degraded_run is None:
+            return count  # nothing cheaper to fall back on
+        if budget <= 0:
+            return 0
+        per_item = self.seconds_per_item if self.seconds_per_item is not None else self.expected_seconds
+        if not per_item:
+            return count
+        return min(count, int(budget / per_item))
+
+
+class AnalyzerRegistry:
+    def __init__(self):
+        self._specs = {}  # name -> AnalyzerSpec, in registration order
+
+    def register(self, name: str, run, strength, cost: float = 1.0, skip_if=None,
+                 degraded_run=None, skipped_strength: float = None,
+                 expected_seconds: float = DEFAULT_EXPECTED_SECONDS) -> AnalyzerSpec:
+        """Add an analyzer, replacing any registered under the same name."""
+        spec = AnalyzerSpec(name, run, strength, cost, skip_if, degraded_run, skipped_strength,
+                            expected_seconds)
+        self._specs.pop(name, None)
+        self._specs[name] = spec
+        return spec
+
+    def unregister(self, name: str):
+        del self._specs[name]
+
+    def get(self, name: str) -> AnalyzerSpec:
+        return self._specs[name]
+
+    def names(self) -> list:
+        """Analyzer names in registration order (the order components are reported in)."""
+        return list(self._specs)
+
+    def by_cost(self) -> list:
+        """Analyzers in execution order: cheapest first, ties in registration order."""
+        return sorted(self._specs.values(), key=lambda spec: spec.cost)
+
+    def __contains__(self, name) -> bool:
+        return name in self._specs
+
+    def __len__(self) -> int:
+        return len(self._specs)
@@ -0,0 +1,140 @@
+"""
+Repeat Detector Module
+----------------------
+Finds repeated substrings ("abcabc", "123123123") without a backtracking
+regex. The `(..+)\\1+` pattern this replaces takes super-linear time in the
+input length, so one long input could tie up a worker.
+
+The search is the Main-Lorentz divide and conquer over Z-functions: every
+square (a unit immediately followed by itself) either lies in one half of
+the string or crosses the midpoint, and the crossing ones are found from
+four Z-function arrays in time linear in the segment length. The whole
+search is O(n log n) and never backtracks.
+"""
+
+MIN_UNIT = 2   # shortest repeated unit reported, as in the old `(..+)\1+` pattern
+_SEPARATOR = -1  # never a code point
+
+
+def z_function(seq) -> list:
+    """z[i] = length of the longest common prefix of seq and seq[i:] (z[0] = 0)."""
+    n = len(seq)
+    z = [0] * n
+    left = right = 0
+    for i in range(1, n):
+        length = min(right - i, z[i - left]) if i < right else 0
+        while i + length < n and seq[length] == seq[i + length]:
+            length += 1
+        z[i] = length
+        if i + length > right:
+            left, right = i, i + length
+    return z
+
+
+def _longest_square(seq, shift: int, min_half: int, best: list):
+    """
+    Update best = [start, half] with the longest square in seq whose half is
+    at least min_half and longer than the current best.
+    """
+    n = len(seq)
+    if n < 2 * max(min_half, best[1] + 1):
+        return  # no room for a longer square
+
+    nu = n // 2
+    nv = n - nu
+    u, v = seq[:nu], seq[nu:]
+    ru, rv = u[::-1], v[::-1]
+
+    z1 = z_function(ru)
+    z2 = z_function(v + [_SEPARATOR] + u)
+    z3 = z_function(ru + [_SEPARATOR] + rv)
+    z4 = z_function(v)
+
+    # Squares crossing the midpoint, centred ("cntr") on each position
+    for cntr in range(n):
+        if cntr < nu:
+            left = True
+            half = nu - cntr
+            k1 = z1[half] if half < nu else 0
+            k2 = z2[nv + 1 + cntr]
+        else:
+            left = False
+            half = cntr - nu + 1
+            i3 = nu + nv - (cntr - nu)
+            k1 = z3[i3] if i3 < len(z3) else 0
+            i4 = cntr - nu + 1
+            k2 = z4[i4] if i4 < nv else 0
+
+        if half <= best[1] or half < min_half or k1 + k2 < half:
+            continue
+
+        low = max(1, half - k2)
+        high = min(half, k1)
+        if left and high == half:
+            high -= 1
+        if low <= high:
+            start = shift + (cntr - low if left else cntr - half - low + 1)
+            best[0], best[1] = start, half
+
+    _longest_square(u, shift, min_half, best)
+    _longest_square(v, shift + nu, min_half, best)
+
+
+def _primitive_period(unit) -> int:
+    # Smallest p such that unit is a whole number of copies of unit[:p]
+    n = len(unit)
+    border = [0] * n
+    k = 0
+    for i in range(1, n):
+        while k and unit[i] != unit[k]:
+            k = border[k - 1]
+        if unit[i] == unit[k]:
+            k += 1
+        border[i] = k
+    period = n - border[-1]
+    return period if n % period == 0 else n
+
+
+def find_repeated_substring(password: str, min_unit: int = MIN_UNIT):
+    """
+    Find the longest repeated substring in a password.
+
+    Parameters:
+        password (str): The password to scan.
+        min_unit (int): Shortest unit (as it appears in the square) that counts.
+
+    Returns:
+        dict or None: {
+            "unit": shortest repeating unit of the run,
+            "start": index where the run begins,
+            "length": length of the whole run,
+            "coverage": fraction of the password the run covers
+        }
+    """
+    n = len(password)
+    # Any square with a unit of 2+ characters repeats the unit's first bigram,
+    # so passwords whose bigrams are all distinct (most of them) skip the search
+    if min_unit >= 2 and len({password[i:i + 2] for i in range(n - 1)}) == n - 1:
+        return None
+
+    seq = [ord(ch) for ch in password]
+    best = [0, 0]
+    _longest_square(seq, 0, min_unit, best)
+    start, half = best
+    if not half:
+        return None
+
+    # Extend the square to the maximal run sharing its smallest period
+    period = _primitive_period(seq[start:start + half])
+    end = start + 2 * half
+    while start > 0 and seq[start - 1] == seq[start - 1 + period]:
+        start -= 1
+    while end < n and seq[end] == seq[end - period]:
+        end += 1
+
+    return {
+        "unit": password[start:start + period],
+        "start": start,
+        "length": end - start,
+        "coverage": (end - start) / n,
+    }
@@ -2,6 +2,15 @@
 Aggregate scores from all analyzers to compute a final password strength score.
 """
 
+STRONG_SCORE = 0.8    # lowest final score rated Strong
+MODERATE_SCORE = 0.6  # lowest final score rated Moderate
+
+
+def strength_label(score: float) -> str:
+    """Verdict for a final score: "Strong", "Moderate" or "Weak"."""
+    return "Strong" if score >= STRONG_SCORE else "Moderate" if score >= MODERATE_SCORE else "Weak"
+
+
 def aggregate_scores(results_dict, weights=None):
     """
     Compute a final normalized password strength score based on individual analyzer results.
@@ -51,7 +60,7 @@ def aggregate_scores(results_dict, weights=None):
     return min(max(final_score, 0.0), 1.0)
 
 
-def combine_results(analyzer_results):
+def combine_results(analyzer_results, weights=None):
     """
     Combine all individual analyzer results into a final dictionary per password.
 
@@ -59,6 +68,7 @@ def combine_results(analyzer_results):
         analyzer_results (dict): Dictionary mapping analyzer names to their
         outputs (e.g., results from length_checker, entropy_calculator, etc.)
         Each output should have a numeric score (0-1).
+        weights (dict, optional): Passed through to aggregate_scores.
 
     Returns:
         dict: {
@@ -86,7 +96,7 @@ def combine_results(analyzer_results):
             # if result is already a numeric score
             components[name] = float(result)
 
-    final_score = aggregate_scores(components)
+    final_score = aggregate_scores(components, weights)
     return {
         "final_score": final_score,
         "components": components
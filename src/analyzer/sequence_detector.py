@@ -0,0 +1,198 @@
+"""
+Sequence Detector Module
+------------------------
+Finds runs of consecutive characters in one pass over a password:
+
+- ascending/descending digit runs ("1234", "9876", "7890")
+- ascending/descending letter runs ("abcd", "zyx"), case-insensitive
+- spatial runs on a keyboard layout: keys that are neighbours on the
+  layout and keep moving in the same direction ("qwerty", "1qaz", "zxcv")
+  or alternate between two directions ("1q2w3e")
+
+Each step between neighbouring characters is reduced to a delta: a
+code-point difference for digit/letter runs, and a (row, column) move for
+each layout's precomputed key positions. A run is a stretch of equal (or,
+for zigzags, alternating) deltas, so any layout described in LAYOUTS is
+handled with no per-pattern lists.
+"""
+
+MIN_SEQUENCE_LENGTH = 3  # characters in a digit/letter run
+MIN_STRAIGHT_LENGTH = 3  # keys in a straight keyboard run
+MIN_ZIGZAG_LENGTH = 4    # keys in an alternating keyboard run
+
+# Layout name -> rows of (characters, horizontal offset of the row in key widths).
+# Characters sharing a column index are the same key (e.g. "1" and "!").
+LAYOUTS = {
+    "qwerty": [
+        (["1234567890-=", "!@#$%^&*()_+"], 0.0),
+        (["qwertyuiop[]", "QWERTYUIOP{}"], 0.5),
+        (["asdfghjkl;'", "ASDFGHJKL:\""], 0.75),
+        (["zxcvbnm,./", "ZXCVBNM<>?"], 1.25),
+    ],
+    "azerty": [
+        (["&é\"'(-è_çà)=", "1234567890°+"], 0.0),
+        (["azertyuiop^$", "AZERTYUIOP¨£"], 0.5),
+        (["qsdfghjklmù*", "QSDFGHJKLM%µ"], 0.75),
+        (["wxcvbn,;:!", "WXCVBN?./§"], 1.25),
+    ],
+    "numpad": [
+        (["/*-"], 1.0),
+        (["789+"], 0.0),
+        (["456"], 0.0),
+        (["123"], 0.0),
+        (["0."], 0.0),
+    ],
+}
+
+
+def _build_key_positions(layout) -> dict:
+    positions = {}
+    for row, (variants, offset) in enumerate(layout):
+        for chars in variants:
+            for col, ch in enumerate(chars):
+                positions.setdefault(ch, (row, col, col + offset))
+    return positions
+
+
+# Precomputed adjacency tables: layout -> {character: (row, column, x position)}
+KEY_POSITIONS = {name: _build_key_positions(layout) for name, layout in LAYOUTS.items()}
+
+
+def _char_delta(prev: str, ch: str):
+    """Return (kind, delta) for a digit/letter step, or None if it isn't one."""
+    if prev.isdigit() and ch.isdigit() and prev.isascii() and ch.isascii():
+        delta = ord(ch) - ord(prev)
+        if delta in (1, -1):
+            return "digit", delta
+        # "0" also follows "9", as on the number row ("7890", "0987")
+        if (prev, ch) == ("9", "0"):
+            return "digit", 1
+        if (prev, ch) == ("0", "9"):
+            return "digit", -1
+        return None
+    a, b = prev.lower(), ch.lower()
+    if a.isascii() and b.isascii() and a.isalpha() and b.isalpha():
+        delta = ord(b) - ord(a)
+        if delta in (1, -1):
+            return "alpha", delta
+    return None
+
+
+def _crosses_wrap(password: str, i: int, step: tuple) -> bool:
+    # The 9 -> 0 wrap may only end an ascending run and 0 -> 9 only start a
+    # descending one, so "8901" and "1098" aren't runs
+    if step[0] != "digit":
+        return False
+    if step[1] > 0:
+        return password[i - 2:i] == "90"
+    return password[i - 1:i + 1] == "09"
+
+
+def _key_step(positions: dict, prev: str, ch: str):
+    """Return the (row, column) move between two neighbouring keys, or None."""
+    a = positions.get(prev)
+    b = positions.get(ch)
+    if a is None or b is None or a[:2] == b[:2]:
+        return None
+    drow, dcol = b[0] - a[0], b[1] - a[1]
+    if drow == 0 and abs(dcol) == 1:
+        return (0, dcol)
+    if abs(drow) == 1 and abs(b[2] - a[2]) <= 1.0:
+        return (drow, dcol)
+    return None
+
+
+def _sequence_runs(password: str) -> list:
+    runs = []
+    start = 0
+    current = None
+    for i in range(1, len(password) + 1):
+        step = _char_delta(password[i - 1], password[i]) if i < len(password) else None
+        if step is not None and step == current and not _crosses_wrap(password, i, step):
+            continue
+        # The run [start, i) ends here
+        if current is not None and i - start >= MIN_SEQUENCE_LENGTH:
+            runs.append({
+                "type": "numeric" if current[0] == "digit" else "alpha",
+                "direction": "ascending" if current[1] > 0 else "descending",
+                "start": start,
+                "length": i - start,
+            })
+        start, current = i - 1, step
+    return runs
+
+
+def _spatial_runs(password: str, layout: str) -> list:
+    positions = KEY_POSITIONS[layout]
+    steps = [_key_step(positions, password[i - 1], password[i]) for i in range(1, len(password))]
+    runs = []
+
+    # Straight runs: the same move repeated
+    start = 0
+    for i in range(1, len(steps) + 1):
+        if i < len(steps) and steps[i] is not None and steps[i] == steps[i - 1]:
+            continue
+        keys = i - start + 1
+        if steps[start] is not None and keys >= MIN_STRAIGHT_LENGTH:
+            runs.append({"type": "keyboard", "direction": "straight", "layout": layout,
+                         "start": start, "length": keys})
+        start = i
+
+    # Zigzag runs: two different moves alternating (not back and forth on one pair of keys)
+    start = 0
+    for i in range(2, len(steps) + 1):
+        if i < len(steps) and steps[i] is not None and steps[i] == steps[i - 2] \
+                and steps[i] != steps[i - 1] and steps[i - 1] is not None \
+                and steps[i - 1] != (-steps[i][0], -steps[i][1]):
+            continue
+        keys = i - start + 1
+        if keys >= MIN_ZIGZAG_LENGTH:
+            runs.append({"type": "keyboard", "direction": "zigzag", "layout": layout,
+                         "start": start, "length": keys})
+        start = i - 1
+    return runs
+
+
+def find_runs(password: str) -> list:
+    """
+    Find every digit, letter and keyboard run in a password.
+
+    Keyboard runs lying entirely inside a digit or letter run (e.g. "123"
+    on the number row) are left out, since the sequence already covers them.
+
+    Returns:
+        list: Run dicts with "type" ("numeric", "alpha" or "keyboard"),
+        "direction" ("ascending"/"descending" or "straight"/"zigzag"),
+        "start" and "length"; keyboard runs also name their "layout".
+    """
+    if not isinstance(password, str) or len(password) < MIN_SEQUENCE_LENGTH:
+        return []
+
+    runs = _sequence_runs(password)
+    # covered_to[i] = furthest end of a digit/letter run containing position i
+    covered_to = [0] * len(password)
+    for run in runs:
+        end = run["start"] + run["length"]
+        for i in range(run["start"], end):
+            covered_to[i] = max(covered_to[i], end)
+    for layout in LAYOUTS:
+        for run in _spatial_runs(password, layout):
+            if covered_to[run["start"]] < run["start"] + run["length"]:
+                runs.append(run)
+    return runs
+
+
+# Run type -> common_patterns.json category it replaces
+RUN_CATEGORIES = {
+    "numeric": "sequences_numeric",
+    "alpha": "sequences_alpha",
+    "keyboard": "keyboard_patterns",
+}
+
+
+def detect_sequences(password: str) -> dict:
+    """Group find_runs() by pattern category: {category: [runs]} for categories found."""
+    found = {}
+    for run in find_runs(password):
+        found.setdefault(RUN_CATEGORIES[run["type"]], []).append(run)
+    return found
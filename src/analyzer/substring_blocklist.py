@@ -0,0 +1,84 @@
+"""
+Substring Blocklist Module
+--------------------------
+Finds common passwords embedded in longer passwords ("Password2024!",
+"xxdragonxx") with one Aho-Corasick automaton built over the blocklist
+entries, so every embedded entry is found in a single linear scan of the
+input however many entries there are.
+
+Entries shorter than MIN_LENGTH are left out (they would match almost
+anything), as are entries ranked beyond MAX_ENTRIES, which bounds the
+automaton's memory on multi-million entry lists. Over the ~32k bundled
+entries the automaton has ~77k nodes; see
+benchmarks/bench_substring_blocklist.py for build time and memory.
+"""
+
+from array import array
+
+from src.utils.aho_corasick import AhoCorasick
+
+MIN_LENGTH = 4
+MAX_ENTRIES = 100000
+
+
+class SubstringBlocklist:
+    def __init__(self, entries, min_length: int = MIN_LENGTH):
+        """
+        Build the automaton.
+
+        entries: blocklist entries in rank order (most common first), already normalized.
+        min_length: shortest entry searched for.
+        """
+        self.min_length = min_length
+        eligible = []
+        ranks = []
+        for rank, entry in enumerate(entries):
+            if len(entry) >= min_length:
+                eligible.append(entry)
+                ranks.append(rank)
+        self.automaton = AhoCorasick(eligible)
+        # Word ids follow insertion order, so ranks[word_id] is the word's rank
+        self._ranks = array("I", ranks)
+
+    def __len__(self) -> int:
+        return len(self.automaton)
+
+    def scan(self, readings) -> dict:
+        """
+        Find blocklist entries embedded in a password.
+
+        Parameters:
+            readings: normalized readings of one password (e.g. lowercased,
+                and with leetspeak decoded); each is scanned once.
+
+        Returns:
+            dict or None: {"longest": match, "most_common": match}, where each
+            match is {"entry", "rank", "start", "coverage"} and coverage is the
+            share of the password's characters the entry spans. None if no
+            entry is embedded.
+        """
+        words, ranks = self.automaton.words, self._ranks
+        longest = most_common = None
+        for text in readings:
+            if len(text) < self.min_length:
+                continue
+            for end, word_id in self.automaton.iter_matches(text):
+                match = (word_id, end, len(text))
+                if longest is None or (len(words[word_id]), -ranks[word_id]) > \
+                        (len(words[longest[0]]), -ranks[longest[0]]):
+                    longest = match
+                if most_common is None or ranks[word_id] < ranks[most_common[0]]:
+                    most_common = match
+        if longest is None:
+            return None
+        return {"longest": self._describe(longest), "most_common": self._describe(most_common)}
+
+    def _describe(self, match) -> dict:
+        word_id, end, text_length = match
+        entry = self.automaton.words[word_id]
+        return {
+            "entry": entry,
+            "rank": self._ranks[word_id],
+            "start": end - len(entry) + 1,
+            "coverage": round(len(entry) / text_length, 4),
+        }
@@ -0,0 +1,158 @@
+"""
+Vectorized Scoring Module
+-------------------------
+NumPy implementations of the length and entropy scores for batches of
+passwords. Lengths are interpolated as one array; for entropy, passwords
+are encoded into padded code-point arrays, and per-password symbol
+histograms and Shannon entropy are computed with array operations instead
+of a per-password Counter and log2 loop.
+
+Passwords are encoded in buckets of similar length, each capped at
+MAX_CELLS code points, so one very long password in a batch costs memory
+for its own row only instead of widening every row.
+
+Results match length_checker.check_length and entropy_calculator.check_entropy
+to floating point tolerance. NumPy is optional; callers should check
+HAS_NUMPY. It is only imported once a batch is actually scored, keeping it
+out of the import time of everything that merely might vectorize.
+"""
+
+import importlib.util
+
+from src.analyzer import length_checker, entropy_calculator
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+np = None  # the numpy module, once _require_numpy() has imported it
+
+
+def _require_numpy():
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+    return np
+
+# Below this batch size the scalar functions are faster than array setup
+MIN_BATCH_SIZE = 64
+
+PAD = -1  # code point used for padding; sorts before every real character
+MAX_CELLS = 1 << 20  # code points per encoded bucket (8 MB of int64)
+
+
+def encode_batch(passwords: list):
+    """
+    Encode passwords into a padded code-point matrix.
+
+    Returns:
+        tuple: (codes, lengths) where codes is an int64 array of shape
+        (len(passwords), longest password) padded with PAD, and lengths
+        holds each password's length.
+    """
+    _require_numpy()
+    lengths = np.fromiter((len(pw) for pw in passwords), dtype=np.int64, count=len(passwords))
+    width = int(lengths.max()) if len(passwords) else 0
+    codes = np.full((len(passwords), width), PAD, dtype=np.int64)
+
+    if width:
+        # surrogatepass: lone surrogates (valid in JSON strings) are scored as
+        # their code points, as the scalar path does
+        flat = np.frombuffer("".join(passwords).encode("utf-32-le", errors="surrogatepass"), dtype="<u4")
+        codes[np.arange(width) < lengths[:, None]] = flat
+    return codes, lengths
+
+
+def batch_entropy(codes, lengths):
+    """Shannon entropy scaled by length for every row (see entropy_calculator.calculate_entropy)."""
+    _require_numpy()
+    rows, width = codes.shape
+    if not rows or not width:
+        return np.zeros(rows, dtype=np.float64)
+
+    ordered = np.sort(codes, axis=1).ravel()
+    row_ids = np.repeat(np.arange(rows), width)
+    valid = ordered != PAD
+
+    # A symbol run starts where the code point or the row changes
+    starts = np.empty(ordered.shape, dtype=bool)
+    starts[0] = True
+    starts[1:] = (ordered[1:] != ordered[:-1]) | (row_ids[1:] != row_ids[:-1])
+    starts &= valid
+
+    # Histogram: count of each distinct symbol, and which row it belongs to
+    run_starts = np.flatnonzero(starts)
+    run_ends = np.append(run_starts[1:], ordered.size)
+    run_rows = row_ids[run_starts]
+    # Runs never cross rows; clamp the last run of each row to that row's end
+    row_ends = run_rows * width + width
+    counts = np.minimum(run_ends, row_ends) - run_starts
+
+    p = counts / lengths[run_rows]
+    entropy = np.bincount(run_rows, weights=-p * np.log2(p), minlength=rows)
+    return entropy * lengths
+
+
+def normalize_lengths(lengths):
+    """Array form of length_checker.check_length's interpolation."""
+    _require_numpy()
+    span = length_checker.IDEAL_LENGTH - length_checker.MIN_LENGTH
+    return np.clip((lengths - length_checker.MIN_LENGTH) / span, 0.0, 1.0)
+
+
+def normalize_entropies(entropy):
+    """Array form of entropy_calculator.normalize_entropy."""
+    _require_numpy()
+    span = entropy_calculator.IDEAL_ENTROPY - entropy_calculator.MIN_ENTROPY
+    return np.clip((entropy - entropy_calculator.MIN_ENTROPY) / span, 0.0, 1.0)
+
+
+def _lengths(passwords: list):
+    _require_numpy()
+    return np.fromiter((len(pw) for pw in passwords), dtype=np.int64, count=len(passwords))
+
+
+def _buckets(lengths):
+    """
+    Split row indexes into buckets of similar length whose padded matrix
+    holds at most MAX_CELLS code points (a longer password gets a bucket
+    of its own).
+    """
+    order = np.argsort(lengths, kind="stable")
+    start = 0
+    while start < len(order):
+        end = min(len(order), start + MAX_CELLS // max(int(lengths[order[start]]), 1))
+        end = max(end, start + 1)
+        # Rows are sorted by length, so the last row sets the bucket's width
+        while end - start > 1 and (end - start) * int(lengths[order[end - 1]]) > MAX_CELLS:
+            end = start + (end - start) // 2
+        yield order[start:end]
+        start = end
+
+
+def batch_entropies(passwords: list):
+    """Shannon entropy scaled by length for every password, encoded bucket by bucket."""
+    lengths = _lengths(passwords)
+    entropy = np.zeros(len(passwords), dtype=np.float64)
+    for rows in _buckets(lengths):
+        codes, bucket_lengths = encode_batch([passwords[i] for i in rows.tolist()])
+        entropy[rows] = batch_entropy(codes, bucket_lengths)
+    return entropy
+
+
+def score_lengths(passwords: list) -> list:
+    """Compute length scores for a batch, as a list of floats in input order."""
+    return normalize_lengths(_lengths(passwords)).tolist()
+
+
+def score_entropies(passwords: list) -> list:
+    """Compute entropy scores for a batch, as a list of floats in input order."""
+    return normalize_entropies(batch_entropies(passwords)).tolist()
+
+
+def score_length_and_entropy(passwords: list):
+    """
+    Compute length and entropy scores for a batch.
+
+    Returns:
+        tuple: (length_scores, entropy_scores) as lists of floats in input order.
+    """
+    return score_lengths(passwords), score_entropies(passwords)
@@ -0,0 +1,99 @@
+"""
+Aho-Corasick Automaton
+----------------------
+Builds a multi-pattern string matcher once over a fixed word list, then finds
+every embedded word in a single left-to-right pass over the text.
+"""
+
+from collections import deque
+
+
+class AhoCorasick:
+    def __init__(self, words):
+        """
+        Build the automaton.
+
+        words: iterable of strings. Duplicates are ignored; word ids follow
+        first-seen order and index into self.words.
+        """
+        self.words: list[str] = []
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[int] = [-1]        # word id ending exactly at this node, or -1
+        self._dict_link: list[int] = [0]   # nearest proper suffix node that ends a word (0 = none)
+
+        for word in words:
+            if word:
+                self._insert(word)
+        self._build_links()
+
+    def _insert(self, word: str):
+        node = 0
+        for ch in word:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(-1)
+                self._dict_link.append(0)
+            node = nxt
+        if self._out[node] == -1:
+            self._out[node] = len(self.words)
+            self.words.append(word)
+
+    def _build_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                fail_node = self._fail[child]
+                self._dict_link[child] = fail_node if self._out[fail_node] != -1 else self._dict_link[fail_node]
+                queue.append(child)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @property
+    def node_count(self) -> int:
+        return len(self._goto)
+
+    def _walk(self, text: str):
+        goto, fail = self._goto, self._fail
+        node = 0
+        for end, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            yield end, node
+
+    def iter_longest(self, text: str):
+        """
+        Yield (end, word_id) for the longest word ending at each position of text.
+
+        Every other word ending at the same position is a suffix of the one
+        reported, so callers that only care about maximal matches can skip them.
+        """
+        out, dict_link = self._out, self._dict_link
+        for end, node in self._walk(text):
+            word_id = out[node]
+            if word_id == -1:
+                word_id = out[dict_link[node]]
+            if word_id != -1:
+                yield end, word_id
+
+    def iter_matches(self, text: str):
+        """Yield (end, word_id) for every occurrence of every word in text."""
+        out, dict_link = self._out, self._dict_link
+        for end, node in self._walk(text):
+            if out[node] == -1:
+                node = dict_link[node]
+            while node:
+                yield end, out[node]
+                node = dict_link[node]
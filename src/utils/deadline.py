@@ -0,0 +1,27 @@
+"""
+Deadline
+--------
+A point in time by which a request has to be answered. Analyzers compare
+the remaining budget with their expected cost and fall back to cheaper,
+approximate work when the full analysis would overrun.
+"""
+
+import time
+
+
+class Deadline:
+    def __init__(self, seconds: float):
+        """seconds: time budget from now."""
+        self.budget = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    @classmethod
+    def from_ms(cls, milliseconds: float) -> "Deadline":
+        return cls(milliseconds / 1000.0)
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (0.0 once it has passed)."""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
@@ -1,3 +1,5 @@
+from itertools import combinations, product
+
 LEET_MAP = {
     "4": "a",
     "@": "a",
@@ -14,6 +16,23 @@ LEET_MAP = {
     "2": "z"
 }
 
+# Other plausible readings of ambiguous leetspeak characters (LEET_MAP holds the primary one)
+LEET_ALTERNATIVES = {
+    "1": ("l",),
+    "!": ("l",),
+}
+
+# Precompiled single-pass translation table for LEET_MAP
+LEET_TABLE = str.maketrans(LEET_MAP)
+
+# Leetspeak spellings of each letter, most common first (LEET_MAP inverted)
+LEET_SPELLINGS = {}
+for _symbol, _letter in LEET_MAP.items():
+    LEET_SPELLINGS.setdefault(_letter, []).append(_symbol)
+del _symbol, _letter
+
+MAX_VARIANTS = 8  # default cap on leet_variants() and spelling_variants() output
+
 def normalize(password: str, leetspeak: bool = True) -> str:
     """
     Normalize a password string for analysis.
@@ -31,7 +50,102 @@ def normalize(password: str, leetspeak: bool = True) -> str:
     pw = password.lower()  # lowercase only
 
     if leetspeak:
-        for key, val in LEET_MAP.items():
-            pw = pw.replace(key, val)
+        pw = pw.translate(LEET_TABLE)
+
+    return pw
+
+def leet_variants(password: str, max_variants: int = MAX_VARIANTS, keep_literal: bool = False) -> tuple:
+    """
+    Enumerate alternative normalizations of a password.
+
+    The first variant is always normalize(password). Further variants swap
+    ambiguous characters to their other readings (e.g. "1" -> "l"), fewest
+    swaps first, so the output stays small for any input length.
+
+    Parameters:
+        password (str): The password to normalize.
+        max_variants (int): Maximum number of variants returned.
+        keep_literal (bool): Also treat each leetspeak character as possibly
+            literal (e.g. the "1" in "password1"); the plain lowercased
+            password is then the second variant.
+
+    Returns:
+        tuple: Unique normalized variants, most likely first.
+
+    Not memoized here: a module-level cache would keep recent plaintext
+    passwords in memory. AnalysisContext memoizes them per password instead.
+    """
+    if not isinstance(password, str):
+        return ("",)
+
+    lowered = password.lower()
+    primary = lowered.translate(LEET_TABLE)
+    variants = [primary]
+    if max_variants <= 1:
+        return tuple(variants)
+
+    if keep_literal and lowered != primary:
+        variants.append(lowered)
+
+    # Readings other than the primary one, per ambiguous position
+    choices = {}
+    for i, ch in enumerate(lowered):
+        options = list(LEET_ALTERNATIVES.get(ch, ()))
+        if keep_literal and ch in LEET_MAP:
+            options.append(ch)
+        if options:
+            choices[i] = options
+
+    seen = set(variants)
+    positions = list(choices)
+    for swaps in range(1, len(positions) + 1):
+        for chosen in combinations(positions, swaps):
+            for replacement in product(*(choices[i] for i in chosen)):
+                chars = list(primary)
+                for i, ch in zip(chosen, replacement):
+                    chars[i] = ch
+                variant = "".join(chars)
+                if variant not in seen:
+                    seen.add(variant)
+                    variants.append(variant)
+                    if len(variants) >= max_variants:
+                        return tuple(variants)
+    return tuple(variants)
+
+def spelling_variants(word: str, max_variants: int = MAX_VARIANTS) -> tuple:
+    """
+    Enumerate ways a user might spell a dictionary word as a password.
+
+    The inverse of normalize(): case variants (as given, Capitalized, UPPER)
+    and leetspeak spellings that replace every replaceable letter, each
+    spelling also Capitalized. normalize() maps every leetspeak spelling
+    back to the lowercased word.
+
+    Parameters:
+        word (str): A (normally lowercase) dictionary word or blocklist entry.
+        max_variants (int): Maximum number of variants returned.
+
+    Returns:
+        tuple: Unique spellings, the word itself first.
+    """
+    if not isinstance(word, str):
+        return ("",)
+
+    candidates = [word, word.capitalize(), word.upper()]
+    lowered = word.lower()
+    depth = max((len(LEET_SPELLINGS[ch]) for ch in set(lowered) if ch in LEET_SPELLINGS), default=0)
+    for choice in range(depth):
+        # Letters with fewer spellings keep their last one
+        leet = "".join(
+            LEET_SPELLINGS[ch][min(choice, len(LEET_SPELLINGS[ch]) - 1)] if ch in LEET_SPELLINGS else ch
+            for ch in lowered
+        )
+        candidates.extend((leet, leet.capitalize()))
 
-    return pw
\ No newline at end of file
+    variants = []
+    for candidate in candidates:
+        if candidate not in variants:
+            variants.append(candidate)
+            if len(variants) >= max_variants:
+                break
+    return tuple(variants)
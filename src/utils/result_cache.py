@@ -0,0 +1,94 @@
+"""
+Result Cache
+------------
+Bounded in-process LRU cache with per-entry expiry for analysis results.
+
+Keys are HMAC-SHA256 digests of the password under a per-process secret,
+so plaintext passwords never sit in the cache keys. Entries are tagged with
+a data version (see AnalyzerEngine.generation); when the version changes
+the whole cache is dropped.
+"""
+
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResultCache:
+    def __init__(self, max_size: int = 10000, ttl: float = 300.0, secret: bytes = None):
+        """
+        max_size: maximum number of cached results; least recently used are evicted.
+        ttl: seconds an entry stays valid.
+        secret: HMAC key. Defaults to a random per-process key.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._secret = secret or secrets.token_bytes(32)
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._version = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, password: str) -> bytes:
+        return hmac.new(self._secret, password.encode("utf-8", errors="surrogatepass"), hashlib.sha256).digest()
+
+    def _check_version(self, version):
+        # Caller holds the lock
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+
+    def get(self, password: str, version=None):
+        """Return the cached value for password, or None on a miss."""
+        key = self.key(password)
+        now = time.monotonic()
+
+        with self._lock:
+            self._check_version(version)
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, password: str, value, version=None):
+        key = self.key(password)
+        expires_at = time.monotonic() + self.ttl
+
+        with self._lock:
+            self._check_version(version)
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
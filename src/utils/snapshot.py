@@ -0,0 +1,141 @@
+"""
+Snapshot Cache
+--------------
+Pickled copies of parsed data structures (name indexes, blocklist sets),
+so a fresh process can skip re-parsing the text files they were built from.
+
+Each snapshot records the size, mtime and SHA-256 of its source files plus
+the build parameters. A snapshot is used when every source still has the
+recorded size and mtime; if only the mtime changed (e.g. after a checkout)
+the file is hashed and the snapshot is still used if the content matches,
+and rewritten with the new mtime so later starts skip the hash. Anything
+else rebuilds the data and rewrites the snapshot. key() names a snapshot
+after its sources, for data that can be built from more than one file.
+
+Snapshots are unpickled, so SNAPSHOT_DIR must only be writable by the
+service itself. Set the PASSWORD_ANALYZER_SNAPSHOT_DIR environment variable
+to move it, or to an empty string to disable snapshots.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+FORMAT_VERSION = 1
+
+DEFAULT_SNAPSHOT_DIR = Path(__file__).resolve().parents[2] / "data" / "snapshots"
+SNAPSHOT_DIR = os.environ.get("PASSWORD_ANALYZER_SNAPSHOT_DIR", str(DEFAULT_SNAPSHOT_DIR))
+
+
+def file_digest(path) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def key(name: str, sources: list) -> str:
+    """Snapshot name for `name` built from these particular source paths."""
+    paths = "\0".join(os.path.abspath(path) for path in sources)
+    return f"{name}-{hashlib.sha256(paths.encode()).hexdigest()[:16]}"
+
+
+def _source_info(path) -> dict:
+    stat = os.stat(path)
+    return {"path": os.path.abspath(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _check_sources(recorded: list, sources: list):
+    """
+    Compare recorded source entries against the files on disk.
+
+    Returns:
+        (current, touched): whether the snapshot is still valid, and whether a
+        source had to be hashed because only its mtime changed.
+    """
+    if len(recorded) != len(sources):
+        return False, False
+    touched = False
+    for entry, path in zip(recorded, sources):
+        info = _source_info(path)
+        if entry["path"] != info["path"] or entry["size"] != info["size"]:
+            return False, False
+        if entry["mtime_ns"] != info["mtime_ns"]:
+            if entry["sha256"] != file_digest(path):
+                return False, False
+            touched = True
+    return True, touched
+
+
+def _load(name: str, sources: list, params, snapshot_dir):
+    # (data, touched), with data None if the snapshot is missing or out of date
+    try:
+        with open(Path(snapshot_dir) / f"{name}.pickle", "rb") as f:
+            header = pickle.load(f)
+            if header.get("version") != FORMAT_VERSION or header.get("params") != params:
+                return None, False
+            current, touched = _check_sources(header.get("sources", []), sources)
+            if not current:
+                return None, False
+            return pickle.load(f), touched
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, KeyError,
+            TypeError, ValueError):
+        return None, False
+
+
+def load(name: str, sources: list, params=None, snapshot_dir=None):
+    """Return the snapshotted data for `name`, or None if missing or out of date."""
+    snapshot_dir = SNAPSHOT_DIR if snapshot_dir is None else snapshot_dir
+    if not snapshot_dir:
+        return None
+    return _load(name, sources, params, snapshot_dir)[0]
+
+
+def save(name: str, sources: list, data, params=None, snapshot_dir=None) -> bool:
+    """Write a snapshot atomically; returns False if it couldn't be written."""
+    snapshot_dir = SNAPSHOT_DIR if snapshot_dir is None else snapshot_dir
+    if not snapshot_dir:
+        return False
+    try:
+        recorded = [dict(_source_info(path), sha256=file_digest(path)) for path in sources]
+        header = {"version": FORMAT_VERSION, "params": params, "sources": recorded}
+
+        import tempfile  # only needed when writing, which most starts skip
+
+        os.makedirs(snapshot_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=snapshot_dir, prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, Path(snapshot_dir) / f"{name}.pickle")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        return False
+    return True
+
+
+def load_or_build(name: str, sources: list, build, params=None, snapshot_dir=None):
+    """
+    Return snapshotted data if current, else build() it and save a snapshot.
+
+    Parameters:
+        name (str): Snapshot file name (one snapshot per name).
+        sources (list): Paths of the files the data is parsed from.
+        build (callable): Parses the sources; its result must be picklable.
+        params: Build parameters; a snapshot built with other params is ignored.
+        snapshot_dir: Overrides SNAPSHOT_DIR ("" disables snapshots).
+    """
+    snapshot_dir = SNAPSHOT_DIR if snapshot_dir is None else snapshot_dir
+    data, touched = _load(name, sources, params, snapshot_dir) if snapshot_dir else (None, False)
+    if data is None:
+        data = build()
+        save(name, sources, data, params, snapshot_dir)
+    elif touched:
+        # Record the new mtimes so the next start doesn't hash the sources again
+        save(name, sources, data, params, snapshot_dir)
+    return data
@@ -4,16 +4,28 @@ Password Analyzer - Command Line Demo
 
 This script demonstrates the password analysis capabilities
 by analyzing sample passwords and displaying detailed results.
+
+Audit mode streams a newline-delimited password file (or stdin with "-")
+and writes one JSONL/CSV record per password:
+
+    python test_score.py --audit dump.txt --output results.jsonl
+    cat dump.txt | python test_score.py --audit - --format csv > results.csv
+    python test_score.py --audit dump.txt --output results.jsonl --resume-from 123456
+
+Hash audit mode checks a dump of SHA-1 or NTLM hashes ("hash", "account:hash"
+or pwdump lines) against the blocklists and their common spellings, writing
+one JSONL record per account with a blocklisted password:
+
+    python test_score.py --hash-audit ntds.txt --output matches.jsonl
 """
 
-from src.analyzer import (
-    length_checker,
-    entropy_calculator,
-    pattern_detector,
-    frequency_checker,
-    name_detector,
-    score_aggregator
-)
+import argparse
+import os
+import sys
+
+from src.analyzer import audit, hash_audit
+from src.analyzer.engine import get_engine
+from src.analyzer.parallel import AnalyzerPool
 
 def analyze_password(password: str) -> dict:
     """
@@ -25,37 +37,8 @@ def analyze_password(password: str) -> dict:
     Returns:
         dict: Complete analysis results
     """
-    # Run all analysis modules
-    length_res = length_checker.evaluate([password])
-    entropy_res = entropy_calculator.evaluate([password])
-    patterns_res = pattern_detector.evaluate([password])[0]
-    freq_res = frequency_checker.evaluate([password])[0]
-    names_res = name_detector.NameDetector().analyze(password)
-
-    # Convert to strength scores (0-1 scale)
-    results = {
-        "length": length_res[password],
-        "entropy": entropy_res[password],
-        "patterns": 1 - min(patterns_res["pattern_score"] / 5, 1),  # Convert penalty to strength
-        "frequency": 1 - freq_res["frequency_score"],  # Convert penalty to strength
-        "names": 1 - min(names_res["name_score"] / 5, 1)  # Convert penalty to strength
-    }
-
-    # Get final aggregated result
-    final_result = score_aggregator.combine_results(results)
-
-    return {
-        'password': password,
-        'final_score': final_result['final_score'],
-        'components': final_result['components'],
-        'raw_data': {
-            'length': length_res[password],
-            'entropy': entropy_res[password],
-            'patterns': patterns_res,
-            'frequency': freq_res,
-            'names': names_res
-        }
-    }
+    # Reuse the process-wide engine so data files are only loaded once
+    return get_engine().analyze(password)
 
 def print_analysis(result: dict):
     """Pretty print analysis results."""
@@ -82,7 +65,10 @@ def print_analysis(result: dict):
     print(f"  Entropy: {raw['entropy']:.2f} bits")
     print(f"  Pattern Score: {raw['patterns']['pattern_score']:.2f} (lower is better)")
     print(f"  Frequency Score: {raw['frequency']['frequency_score']:.2f} (lower is better)")
-    print(f"  Name Matches: {raw['names']['name_score']} detected names")
+    if raw['names'] is not None:
+        print(f"  Name Matches: {raw['names']['name_score']} detected names")
+    if result['skipped']:
+        print(f"  Skipped: {', '.join(result['skipped'])} (result already decided)")
 
     # Breach warning
     if raw['frequency']['frequency_score'] > 0.5:
@@ -90,8 +76,84 @@ def print_analysis(result: dict):
 
     print(f"{'='*60}\n")
 
+def run_audit(args):
+    """Stream a password dump through the analyzers and write results incrementally."""
+    stream = sys.stdin.buffer if args.audit == "-" else open(args.audit, "rb")
+    # Append when resuming so earlier results are kept
+    mode = "a" if args.resume_from else "w"
+    if args.resume_from and args.output != "-" and os.path.exists(args.output):
+        # Drop a record the interruption left half written
+        audit.trim_partial_record(args.output)
+    out = sys.stdout if args.output == "-" else open(args.output, mode, encoding="utf-8", newline="")
+
+    # A pool exposes the same analyze_batch() as the engine
+    pool = AnalyzerPool(args.workers) if args.workers != 1 else None
+    analyzer = pool or get_engine()
+    chunk_size = args.chunk_size * (pool.workers if pool else 1)
+
+    try:
+        audit.run_audit(
+            stream, out, analyzer,
+            fmt=args.format,
+            start_offset=args.resume_from,
+            chunk_size=chunk_size,
+            redact=args.redact,
+        )
+    except KeyboardInterrupt:
+        if pool is not None:
+            pool.terminate()
+            pool = None
+        return 130
+    finally:
+        if pool is not None:
+            pool.close()
+        if stream is not sys.stdin.buffer:
+            stream.close()
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+def run_hash_audit(args):
+    """Join a hash dump against the blocklist hash indexes (built on first use)."""
+    stream = sys.stdin if args.hash_audit == "-" else open(args.hash_audit, "r", encoding="utf-8", errors="replace")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    indexes = hash_audit.open_indexes()
+    try:
+        summary = hash_audit.run_hash_audit(stream, out, indexes)
+    finally:
+        for index in indexes.values():
+            index.close()
+        if stream is not sys.stdin:
+            stream.close()
+        if out is not sys.stdout:
+            out.close()
+    for tier, count in summary["by_list"].items():
+        print(f"{tier}: {count}", file=sys.stderr)
+    return 0
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Password Analyzer command line")
+    parser.add_argument("--audit", metavar="FILE", help="newline-delimited passwords to audit ('-' for stdin)")
+    parser.add_argument("--hash-audit", metavar="FILE",
+                        help="SHA-1/NTLM hash dump to check against the blocklists ('-' for stdin)")
+    parser.add_argument("--output", default="-", help="where to write results (default: stdout)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument("--resume-from", type=int, default=0, metavar="OFFSET",
+                        help="byte offset reported by an interrupted audit")
+    parser.add_argument("--chunk-size", type=int, default=audit.CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="analyzer processes (default: 1; 0 = one per CPU)")
+    parser.add_argument("--redact", action="store_true", help="omit plaintext passwords from the output")
+    return parser.parse_args(argv)
+
 def main():
     """Main demo function."""
+    args = parse_args()
+    if args.audit:
+        sys.exit(run_audit(args))
+    if args.hash_audit:
+        sys.exit(run_hash_audit(args))
+
     print("🔐 Password Analyzer - Command Line Demo")
     print("Analyzing sample passwords...\n")
 
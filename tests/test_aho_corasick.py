@@ -0,0 +1,27 @@
+import unittest
+from src.utils.aho_corasick import AhoCorasick
+
+class TestAhoCorasick(unittest.TestCase):
+
+    def setUp(self):
+        self.automaton = AhoCorasick(["he", "she", "his", "hers", "he"])
+
+    def test_duplicates_ignored(self):
+        self.assertEqual(self.automaton.words, ["he", "she", "his", "hers"])
+
+    def test_iter_matches_finds_every_occurrence(self):
+        words = self.automaton.words
+        matches = sorted((end, words[i]) for end, i in self.automaton.iter_matches("ushers"))
+        self.assertEqual(matches, [(3, "he"), (3, "she"), (5, "hers")])
+
+    def test_iter_longest_reports_one_word_per_position(self):
+        words = self.automaton.words
+        matches = [(end, words[i]) for end, i in self.automaton.iter_longest("ushers")]
+        self.assertEqual(matches, [(3, "she"), (5, "hers")])
+
+    def test_no_matches(self):
+        self.assertEqual(list(self.automaton.iter_matches("xyz")), [])
+        self.assertEqual(list(AhoCorasick([]).iter_matches("anything")), [])
+
+if __name__ == "__main__":
+    unittest.main()
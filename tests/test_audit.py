@@ -0,0 +1,108 @@
+import unittest
+import io
+import json
+import os
+import tempfile
+from src.analyzer import audit
+from src.analyzer.engine import get_engine
+
+class TestAudit(unittest.TestCase):
+
+    def setUp(self):
+        self.data = b"password\r\n\nmaria2024\nX9$kL2mP8qR5nT1wV4yZ\nletmein\n"
+        self.engine = get_engine()
+
+    def run_audit(self, stream, fmt="jsonl", **kwargs):
+        out = io.StringIO()
+        summary = audit.run_audit(stream, out, self.engine, fmt=fmt, progress=None, **kwargs)
+        return summary, out.getvalue()
+
+    def test_read_passwords_offsets(self):
+        entries = list(audit.read_passwords(io.BytesIO(self.data)))
+        self.assertEqual([pw for _, pw in entries], ["password", "maria2024", "X9$kL2mP8qR5nT1wV4yZ", "letmein"])
+        self.assertEqual(entries[0][0], len(b"password\r\n"))
+        self.assertEqual(entries[-1][0], len(self.data))
+
+    def test_chunked(self):
+        self.assertEqual(list(audit.chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_jsonl_output(self):
+        summary, output = self.run_audit(io.BytesIO(self.data), chunk_size=2)
+        records = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual(summary["processed"], 4)
+        self.assertEqual(summary["offset"], len(self.data))
+        self.assertEqual([r["password"] for r in records], ["password", "maria2024", "X9$kL2mP8qR5nT1wV4yZ", "letmein"])
+        self.assertEqual(records[0]["final_score"], round(self.engine.analyze("password")["final_score"], 4))
+
+    def test_csv_output_and_redaction(self):
+        _, output = self.run_audit(io.BytesIO(self.data), fmt="csv", redact=True)
+        lines = output.splitlines()
+        self.assertEqual(lines[0].split(","), audit.CSV_FIELDS)
+        self.assertEqual(len(lines), 5)
+        self.assertNotIn("maria2024", output)
+
+    def test_resume_from_offset(self):
+        """Resuming from a reported offset yields exactly the remaining records"""
+        _, full = self.run_audit(io.BytesIO(self.data))
+        records = [json.loads(line) for line in full.splitlines()]
+
+        resume_at = records[1]["offset"]
+        summary, rest = self.run_audit(io.BytesIO(self.data), start_offset=resume_at)
+        self.assertEqual(summary["processed"], 2)
+        self.assertEqual([json.loads(line) for line in rest.splitlines()], records[2:])
+
+    def test_resume_on_unseekable_stream(self):
+        class Pipe(io.BytesIO):
+            def seekable(self):
+                return False
+
+        _, full = self.run_audit(io.BytesIO(self.data))
+        resume_at = json.loads(full.splitlines()[0])["offset"]
+        summary, _ = self.run_audit(Pipe(self.data), start_offset=resume_at)
+        self.assertEqual(summary["processed"], 3)
+
+    def test_overlong_line_is_skipped(self):
+        """Lines over the length limit are reported, not analyzed"""
+        data = b"password\n" + b"a" * 5000 + b"\nletmein\n"
+        summary, output = self.run_audit(io.BytesIO(data), max_length=100)
+        records = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual(summary["processed"], 2)
+        self.assertEqual(summary["skipped"], 1)
+        self.assertIsNone(records[1]["password"])
+        self.assertIn("error", records[1])
+        self.assertEqual(records[1]["offset"], len(b"password\n") + 5001)
+        self.assertEqual(records[2]["password"], "letmein")
+
+    def test_interrupt_mid_chunk_reports_last_written_offset(self):
+        """Resuming after an interrupt inside a chunk neither repeats nor loses records"""
+        _, full = self.run_audit(io.BytesIO(self.data))
+        records = [json.loads(line) for line in full.splitlines()]
+
+        class InterruptingOutput(io.StringIO):
+            def write(self, text):
+                if self.getvalue().count("\n") == 2:
+                    raise KeyboardInterrupt
+                return super().write(text)
+
+        out, progress = InterruptingOutput(), io.StringIO()
+        with self.assertRaises(KeyboardInterrupt):
+            audit.run_audit(io.BytesIO(self.data), out, self.engine, progress=progress)
+        self.assertIn(f"--resume-from {records[1]['offset']}", progress.getvalue())
+
+        _, rest = self.run_audit(io.BytesIO(self.data), start_offset=records[1]["offset"])
+        self.assertEqual(out.getvalue() + rest, full)
+
+    def test_trim_partial_record(self):
+        with tempfile.NamedTemporaryFile("wb", delete=False) as f:
+            f.write(b'{"offset": 10}\n{"offset": 2')
+        self.addCleanup(os.remove, f.name)
+        self.assertEqual(audit.trim_partial_record(f.name), len(b'{"offset": 2'))
+        with open(f.name, "rb") as f:
+            self.assertEqual(f.read(), b'{"offset": 10}\n')
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            self.run_audit(io.BytesIO(self.data), fmt="xml")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import hashlib
+import unittest
+import tempfile
+import os
+from src.analyzer.breach_index import BreachIndex, build_index, sha1_hex
+
+class TestBreachIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        top = os.path.join(self.tmpdir.name, "top.txt")
+        big = os.path.join(self.tmpdir.name, "big.txt")
+        with open(top, "w", encoding="utf-8") as f:
+            f.write("password\n123456\nQwerty\n")
+        with open(big, "w", encoding="utf-8") as f:
+            f.write("letmein\npassword\n\nsunshine\nmañana\n")
+
+        self.index_dir = os.path.join(self.tmpdir.name, "breach")
+        self.count = build_index([top, big], self.index_dir)
+        self.index = BreachIndex(self.index_dir, cache_size=4)
+
+    def tearDown(self):
+        self.index.close()
+        self.tmpdir.cleanup()
+
+    def test_counts(self):
+        self.assertEqual(self.count, 6)
+        self.assertEqual(self.index.lookup("password"), 2)  # in both lists
+        self.assertEqual(self.index.lookup("letmein"), 1)
+        self.assertEqual(self.index.lookup("Qwerty"), 1)
+        self.assertEqual(self.index.lookup("mañana"), 1)
+        self.assertIn("sunshine", self.index)
+
+    def test_missing_passwords(self):
+        for pw in ["", "passwor", "password1", "zzzzzz"]:
+            self.assertEqual(self.index.lookup(pw), 0, msg=pw)
+
+    def test_range_matches_api_shape(self):
+        """A range is "SUFFIX:COUNT" lines for the 35 hex digits after the prefix"""
+        digest = sha1_hex("password")
+        lines = self.index.range(digest[:5]).split("\r\n")
+        self.assertIn(f"{digest[5:]}:2", lines)
+        for line in filter(None, lines):
+            suffix, count = line.split(":")
+            self.assertEqual(len(suffix), 35)
+            self.assertTrue(int(count) > 0)
+        self.assertEqual(self.index.range("00000"), "")  # no bundled entry hashes to this prefix
+        with self.assertRaises(ValueError):
+            self.index.range("ABC")
+
+    def test_hot_ranges_cached(self):
+        self.index.lookup("password")
+        self.index.lookup("password")
+        info = self.index.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_hashes_exact_bytes_like_public_api(self):
+        """Lookups hash the password as given, so other capitalizations miss"""
+        self.assertEqual(self.index.lookup("QWERTY"), 0)
+        self.assertEqual(self.index.lookup_hash(hashlib.sha1(b"Qwerty").hexdigest()), 1)
+
+    def test_lowercase_index(self):
+        lower_dir = os.path.join(self.tmpdir.name, "lower")
+        source = os.path.join(self.tmpdir.name, "lower.txt")
+        with open(source, "w", encoding="utf-8") as f:
+            f.write("Dragon\n")
+        build_index([source], lower_dir, lowercase=True)
+        index = BreachIndex(lower_dir)
+        self.assertEqual(index.lookup("Dragon"), 1)
+        self.assertEqual(index.lookup("DRAGON"), 1)
+        index.close()
+
+    def test_build_spills_to_buckets_and_cleans_up(self):
+        """Digests are sorted per bucket; counts still merge across sources and buckets"""
+        source = os.path.join(self.tmpdir.name, "many.txt")
+        passwords = [f"pw{i}" for i in range(2000)]
+        with open(source, "w", encoding="utf-8") as f:
+            f.write("\n".join(passwords + passwords[:10]) + "\n")
+        many_dir = os.path.join(self.tmpdir.name, "many")
+        self.assertEqual(build_index([source], many_dir), 2000)
+        index = BreachIndex(many_dir)
+        self.assertEqual(index.lookup("pw5"), 2)
+        self.assertEqual(index.lookup("pw1999"), 1)
+        index.close()
+        self.assertEqual(sorted(name.split("-")[0] for name in os.listdir(many_dir)), ["directory.bin", "ranges"])
+
+    def test_rebuild_swaps_directory_and_ranges_together(self):
+        source = os.path.join(self.tmpdir.name, "new.txt")
+        with open(source, "w", encoding="utf-8") as f:
+            f.write("dragon\ndragon\n")
+        with open(os.path.join(self.index_dir, "directory.bin"), "rb") as f:
+            old_directory = f.read()
+
+        build_index([source], self.index_dir)
+        self.assertEqual(self.index.lookup("password"), 2)  # an open index keeps its own files
+        rebuilt = BreachIndex(self.index_dir)
+        self.assertEqual((rebuilt.lookup("dragon"), rebuilt.lookup("password")), (2, 0))
+        rebuilt.close()
+        self.assertEqual(len([name for name in os.listdir(self.index_dir) if name.startswith("ranges-")]), 1)
+
+        # A directory read before the rebuild names ranges that are gone, so it
+        # can't be paired with the new ones
+        with open(os.path.join(self.index_dir, "directory.bin"), "wb") as f:
+            f.write(old_directory)
+        with self.assertRaises(FileNotFoundError):
+            BreachIndex(self.index_dir)
+
+    def test_rejects_other_files(self):
+        other = os.path.join(self.tmpdir.name, "other")
+        os.makedirs(other)
+        with open(os.path.join(other, "directory.bin"), "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            BreachIndex(other)
+
+if __name__ == "__main__":
+    unittest.main()
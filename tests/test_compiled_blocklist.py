@@ -0,0 +1,61 @@
+import unittest
+import tempfile
+import os
+from src.analyzer.compiled_blocklist import compile_blocklists, MappedBlocklist
+
+class TestCompiledBlocklist(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        top = os.path.join(self.tmpdir.name, "top.txt")
+        big = os.path.join(self.tmpdir.name, "big.txt")
+        with open(top, "w", encoding="utf-8") as f:
+            f.write("password\n123456\nQwerty\n")
+        with open(big, "w", encoding="utf-8") as f:
+            f.write("letmein\npassword\n\nsunshine\nmañana\n")
+
+        self.path = os.path.join(self.tmpdir.name, "blocklists.bin")
+        self.count = compile_blocklists([("top_1k", top), ("rockyou", big)], self.path)
+        self.blocklist = MappedBlocklist(self.path)
+
+    def tearDown(self):
+        self.blocklist.close()
+        self.tmpdir.cleanup()
+
+    def test_entries_deduplicated(self):
+        self.assertEqual(self.count, 6)
+        self.assertEqual(len(self.blocklist), 6)
+        self.assertEqual(self.blocklist.tiers, ["top_1k", "rockyou"])
+
+    def test_lookup_tiers(self):
+        """Entries in both lists keep the more common tier"""
+        self.assertEqual(self.blocklist.lookup("password"), "top_1k")
+        self.assertEqual(self.blocklist.lookup("qwerty"), "top_1k")
+        self.assertEqual(self.blocklist.lookup("letmein"), "rockyou")
+        self.assertEqual(self.blocklist.lookup("mañana"), "rockyou")
+
+    def test_ranks(self):
+        """Ranks follow list order, most common list first"""
+        ranks = [self.blocklist.rank(e) for e in ["password", "123456", "qwerty", "letmein", "sunshine", "mañana"]]
+        self.assertEqual(ranks, [0, 1, 2, 3, 4, 5])
+        self.assertEqual([self.blocklist.tier(r) for r in (0, 2, 3, 5)], ["top_1k", "top_1k", "rockyou", "rockyou"])
+        self.assertIsNone(self.blocklist.rank("zzzzzz"))
+
+    def test_ranked_entries(self):
+        self.assertEqual(self.blocklist.ranked_entries(), ["password", "123456", "qwerty", "letmein", "sunshine", "mañana"])
+        self.assertEqual(self.blocklist.ranked_entries(2), ["password", "123456"])
+
+    def test_missing_entries(self):
+        for pw in ["", "a", "passwor", "password1", "zzzzzz"]:
+            self.assertIsNone(self.blocklist.lookup(pw), msg=pw)
+            self.assertNotIn(pw, self.blocklist)
+
+    def test_rejects_other_files(self):
+        other = os.path.join(self.tmpdir.name, "other.bin")
+        with open(other, "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            MappedBlocklist(other)
+
+if __name__ == "__main__":
+    unittest.main()
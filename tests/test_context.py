@@ -0,0 +1,50 @@
+import unittest
+from collections import Counter
+from unittest import mock
+
+from src.analyzer import context, entropy_calculator, frequency_checker, pattern_detector
+from src.analyzer.context import AnalysisContext, as_context
+from src.analyzer.engine import AnalyzerEngine
+from src.utils import normalization
+
+class TestAnalysisContext(unittest.TestCase):
+
+    def test_derived_values(self):
+        ctx = AnalysisContext("P@ss1")
+        self.assertEqual(ctx.lowered, "p@ss1")
+        self.assertEqual(ctx.variants, normalization.leet_variants("P@ss1"))
+        self.assertEqual(ctx.literal_variants, normalization.leet_variants("P@ss1", keep_literal=True))
+        self.assertEqual(ctx.histogram, Counter("P@ss1"))
+        self.assertEqual(len(ctx), 5)
+
+    def test_values_computed_once(self):
+        ctx = AnalysisContext("password")
+        self.assertIs(ctx.variants, ctx.variants)
+        self.assertIs(ctx.histogram, ctx.histogram)
+
+    def test_as_context(self):
+        ctx = AnalysisContext("abc")
+        self.assertIs(as_context(ctx), ctx)
+        self.assertEqual(as_context("abc").password, "abc")
+        self.assertEqual(as_context(None).password, "")
+
+    def test_repr_hides_password(self):
+        self.assertNotIn("hunter2", repr(AnalysisContext("hunter2")))
+
+    def test_evaluate_accepts_contexts(self):
+        passwords = ["password1", "qwerty123", "Tr0ub4dor&3"]
+        contexts = [AnalysisContext(pw) for pw in passwords]
+        self.assertEqual(frequency_checker.evaluate(contexts), frequency_checker.evaluate(passwords))
+        self.assertEqual(pattern_detector.evaluate(contexts), pattern_detector.evaluate(passwords))
+        self.assertEqual(entropy_calculator.evaluate(contexts), entropy_calculator.evaluate(passwords))
+
+    def test_engine_normalizes_each_password_once(self):
+        engine = AnalyzerEngine().load()
+        with mock.patch.object(context.normalization, "leet_variants",
+                               wraps=normalization.leet_variants) as leet_variants:
+            engine.analyze("Al3x2024")
+        # One call for the leet variants, one for the literal-aware variants
+        self.assertEqual(leet_variants.call_count, 2)
+
+if __name__ == "__main__":
+    unittest.main()
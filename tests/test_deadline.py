@@ -0,0 +1,20 @@
+import time
+import unittest
+from src.utils.deadline import Deadline
+
+class TestDeadline(unittest.TestCase):
+
+    def test_remaining(self):
+        deadline = Deadline(60)
+        self.assertFalse(deadline.expired())
+        self.assertGreater(deadline.remaining(), 59)
+        self.assertAlmostEqual(Deadline.from_ms(1500).budget, 1.5)
+
+    def test_expired(self):
+        deadline = Deadline.from_ms(1)
+        time.sleep(0.01)
+        self.assertTrue(deadline.expired())
+        self.assertEqual(deadline.remaining(), 0.0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+import unittest
+import tempfile
+import threading
+import os
+from unittest import mock
+from src.analyzer import engine, score_aggregator
+from src.analyzer.engine import AnalyzerEngine
+from src.utils.deadline import Deadline
+
+
+class TestAnalyzerEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, mode="w", encoding="utf-8")
+        self.temp_file.write("Alice\nBob\nMaria\n")
+        self.temp_file.close()
+
+        self.engine = AnalyzerEngine(name_file_path=self.temp_file.name)
+
+    def tearDown(self):
+        os.remove(self.temp_file.name)
+
+    def test_load_records_timings(self):
+        self.engine.load()
+        self.assertTrue(self.engine.is_loaded)
+        for key in ("names", "blocklists", "patterns"):
+            self.assertIn(key, self.engine.load_timings)
+            self.assertGreaterEqual(self.engine.load_timings[key], 0.0)
+
+    def test_names_loaded_once_across_threads(self):
+        """Concurrent first calls should construct the NameDetector exactly once"""
+        with mock.patch.object(engine, "NameDetector", wraps=engine.NameDetector) as detector_cls:
+            threads = [threading.Thread(target=self.engine.analyze, args=("alice123",)) for _ in range(16)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertEqual(detector_cls.call_count, 1)
+
+    def test_analyze_result_shape(self):
+        result = self.engine.analyze("maria2024")
+        self.assertEqual(result["password"], "maria2024")
+        self.assertEqual(
+            list(result["components"]),
+            ["length", "entropy", "patterns", "frequency", "names"]
+        )
+        self.assertIn("maria", result["raw_data"]["names"]["matched_names"])
+        self.assertGreaterEqual(result["final_score"], 0.0)
+        self.assertLessEqual(result["final_score"], 1.0)
+
+    def test_analyze_batch_preserves_order(self):
+        passwords = ["bob", "password", "maria2024", "bob"]
+        results = self.engine.analyze_batch(passwords)
+        self.assertEqual([r["password"] for r in results], passwords)
+        for pw, result in zip(passwords, results):
+            self.assertEqual(result, self.engine.analyze(pw))
+
+    def test_weights_change_generation_and_score(self):
+        before = self.engine.analyze("maria2024")
+        generation = self.engine.generation
+        self.engine.set_weights({"names": 10})
+        self.assertGreater(self.engine.generation, generation)
+        self.assertNotEqual(self.engine.analyze("maria2024")["final_score"], before["final_score"])
+
+    def test_reload_if_stale_detects_changed_names(self):
+        self.engine.load()
+        generation = self.engine.generation
+        self.assertFalse(self.engine.reload_if_stale())
+
+        with open(self.temp_file.name, "a", encoding="utf-8") as f:
+            f.write("Zebulon\n")
+        self.engine._last_stale_check = 0.0
+        self.assertTrue(self.engine.reload_if_stale())
+        self.assertGreater(self.engine.generation, generation)
+        self.assertIn("zebulon", self.engine.analyze("zebulon1")["raw_data"]["names"]["matched_names"])
+
+    def test_reload_if_stale_reopens_rebuilt_breach_index(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "corpus.txt")
+            index_dir = os.path.join(tmp, "breach")
+            with open(source, "w", encoding="utf-8") as f:
+                f.write("dragon\n")
+            with mock.patch.object(engine.breach_index, "DEFAULT_INDEX_DIR", index_dir):
+                self.engine.load()
+                self.assertIsNone(self.engine.breach)
+
+                engine.breach_index.build_index([source], index_dir)
+                self.engine._last_stale_check = 0.0
+                self.assertTrue(self.engine.reload_if_stale())
+                self.assertEqual(self.engine.breach.lookup("dragon"), 1)
+                self.engine.breach.close()
+
+    def test_top_password_skips_name_scan(self):
+        self.engine.load()
+        with mock.patch.object(self.engine.name_detector, "evaluate") as evaluate:
+            result = self.engine.analyze("password")
+        evaluate.assert_not_called()
+        self.assertEqual(result["skipped"], ["names"])
+        self.assertIsNone(result["raw_data"]["names"])
+        self.assertEqual(result["components"]["names"], 1.0)
+        self.assertEqual(self.engine.analyze("maria2024")["skipped"], [])
+
+    def test_skipping_names_keeps_verdict(self):
+        """The name scan is only skipped when its result couldn't change the verdict"""
+        full = AnalyzerEngine(name_file_path=self.temp_file.name)
+        full.registry.get("names").skip_if = None
+        passwords = ["password", "dragon", "michael", "maria", "alice", "maria1", "playstation", "penetration"]
+        results = self.engine.analyze_batch(passwords)
+        for result, expected in zip(results, full.analyze_batch(passwords)):
+            pw = result["password"]
+            self.assertEqual(score_aggregator.strength_label(result["final_score"]),
+                             score_aggregator.strength_label(expected["final_score"]), msg=pw)
+            if expected["raw_data"]["names"]["name_score"] == 0:
+                self.assertEqual(result["final_score"], expected["final_score"], msg=pw)
+            else:
+                # Scored as if no names were found: never below the full score
+                self.assertGreaterEqual(result["final_score"], expected["final_score"], msg=pw)
+        self.assertEqual([r["skipped"] for r in results], [["names"]] * 6 + [[], []])
+
+    def test_batch_runs_name_scan_only_where_needed(self):
+        self.engine.load()
+        with mock.patch.object(self.engine.name_detector, "evaluate",
+                               wraps=self.engine.name_detector.evaluate) as evaluate:
+            results = self.engine.analyze_batch(["password", "maria2024", "qwerty"])
+        evaluate.assert_called_once()
+        self.assertEqual([ctx.password for ctx in evaluate.call_args[0][0]], ["maria2024"])
+        self.assertEqual([r["skipped"] for r in results], [["names"], [], ["names"]])
+
+    def test_custom_analyzer(self):
+        seen = []
+        def run(contexts):
+            seen.extend(ctx.password for ctx in contexts)
+            return [0.5 for _ in contexts]
+        self.engine.registry.register("custom", run, strength=float, cost=0)
+        result = self.engine.analyze("maria2024")
+        self.assertEqual(seen, ["maria2024"])
+        self.assertEqual(result["components"]["custom"], 0.5)
+        self.assertEqual(list(result["components"])[-1], "custom")
+
+    def test_expired_deadline_uses_exact_name_matching(self):
+        self.engine.load()
+        with mock.patch.object(self.engine.name_detector, "evaluate",
+                               wraps=self.engine.name_detector.evaluate) as evaluate:
+            result = self.engine.analyze("maria2024", deadline=Deadline(0))
+        evaluate.assert_called_once()
+        self.assertTrue(evaluate.call_args.kwargs["exact"])
+        self.assertEqual(result["degraded"], ["names"])
+        self.assertIn("maria", result["raw_data"]["names"]["matched_names"])
+        self.assertEqual(self.engine.analyze("maria2024", deadline=Deadline(60))["degraded"], [])
+
+    def test_budget_splits_batch_between_full_and_degraded(self):
+        self.engine.load()
+        spec = self.engine.registry.get("names")
+        spec.seconds_per_item = 10.0
+        results = self.engine.analyze_batch(["zq8maria!", "zq9maria!", "zq7maria!"], deadline=Deadline(25))
+        self.assertEqual([r["degraded"] for r in results], [[], [], ["names"]])
+
+    def test_budget_respected_before_first_timing(self):
+        """The first deadline request plans with the expected cost instead of running everything"""
+        self.engine.load()
+        spec = self.engine.registry.get("names")
+        self.assertIsNone(spec.seconds_per_item)
+        passwords = [f"zq{i}maria!" for i in range(100)]
+        deadline = mock.Mock(remaining=mock.Mock(return_value=20 * spec.expected_seconds))
+        results = self.engine.analyze_batch(passwords, deadline=deadline)
+        self.assertEqual(sum(not r["degraded"] for r in results), 20)
+
+    def test_warm_up_validates_data(self):
+        timings = self.engine.warm_up()
+        self.assertTrue(self.engine.is_loaded)
+        self.assertEqual(set(timings), {"names", "blocklists", "patterns", "breach"})
+
+        with mock.patch.object(engine.frequency_checker, "blocklist_size", return_value=0):
+            with self.assertRaises(RuntimeError):
+                self.engine.warm_up()
+
+    def test_get_engine_is_shared(self):
+        self.assertIs(engine.get_engine(), engine.get_engine())
+
+
+if __name__ == "__main__":
+    unittest.main()
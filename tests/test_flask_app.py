@@ -0,0 +1,181 @@
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+import flask_app
+from src.analyzer import vectorized
+
+class TestFlaskApp(unittest.TestCase):
+
+    def setUp(self):
+        self.client = flask_app.app.test_client()
+
+    def test_analyze_single_password(self):
+        res = self.client.post("/analyze", json={"password": "password"})
+        self.assertEqual(res.status_code, 200)
+        body = res.get_json()
+        self.assertEqual(body["strength"], "Weak")
+        self.assertTrue(body["breach_warning"])
+        self.assertEqual(body["skipped_analyzers"], ["names"])
+        self.assertEqual(body["components"]["names"], 1.0)
+
+    def test_clean_name_scan_is_not_reported_as_skipped(self):
+        res = self.client.post("/analyze", json={"password": "X9$kL2mP8qR5nT1wV4yZ"})
+        body = res.get_json()
+        self.assertEqual(body["skipped_analyzers"], [])
+        self.assertEqual(body["components"]["names"], 1.0)
+
+    def test_analyze_missing_password(self):
+        res = self.client.post("/analyze", json={})
+        self.assertEqual(res.status_code, 400)
+
+    def test_password_must_be_string(self):
+        for body in [{"password": 123}, {"password": ["a"] * 5000}, {"password": {"a": 1}}, ["password"]]:
+            res = self.client.post("/analyze", json=body)
+            self.assertEqual(res.status_code, 400, msg=body)
+        self.assertEqual(self.client.post("/analyze/batch", json=["password"]).status_code, 400)
+
+    def test_password_length_limit(self):
+        too_long = "a" * (flask_app.MAX_PASSWORD_LENGTH + 1)
+        self.assertEqual(self.client.post("/analyze", json={"password": too_long}).status_code, 413)
+        res = self.client.post("/analyze/batch", json={"passwords": ["ok", too_long]})
+        self.assertEqual(res.status_code, 413)
+
+    def test_batch_matches_single_requests(self):
+        passwords = ["password", "X9$kL2mP8qR5nT1wV4yZ", "maria2024", "password"]
+        res = self.client.post("/analyze/batch", json={"passwords": passwords})
+        self.assertEqual(res.status_code, 200)
+        results = res.get_json()["results"]
+        self.assertEqual(len(results), len(passwords))
+
+        for pw, batch_result in zip(passwords, results):
+            single = self.client.post("/analyze", json={"password": pw}).get_json()
+            self.assertEqual(batch_result, single, msg=pw)
+
+    def test_lone_surrogate_in_large_batch(self):
+        """Batches big enough for the vectorized path accept what /analyze accepts"""
+        passwords = ["\ud800"] + [f"password{i}" for i in range(vectorized.MIN_BATCH_SIZE)]
+        res = self.client.post("/analyze/batch", json={"passwords": passwords})
+        self.assertEqual(res.status_code, 200)
+        single = self.client.post("/analyze", json={"password": "\ud800"})
+        self.assertEqual(single.status_code, 200)
+        self.assertEqual(res.get_json()["results"][0], single.get_json())
+
+    def test_repeat_requests_hit_cache(self):
+        flask_app.result_cache.clear()
+        hits = flask_app.result_cache.hits
+        first = self.client.post("/analyze", json={"password": "sunshine42"}).get_json()
+        second = self.client.post("/analyze", json={"password": "sunshine42"}).get_json()
+        self.assertEqual(first, second)
+        self.assertEqual(flask_app.result_cache.hits, hits + 1)
+
+    def test_deadline(self):
+        res = self.client.post("/analyze", json={"password": "maria2024", "deadline_ms": 500})
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("degraded", res.get_json())
+        res = self.client.post("/analyze/batch", json={"passwords": ["maria2024"], "deadline_ms": 500})
+        self.assertEqual(res.status_code, 200)
+        for bad in [0, -5, "fast", True, flask_app.MAX_DEADLINE_MS + 1]:
+            res = self.client.post("/analyze", json={"password": "maria2024", "deadline_ms": bad})
+            self.assertEqual(res.status_code, 400, msg=bad)
+
+    def test_breach_index_used_when_built(self):
+        flask_app.result_cache.clear()
+        index = mock.Mock()
+        index.lookup.side_effect = lambda pw: 3 if pw == "zq8maria!" else 0
+        engine = flask_app.get_engine().load()
+        with mock.patch.object(engine, "breach", index):
+            breached = self.client.post("/analyze", json={"password": "zq8maria!"}).get_json()
+            leet = self.client.post("/analyze", json={"password": "P@ssw0rd"}).get_json()
+        flask_app.result_cache.clear()
+        self.assertEqual(breached["breach_count"], 3)
+        self.assertIn("breached password corpus", breached["breach_warning"])
+        # Not in the corpus, but the common password lists still catch the leetspeak variant
+        self.assertEqual(leet["breach_count"], 0)
+        self.assertIn("common password lists", leet["breach_warning"])
+
+    def test_degraded_results_not_cached(self):
+        flask_app.result_cache.clear()
+        engine = flask_app.get_engine()
+        spec = engine.registry.get("names")
+        estimate = spec.seconds_per_item
+        spec.seconds_per_item = 10.0  # pretend fuzzy matching is too slow for the budget
+        try:
+            body = self.client.post("/analyze", json={"password": "zq8maria!", "deadline_ms": 100}).get_json()
+        finally:
+            spec.seconds_per_item = estimate
+        self.assertTrue(body["degraded"])
+        self.assertEqual(body["degraded_analyzers"], ["names"])
+        self.assertEqual(len(flask_app.result_cache), 0)
+
+    def test_metrics_endpoint(self):
+        secret = "Unique$ecretPw1"
+        self.client.post("/analyze", json={"password": secret})
+        res = self.client.get("/metrics")
+        self.assertEqual(res.status_code, 200)
+        self.assertTrue(res.content_type.startswith("text/plain"))
+        text = res.get_data(as_text=True)
+        for name in ["password_analyzer_stage_seconds_bucket", "password_analyzer_request_seconds_count",
+                     "password_analyzer_password_length_chars_count", "password_analyzer_result_cache_hit_ratio"]:
+            self.assertIn(name, text)
+        self.assertIn('analyzer="names",mode="full"', text)
+        self.assertNotIn(secret, text)
+
+    def test_health(self):
+        res = self.client.get("/health")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.get_json(), {"status": "ok"})
+
+    def test_ready_after_warm_up(self):
+        flask_app.warm_up_thread.join(timeout=60)
+        res = self.client.get("/ready")
+        self.assertEqual(res.status_code, 200)
+        body = res.get_json()
+        self.assertEqual(body["status"], "ready")
+        self.assertIn("blocklists", body["load_timings"])
+
+    def test_not_ready_while_warming_up_or_failed(self):
+        state = dict(flask_app.warm_up_state)
+        try:
+            flask_app.warm_up_state.update(status="warming_up", error=None)
+            self.assertEqual(self.client.get("/ready").status_code, 503)
+            with mock.patch.object(flask_app.get_engine(), "warm_up", side_effect=RuntimeError("Warm-up failed: x")):
+                flask_app.warm_up()
+            res = self.client.get("/ready")
+            self.assertEqual(res.status_code, 503)
+            self.assertEqual(res.get_json(), {"status": "failed", "error": "Warm-up failed: x"})
+        finally:
+            flask_app.warm_up_state.clear()
+            flask_app.warm_up_state.update(state)
+
+    def test_batch_rejects_bad_input(self):
+        for body in [{}, {"passwords": []}, {"passwords": "password"}, {"passwords": ["ok", 5]}, {"passwords": [""]}]:
+            res = self.client.post("/analyze/batch", json=body)
+            self.assertEqual(res.status_code, 400, msg=body)
+
+    def test_batch_size_limit(self):
+        passwords = ["x"] * (flask_app.MAX_BATCH_SIZE + 1)
+        res = self.client.post("/analyze/batch", json={"passwords": passwords})
+        self.assertEqual(res.status_code, 413)
+
+    def test_limits_configurable(self):
+        with mock.patch.dict(flask_app.app.config, {"MAX_PASSWORD_LENGTH": 8, "MAX_BATCH_SIZE": 2}):
+            self.assertEqual(self.client.post("/analyze", json={"password": "a" * 9}).status_code, 413)
+            self.assertEqual(self.client.post("/analyze", json={"password": "a" * 8}).status_code, 200)
+            res = self.client.post("/analyze/batch", json={"passwords": ["abc", "def", "ghi"]})
+            self.assertEqual(res.status_code, 413)
+            self.assertIn("At most 2", res.get_json()["error"])
+
+    def test_limits_read_from_environment(self):
+        env = dict(os.environ, PASSWORD_ANALYZER_MAX_PASSWORD_LENGTH="64", PASSWORD_ANALYZER_MAX_BATCH_SIZE="5")
+        out = subprocess.run(
+            [sys.executable, "-c", "import flask_app; c = flask_app.app.config; "
+                                   "print(c['MAX_PASSWORD_LENGTH'], c['MAX_BATCH_SIZE'])"],
+            env=env, capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).stdout
+        self.assertEqual(out.split(), ["64", "5"])
+
+if __name__ == "__main__":
+    unittest.main()
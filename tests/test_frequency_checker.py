@@ -1,5 +1,9 @@
+import threading
+import time
 import unittest
+from unittest import mock
 from src.analyzer import frequency_checker
+from src.utils import snapshot
 
 class TestFrequencyChecker(unittest.TestCase):
 
@@ -10,21 +14,23 @@ class TestFrequencyChecker(unittest.TestCase):
 
     def test_top1k_password(self):
         """Test a password that exists in the top 1k blacklist"""
-        pw = "123456"  # common password, should exist in top1k
+        pw = "123456"  # second most common password
         result = frequency_checker.check_frequency(pw)
-        self.assertEqual(result["matched_list"], "top_10k")
+        self.assertEqual(result["matched_list"], "top_1k")
+        self.assertEqual(result["rank"], 1)
         self.assertEqual(result["frequency_score"], 1.0)
 
     def test_rockyou_password(self):
         """Test a password that exists in RockYou but not top 1k"""
-        pw = "letmein"  # example RockYou password not in top 1k
+        pw = "rockyou"  # the first RockYou entry missing from the top list
         result = frequency_checker.check_frequency(pw)
         self.assertEqual(result["matched_list"], "rockyou")
-        self.assertEqual(result["frequency_score"], 0.8)
+        self.assertEqual(result["rank"], 10000)
+        self.assertEqual(result["frequency_score"], 0.8472)
 
     def test_password_not_in_lists(self):
         """Test a password that is not in any blacklist"""
-        pw = "UncommonPassword123!"
+        pw = "zQ8$kv!Lw3"
         result = frequency_checker.check_frequency(pw)
         self.assertIsNone(result["matched_list"])
         self.assertEqual(result["frequency_score"], 0.0)
@@ -33,20 +39,152 @@ class TestFrequencyChecker(unittest.TestCase):
         """Passwords with leetspeak should match after normalization"""
         pw = "p@ssw0rd"  # should normalize to 'password'
         result = frequency_checker.check_frequency(pw)
-        # 'password' is a top1k password
-        self.assertEqual(result["matched_list"], "top_10k")
-        self.assertEqual(result["frequency_score"], 1.0)
+        # 'password' is the most common password
+        self.assertEqual(result["matched_list"], "top_1k")
+        self.assertEqual(result["rank"], 0)
+        self.assertEqual(result["frequency_score"], frequency_checker.MAX_SCORE)
+
+    def test_literal_digits_variant(self):
+        """Digits that are part of a common password should not only be read as leetspeak"""
+        result = frequency_checker.check_frequency("Password1")
+        self.assertIsNotNone(result["matched_list"])
+        self.assertGreater(result["frequency_score"], 0.0)
 
     def test_evaluate_multiple_passwords(self):
         """Test evaluate function for multiple passwords"""
-        passwords = ["123456", "letmein", "UncommonPassword123!", "p@ssw0rd"]
+        passwords = ["123456", "letmein", "rockyou", "zQ8$kv!Lw3", "p@ssw0rd"]
         results = frequency_checker.evaluate(passwords)
-        expected_matches = ["top_10k", "rockyou", None, "top_10k"]
-        expected_scores = [1.0, 0.8, 0.0, 1.0]
+        expected_matches = ["top_1k", "top_1k", "rockyou", None, "top_1k"]
+        expected_scores = [1.0, 0.9998, 0.8472, 0.0, 1.0]
 
         for i, res in enumerate(results):
             self.assertEqual(res["matched_list"], expected_matches[i])
             self.assertEqual(res["frequency_score"], expected_scores[i])
 
+    def test_score_follows_popularity_rank(self):
+        """More popular passwords get higher scores, within the score bounds"""
+        results = frequency_checker.evaluate(["password", "sunshine", "letmein", "charlie1"])
+        ranks = [res["rank"] for res in results]
+        scores = [res["frequency_score"] for res in results]
+        self.assertEqual(ranks[0], 0)
+        self.assertEqual(scores[0], frequency_checker.MAX_SCORE)
+        for res in results:
+            self.assertGreaterEqual(res["frequency_score"], frequency_checker.MIN_SCORE)
+            self.assertAlmostEqual(res["percentile"], res["rank"] / frequency_checker.blocklist_size(), places=4)
+        by_rank = [score for _, score in sorted(zip(ranks, scores))]
+        self.assertEqual(by_rank, sorted(by_rank, reverse=True))
+
+    def test_best_ranked_variant_wins(self):
+        literal = frequency_checker.check_frequency("password1")
+        self.assertEqual(literal["rank"], min(
+            rank for rank in (frequency_checker.check_frequency(v)["rank"] for v in ("password1", "passwordi", "passwordl"))
+            if rank is not None
+        ))
+
+    def test_unmatched_has_no_rank(self):
+        result = frequency_checker.check_frequency("UncommonPassword123!")
+        self.assertIsNone(result["rank"])
+        self.assertIsNone(result["percentile"])
+
+    def test_embedded_common_password(self):
+        """Common passwords inside longer ones are found, literally or in leetspeak"""
+        for pw in ["Password2024!", "xxdragonxx", "xxdr@g0nxx"]:
+            result = frequency_checker.check_frequency(pw)
+            self.assertIsNone(result["matched_list"], msg=pw)
+            self.assertIsNotNone(result["embedded"], msg=pw)
+            self.assertGreater(result["frequency_score"], 0.0, msg=pw)
+            self.assertLessEqual(result["frequency_score"], frequency_checker.EMBEDDED_WEIGHT, msg=pw)
+
+        embedded = frequency_checker.check_frequency("xxdragonxx")["embedded"]
+        self.assertEqual(embedded["longest"]["entry"], "dragon")
+        self.assertEqual(embedded["longest"]["start"], 2)
+        self.assertEqual(embedded["longest"]["coverage"], 0.6)
+
+        embedded = frequency_checker.check_frequency("Password2024!")["embedded"]
+        self.assertEqual(embedded["most_common"]["entry"], "password")
+        self.assertEqual(embedded["most_common"]["rank"], 0)
+        self.assertGreaterEqual(len(embedded["longest"]["entry"]), len("password"))
+
+    def test_exact_match_not_scanned(self):
+        for pw in ["password", "zQ8$kv!Lw3"]:
+            result = frequency_checker.check_frequency(pw)
+            self.assertIsNone(result["embedded"], msg=pw)
+            self.assertIsNone(result["near_miss"], msg=pw)
+
+    def test_near_miss(self):
+        """Passwords an edit or two from a common password are penalized"""
+        result = frequency_checker.check_frequency("Dragonn")
+        self.assertIsNone(result["matched_list"])
+        self.assertEqual(result["near_miss"]["entry"], "dragon")
+        self.assertEqual(result["near_miss"]["distance"], 1)
+        self.assertGreater(result["frequency_score"], 0.0)
+        self.assertLessEqual(result["frequency_score"], frequency_checker.NEAR_MISS_WEIGHTS[1])
+
+        result = frequency_checker.check_frequency("sunshinne")
+        self.assertEqual((result["near_miss"]["entry"], result["near_miss"]["distance"]), ("sunshine", 1))
+
+class TestFrequencyListLoading(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = frequency_checker._unload()
+
+    def tearDown(self):
+        frequency_checker._restore(self.saved)
+
+    def test_load_publishes_one_state(self):
+        """A load changes no module global but the published state"""
+        before = dict(vars(frequency_checker))
+        frequency_checker.load_frequency_lists()
+        changed = {name for name, value in vars(frequency_checker).items() if before.get(name) is not value}
+        self.assertEqual(changed, {"_state"})
+        frequency_checker._unload()
+        self.assertIsNone(frequency_checker._state)
+
+    def test_reload_replaces_state_whole(self):
+        """Readers holding the old state keep consistent lists; the new state is complete"""
+        frequency_checker.load_frequency_lists()
+        old = frequency_checker._state
+        old_parts = [getattr(old, name) for name in old.__slots__]
+        frequency_checker.reload_frequency_lists()
+        new = frequency_checker._state
+        self.assertIsNot(new, old)
+        self.assertEqual([getattr(old, name) for name in old.__slots__], old_parts)
+        self.assertIsNotNone(new.index)
+        self.assertIsNotNone(new.substring_blocklist)
+        self.assertIsNotNone(new.near_miss_index)
+        # Exactly one of the two index kinds is kept
+        self.assertEqual((new.rank_index is None) + (new.compiled_blocklist is None), 1)
+
+    def test_concurrent_first_calls_load_once(self):
+        """Many threads hitting a cold checker share a single load of each list"""
+        read_list = frequency_checker._read_list
+        reads = []
+
+        def slow_read(path):
+            reads.append(path)
+            time.sleep(0.05)  # keep the load in flight while the other threads arrive
+            return read_list(path)
+
+        threads_count = 32
+        barrier = threading.Barrier(threads_count)
+        results = [None] * threads_count
+
+        def worker(i):
+            barrier.wait()
+            results[i] = frequency_checker.check_frequency("letmein")
+
+        with mock.patch.object(frequency_checker, "_read_list", side_effect=slow_read), \
+                mock.patch.object(frequency_checker, "compiled_blocklist_is_current", return_value=False), \
+                mock.patch.object(snapshot, "SNAPSHOT_DIR", ""):
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(threads_count)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        self.assertEqual(sorted(reads), sorted([frequency_checker.ROCKYOU_FILE, frequency_checker.TOP_10K_FILE]))
+        self.assertTrue(all(r == results[0] for r in results))
+        self.assertEqual(results[0]["matched_list"], "top_1k")
+
 if __name__ == "__main__":
     unittest.main()
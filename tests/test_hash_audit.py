@@ -0,0 +1,105 @@
+import unittest
+import tempfile
+import hashlib
+import io
+import json
+import os
+from unittest import mock
+from src.analyzer import hash_audit
+from src.utils.ntlm import ntlm_hash
+
+def sha1_hex(password):
+    return hashlib.sha1(password.encode("utf-8")).hexdigest()
+
+class TestHashAudit(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        top = os.path.join(self.tmpdir.name, "top.txt")
+        big = os.path.join(self.tmpdir.name, "big.txt")
+        with open(top, "w", encoding="utf-8") as f:
+            f.write("password\n123456\nQwerty\n")
+        with open(big, "w", encoding="utf-8") as f:
+            f.write("letmein\npassword\n\nsunshine\n")
+        sources = [("top_1k", top), ("rockyou", big)]
+
+        self.indexes = {}
+        for algorithm in hash_audit.ALGORITHMS:
+            path = hash_audit.index_path(algorithm, self.tmpdir.name)
+            hash_audit.build_hash_index(sources, algorithm, path)
+            self.indexes[algorithm] = hash_audit.HashIndex(path)
+
+    def tearDown(self):
+        for index in self.indexes.values():
+            index.close()
+        self.tmpdir.cleanup()
+
+    def test_lookup_tiers_and_variants(self):
+        sha1 = self.indexes["sha1"]
+        self.assertEqual(sha1.lookup(hashlib.sha1(b"password").digest()),
+                         {"matched_list": "top_1k", "variant": False})
+        self.assertEqual(sha1.lookup(hashlib.sha1(b"L37m31n").digest()),
+                         {"matched_list": "rockyou", "variant": True})
+        self.assertEqual(self.indexes["ntlm"].lookup(ntlm_hash("Qwerty")),
+                         {"matched_list": "top_1k", "variant": True})
+        self.assertIsNone(sha1.lookup(hashlib.sha1(b"zq8maria!").digest()))
+
+    def test_build_merges_sorted_runs(self):
+        """Spilling many small runs builds the same index as sorting in one run"""
+        sources = [("top_1k", os.path.join(self.tmpdir.name, "top.txt")),
+                   ("rockyou", os.path.join(self.tmpdir.name, "big.txt"))]
+        path = os.path.join(self.tmpdir.name, "runs.bin")
+        with mock.patch.object(hash_audit, "RUN_RECORDS", 3):
+            count = hash_audit.build_hash_index(sources, "sha1", path)
+        self.assertEqual(count, len(self.indexes["sha1"]))
+        with open(path, "rb") as merged, open(hash_audit.index_path("sha1", self.tmpdir.name), "rb") as single:
+            self.assertEqual(merged.read(), single.read())
+        self.assertFalse([name for name in os.listdir(self.tmpdir.name) if name.startswith(".hash-runs-")])
+
+    def test_join_matches_lookup(self):
+        index = self.indexes["sha1"]
+        digests = [hashlib.sha1(pw.encode()).digest()
+                   for pw in ["sunshine", "nope", "P455w0rd", "123456", "alsonope", "password"]]
+        self.assertEqual(index.join(digests), [index.lookup(d) for d in digests])
+
+    def test_parse_hash_line(self):
+        nt = ntlm_hash("dragon").hex()
+        self.assertEqual(hash_audit.parse_hash_line(f"bob:1001:aad3b435b51404eeaad3b435b51404ee:{nt}:::"),
+                         ("bob", "ntlm", bytes.fromhex(nt)))
+        self.assertEqual(hash_audit.parse_hash_line(f"CORP\\alice:{sha1_hex('x')}")[:2], ("CORP\\alice", "sha1"))
+        self.assertEqual(hash_audit.parse_hash_line(sha1_hex("x").upper())[:2], (None, "sha1"))
+        for bad in ["", "   ", "alice:notahash", "z" * 40]:
+            self.assertIsNone(hash_audit.parse_hash_line(bad), msg=bad)
+
+    def test_audit_reports_matches_in_input_order(self):
+        lines = [
+            f"alice:{sha1_hex('P@$$w0rd')}",
+            f"bob:1001:aad3b435b51404eeaad3b435b51404ee:{ntlm_hash('letmein').hex()}:::",
+            f"carol:{sha1_hex('zq8maria!')}",
+            "",
+            f"dave:{sha1_hex('123456')}",
+        ]
+        records = list(hash_audit.audit_hashes(lines, self.indexes, chunk_size=2))
+        self.assertEqual([(r["line"], r["account"], r["algorithm"], r["matched_list"], r["variant"]) for r in records], [
+            (1, "alice", "sha1", "top_1k", True),
+            (2, "bob", "ntlm", "rockyou", False),
+            (5, "dave", "sha1", "top_1k", False),
+        ])
+
+    def test_run_hash_audit_summary(self):
+        stream = io.StringIO(f"a:{sha1_hex('password')}\nb:{sha1_hex('sunshine')}\nc:{sha1_hex('zzz')}\n")
+        out = io.StringIO()
+        summary = hash_audit.run_hash_audit(stream, out, self.indexes, progress=None)
+        self.assertEqual(summary["processed"], 3)
+        self.assertEqual(summary["by_list"], {"top_1k": 1, "rockyou": 1})
+        self.assertEqual([json.loads(line)["account"] for line in out.getvalue().splitlines()], ["a", "b"])
+
+    def test_rejects_other_files(self):
+        other = os.path.join(self.tmpdir.name, "other.bin")
+        with open(other, "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            hash_audit.HashIndex(other)
+
+if __name__ == "__main__":
+    unittest.main()
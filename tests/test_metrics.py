@@ -0,0 +1,50 @@
+import unittest
+from src.utils import metrics
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = metrics.MetricsRegistry()
+
+    def test_counter(self):
+        counter = self.registry.counter("calls_total", "Calls", ["analyzer"])
+        counter.inc(analyzer="names")
+        counter.inc(2, analyzer="names")
+        self.assertEqual(counter.value(analyzer="names"), 3)
+        self.assertIn('calls_total{analyzer="names"} 3', self.registry.render())
+        with self.assertRaises(ValueError):
+            counter.inc(stage="names")
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = self.registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 5.0):
+            histogram.observe(value)
+        text = self.registry.render()
+        self.assertIn("# TYPE latency_seconds histogram", text)
+        self.assertIn('latency_seconds_bucket{le="0.1"} 2', text)
+        self.assertIn('latency_seconds_bucket{le="1.0"} 3', text)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 4', text)
+        self.assertIn("latency_seconds_sum 5.65", text)
+        self.assertIn("latency_seconds_count 4", text)
+
+    def test_time_context_manager(self):
+        histogram = self.registry.histogram("stage_seconds", "Stage", ["stage"])
+        with histogram.time(stage="a"):
+            pass
+        self.assertEqual(histogram.count(stage="a"), 1)
+
+    def test_gauge_and_label_escaping(self):
+        self.registry.gauge("ratio", "Ratio", lambda: 0.5)
+        counter = self.registry.counter("odd_total", "Odd", ["label"])
+        counter.inc(label='a"b\\c')
+        text = self.registry.render()
+        self.assertIn("ratio 0.5", text)
+        self.assertIn('odd_total{label="a\\"b\\\\c"} 1', text)
+
+    def test_duplicate_name_rejected(self):
+        self.registry.counter("x_total", "X")
+        with self.assertRaises(ValueError):
+            self.registry.counter("x_total", "X")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,9 @@
 import unittest
 import tempfile
 import os
-from src.analyzer.name_detector import NameDetector
+from unittest import mock
+from src.analyzer.name_detector import NameDetector, NameIndex, HAS_RAPIDFUZZ
+from src.utils import snapshot
 
 
 class TestNameDetector(unittest.TestCase):
@@ -80,6 +82,77 @@ class TestNameDetector(unittest.TestCase):
         self.assertEqual(result["name_score"], 1)   # only count unique names
         self.assertEqual(len(result["matched_names"]), 1)
 
+    # ----------------------------------------------------------
+    # 7. Ambiguous leetspeak ('1' read as 'l')
+    # ----------------------------------------------------------
+    def test_ambiguous_leetspeak(self):
+        result = self.detector.analyze("A1ex1990")
+        self.assertIn("alex", result["matched_names"])
+
+    # ----------------------------------------------------------
+    # 8. Indexed fuzzy matching must agree with the linear scan
+    # ----------------------------------------------------------
+    @unittest.skipUnless(HAS_RAPIDFUZZ, "requires rapidfuzz")
+    def test_index_matches_linear_scan(self):
+        linear = NameDetector(use_index=False)
+        indexed = NameDetector(use_index=True)
+        for pw in ["m4ria1990", "al3xandr", "jonh", "xxdavidxx", "qwerty", "a", "Tr0ub4dor&3"]:
+            self.assertEqual(indexed.analyze(pw), linear.analyze(pw), msg=pw)
+
+    def test_index_prefilters_unrelated_names(self):
+        index = NameIndex(["alice", "maria", "bob"], fuzzy_threshold=90)
+        candidates = index.candidates("maria2024")
+        self.assertIn("maria", candidates)
+        self.assertNotIn("alice", candidates)
+
+    def test_snapshot_skips_rebuild(self):
+        with tempfile.TemporaryDirectory() as snapshot_dir, \
+                mock.patch.object(snapshot, "SNAPSHOT_DIR", snapshot_dir):
+            first = NameDetector(name_file_path=self.temp_file.name, use_snapshot=True)
+            with mock.patch.object(NameDetector, "_build") as build:
+                second = NameDetector(name_file_path=self.temp_file.name, use_snapshot=True)
+            build.assert_not_called()
+        self.assertEqual(second.names, first.names)
+        self.assertEqual(second.analyze("xx_alice_77"), first.analyze("xx_alice_77"))
+
+
+    @unittest.skipUnless(HAS_RAPIDFUZZ, "requires rapidfuzz")
+    def test_auto_mode_tries_exact_scan_first(self):
+        detector = NameDetector(name_file_path=self.temp_file.name)
+        self.assertEqual(detector.mode, "auto")
+        with mock.patch("src.analyzer.name_detector.fuzz.partial_ratio") as partial_ratio:
+            self.assertEqual(detector.analyze("maria2024")["matched_names"], ["maria"])
+        partial_ratio.assert_not_called()
+
+    @unittest.skipUnless(HAS_RAPIDFUZZ, "requires rapidfuzz")
+    def test_auto_mode_falls_back_to_fuzzy(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as f:
+            f.write("Christopher\n")
+        self.addCleanup(os.remove, f.name)
+        detector = NameDetector(name_file_path=f.name)
+        self.assertEqual(detector.analyze("christophr")["matched_names"], ["christopher"])
+        exact = NameDetector(name_file_path=f.name, mode="exact")
+        self.assertEqual(exact.analyze("christophr")["matched_names"], [])
+
+
+class TestNameDetectorExactMode(TestNameDetector):
+    """Re-run the detector tests against the Aho-Corasick exact mode."""
+
+    def setUp(self):
+        super().setUp()
+        self.detector = NameDetector(name_file_path=self.temp_file.name, mode="exact")
+
+    def test_longer_name_absorbs_contained_names(self):
+        detector = NameDetector(name_file_path=self.temp_file.name, mode="exact")
+        detector_all = NameDetector(mode="exact")
+        self.assertEqual(detector.analyze("alexalice")["matched_names"], ["alex", "alice"])
+        # 'ann', 'anna', 'mar', 'maria' are all inside 'annamaria'; only the longest counts
+        self.assertEqual(detector_all.analyze("annamaria")["matched_names"], ["annamaria"])
+
+    def test_unknown_mode_rejected(self):
+        with self.assertRaises(ValueError):
+            NameDetector(name_file_path=self.temp_file.name, mode="regex")
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
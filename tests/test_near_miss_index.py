@@ -0,0 +1,64 @@
+import unittest
+import pickle
+import random
+from src.analyzer.near_miss_index import NearMissIndex, deletions, edit_distance
+
+class TestNearMissIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.entries = ["password", "123456", "dragon", "sunshine", "password1", "qwertyuiop", "abc", "monkey7"]
+        self.index = NearMissIndex(self.entries)
+
+    def test_deletions(self):
+        self.assertEqual(deletions("abc", 1), {"abc": 0, "bc": 1, "ac": 1, "ab": 1})
+        self.assertEqual(deletions("aab", 2), {"aab": 0, "ab": 1, "aa": 1, "a": 2, "b": 2})
+
+    def test_edit_distance(self):
+        self.assertEqual(edit_distance("password", "passwrod", 2), 1)  # transposition
+        self.assertEqual(edit_distance("kitten", "sitting", 3), 3)
+        self.assertEqual(edit_distance("kitten", "sitting", 2), 3)  # over the limit
+        self.assertEqual(edit_distance("abc", "abc", 2), 0)
+        self.assertEqual(edit_distance("", "ab", 2), 2)
+
+    def test_distance_one(self):
+        for query, entry in [("dragonn", "dragon"), ("sunshinne", "sunshine"), ("passwrod", "password"),
+                             ("qwertyuiopp", "qwertyuiop"), ("monkey8", "monkey7")]:
+            result = self.index.lookup(query)
+            self.assertEqual((result["entry"], result["distance"]), (entry, 1), msg=query)
+
+    def test_distance_two_needs_longer_input(self):
+        result = self.index.lookup("xxpassword")
+        self.assertEqual((result["entry"], result["distance"], result["rank"]), ("password", 2, 0))
+        self.assertIsNone(self.index.lookup("drag0nxx", max_distance=1))
+        self.assertIsNone(self.index.lookup("dr4gn"))  # two edits, but too short for distance 2
+
+    def test_most_common_wins_ties(self):
+        # One edit from both "password" (rank 0) and "password1" (rank 4)
+        self.assertEqual(self.index.lookup("passwordx")["entry"], "password")
+
+    def test_exact_and_unrelated_inputs(self):
+        # An entry is never its own near miss; exact matches are the caller's to check
+        self.assertEqual(self.index.lookup("password")["entry"], "password1")
+        self.assertIsNone(self.index.lookup("dragon"))
+        self.assertIsNone(self.index.lookup("zq8$kv!lw3"))
+        self.assertIsNone(self.index.lookup("abd"))  # entries under MIN_LENGTH aren't indexed
+        self.assertEqual(len(self.index), 7)
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        words = ["".join(rng.choice("abcde") for _ in range(rng.randint(5, 10))) for _ in range(300)]
+        index = NearMissIndex(words)
+        for _ in range(200):
+            query = "".join(rng.choice("abcde") for _ in range(rng.randint(4, 11)))
+            limit = 2 if len(query) >= 8 else 1
+            expected = min(((edit_distance(query, word, limit), rank) for rank, word in enumerate(words)
+                            if 1 <= edit_distance(query, word, limit) <= limit), default=None)
+            result = index.lookup(query)
+            self.assertEqual(None if result is None else (result["distance"], result["rank"]), expected, msg=query)
+
+    def test_pickle_round_trip(self):
+        restored = pickle.loads(pickle.dumps(self.index))
+        self.assertEqual(restored.lookup("dragonn"), self.index.lookup("dragonn"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,5 +22,41 @@ class TestNormalization(unittest.TestCase):
         self.assertEqual(normalization.normalize(None), "")
         self.assertEqual(normalization.normalize(12345), "")
 
+    def test_leet_variants_primary_first(self):
+        variants = normalization.leet_variants("A1ex")
+        self.assertEqual(variants[0], normalization.normalize("A1ex"))
+        self.assertIn("alex", variants)
+
+    def test_leet_variants_keep_literal(self):
+        variants = normalization.leet_variants("Password1", keep_literal=True)
+        self.assertEqual(variants[:2], ("passwordi", "password1"))
+        self.assertIn("passwordl", variants)
+        self.assertNotIn("password1", normalization.leet_variants("Password1"))
+
+    def test_leet_variants_bounded(self):
+        pw = "1!" * 50
+        variants = normalization.leet_variants(pw, max_variants=5, keep_literal=True)
+        self.assertEqual(len(variants), 5)
+        self.assertEqual(len(set(variants)), 5)
+        self.assertEqual(normalization.leet_variants(pw, max_variants=1), (normalization.normalize(pw),))
+
+    def test_leet_variants_non_string(self):
+        self.assertEqual(normalization.leet_variants(None), ("",))
+
+    def test_leet_variants_not_cached(self):
+        """Submitted passwords must not outlive their request in a module-level cache"""
+        normalization.leet_variants("S3cr3t-pa55")
+        for name, value in vars(normalization).items():
+            self.assertFalse(hasattr(value, "cache_info"), msg=name)
+
+    def test_spelling_variants_invert_normalize(self):
+        variants = normalization.spelling_variants("password")
+        self.assertEqual(variants[:3], ("password", "Password", "PASSWORD"))
+        self.assertIn("p@$$w0rd", variants)
+        for variant in variants:
+            self.assertEqual(normalization.normalize(variant), "password", msg=variant)
+        self.assertEqual(normalization.spelling_variants("123456"), ("123456",))
+        self.assertEqual(len(normalization.spelling_variants("password", max_variants=2)), 2)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
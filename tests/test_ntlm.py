@@ -0,0 +1,16 @@
+import unittest
+from src.utils import ntlm
+
+class TestNtlm(unittest.TestCase):
+
+    def test_md4_rfc1320_vectors(self):
+        self.assertEqual(ntlm.md4(b"").hex(), "31d6cfe0d16ae931b73c59d7e0c089c0")
+        self.assertEqual(ntlm.md4(b"abc").hex(), "a448017aaf21d8525fc10ae87aa6729d")
+        self.assertEqual(ntlm.md4(b"1234567890" * 8).hex(), "e33b4ddc9c38f2199c3e7b164fcc0536")
+
+    def test_ntlm_hash(self):
+        self.assertEqual(ntlm.ntlm_hash("password").hex(), "8846f7eaee8fb117ad06bdd830b7586c")
+        self.assertEqual(ntlm.ntlm_hash("").hex(), "31d6cfe0d16ae931b73c59d7e0c089c0")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import gc
+import unittest
+from src.analyzer import engine, parallel
+from src.analyzer.parallel import AnalyzerPool
+
+class TestAnalyzerPool(unittest.TestCase):
+
+    def setUp(self):
+        self.passwords = ["password", "maria2024", "X9$kL2mP8qR5nT1wV4yZ", "qwerty123", "letmein", "bob"] * 5
+
+    def test_pool_matches_serial_order(self):
+        serial = engine.analyze_batch(self.passwords)
+        with AnalyzerPool(workers=2, chunk_size=4) as pool:
+            parallel = pool.analyze_batch(self.passwords)
+        self.assertEqual(parallel, serial)
+
+    def test_analyze_batch_workers_option(self):
+        results = engine.analyze_batch(self.passwords, workers=2)
+        self.assertEqual([r["password"] for r in results], self.passwords)
+
+    def test_analyze_batch_reuses_pool(self):
+        engine.analyze_batch(self.passwords, workers=2)
+        pool = parallel.shared_pool(2)
+        engine.analyze_batch(self.passwords, workers=2)
+        self.assertIs(parallel.shared_pool(2), pool)
+
+    def test_parent_unfrozen_after_fork(self):
+        frozen = gc.get_freeze_count()
+        with AnalyzerPool(workers=2) as pool:
+            self.assertEqual(gc.get_freeze_count(), frozen)
+            self.assertEqual(len(pool.analyze_batch(self.passwords)), len(self.passwords))
+
+    def test_empty_batch(self):
+        with AnalyzerPool(workers=2) as pool:
+            self.assertEqual(pool.analyze_batch([]), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -74,5 +74,37 @@ class TestPatternDetector(unittest.TestCase):
         )
         self.assertAlmostEqual(res["pattern_score"], expected_score, places=2)
 
+    def test_sequence_regex_not_sliced_as_literal(self):
+        """Regex syntax in the sequence patterns must not match as literal text"""
+        res = pattern_detector.detect_patterns("x|1(0y")
+        self.assertNotIn("sequential_numbers", res["patterns"])
+        self.assertIn("sequential_numbers", pattern_detector.detect_patterns("x3210y")["patterns"])
+
+    def test_pattern_engine_custom_categories(self):
+        engine = pattern_detector.PatternEngine({
+            "keyboard_patterns": ["a.b"],
+            "repeated_chars": ["(.)\\1{2,}"],
+            "dates_alphanumeric": ["(?i)\\bjan[0-9]{2}\\b"],
+        })
+        self.assertIn("repeated_chars", engine.separate)
+        self.assertEqual(engine.detect("A.B")[0], ["keyboard_pattern"])
+        self.assertEqual(engine.detect("axb")[0], [])
+        self.assertEqual(engine.detect("zzz JAN20")[0], ["repeated_chars", "date_alphanumeric"])
+
+    def test_repeated_substring_details(self):
+        res = pattern_detector.detect_patterns("xx123123123")
+        self.assertIn("repeated_substring", res["patterns"])
+        details = res["details"]["repeated_substring"]
+        self.assertEqual(details["unit"], "123")
+        self.assertEqual(details["length"], 9)
+        self.assertAlmostEqual(details["coverage"], 9 / 11)
+
+    def test_long_input_is_fast(self):
+        """A 100k-character input must not hang the detector"""
+        import time
+        start = time.perf_counter()
+        pattern_detector.detect_patterns("abcdefghij" * 5000 + "".join(chr(0x4e00 + i) for i in range(50000)))
+        self.assertLess(time.perf_counter() - start, 10.0)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
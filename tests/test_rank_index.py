@@ -0,0 +1,65 @@
+import unittest
+import pickle
+import tracemalloc
+from src.analyzer.rank_index import RankIndex
+
+class TestRankIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = RankIndex([
+            ("top_1k", ["password", "123456", "qwerty"]),
+            ("rockyou", ["letmein", "password", "", "sunshine", "mañana"]),
+        ])
+
+    def test_ranks_follow_list_order(self):
+        """Entries rank by position, most common list first; duplicates keep their first rank"""
+        self.assertEqual(len(self.index), 6)
+        self.assertEqual([self.index.rank(e) for e in ["password", "123456", "qwerty", "letmein", "sunshine", "mañana"]],
+                         [0, 1, 2, 3, 4, 5])
+        self.assertEqual(self.index.entry(4), "sunshine")
+
+    def test_tiers(self):
+        self.assertEqual(self.index.lookup("password"), "top_1k")
+        self.assertEqual(self.index.lookup("qwerty"), "top_1k")
+        self.assertEqual(self.index.lookup("letmein"), "rockyou")
+        self.assertEqual(self.index.tier(5), "rockyou")
+
+    def test_missing_entries(self):
+        for entry in ["", "a", "passwor", "password1", "zzzzzz", "\ud800"]:
+            self.assertIsNone(self.index.rank(entry), msg=entry)
+            self.assertNotIn(entry, self.index)
+
+    def test_large_index(self):
+        entries = [f"pw{i}" for i in range(70000)]  # past the 16-bit slot limit
+        index = RankIndex([("big", entries)])
+        for i in (0, 1, 65535, 65536, 69999):
+            self.assertEqual(index.rank(f"pw{i}"), i)
+        self.assertIsNone(index.rank("pw70000"))
+        # A few bytes per entry beyond the strings
+        self.assertLess((index.nbytes() - len(index._blob)) / len(index), 16)
+
+    def test_unsized_iterables(self):
+        """Entries from generators (no length to size the table by) grow it as needed"""
+        index = RankIndex([("a", (f"pw{i}" for i in range(5000))), ("b", iter(["pw1", "extra"]))])
+        self.assertEqual(len(index), 5001)
+        self.assertEqual([index.rank(e) for e in ("pw0", "pw4999", "extra")], [0, 4999, 5000])
+        self.assertEqual(index.tier(5000), "b")
+
+    def test_build_streams_into_buffers(self):
+        """Building needs little more memory than the finished index"""
+        entries = [f"pw{i}" for i in range(50000)]
+        tracemalloc.start()
+        try:
+            index = RankIndex([("big", entries)])
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 1.5 * index.nbytes())
+
+    def test_pickle_round_trip(self):
+        restored = pickle.loads(pickle.dumps(self.index))
+        self.assertEqual(restored.rank("sunshine"), 4)
+        self.assertEqual(restored.lookup("123456"), "top_1k")
+
+if __name__ == "__main__":
+    unittest.main()
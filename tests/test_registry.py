@@ -0,0 +1,52 @@
+import unittest
+from src.analyzer.registry import AnalyzerRegistry
+
+class TestAnalyzerRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = AnalyzerRegistry()
+        self.registry.register("slow", lambda contexts: [], strength=float, cost=10)
+        self.registry.register("fast", lambda contexts: [], strength=float, cost=1)
+        self.registry.register("medium", lambda contexts: [], strength=float, cost=5)
+
+    def test_orders(self):
+        self.assertEqual(self.registry.names(), ["slow", "fast", "medium"])
+        self.assertEqual([spec.name for spec in self.registry.by_cost()], ["fast", "medium", "slow"])
+
+    def test_register_replaces(self):
+        self.registry.register("slow", lambda contexts: [], strength=float, cost=0)
+        self.assertEqual(len(self.registry), 3)
+        self.assertEqual(self.registry.by_cost()[0].name, "slow")
+        self.registry.unregister("slow")
+        self.assertNotIn("slow", self.registry)
+
+    def test_skip_rule(self):
+        spec = self.registry.register("names", lambda contexts: [], strength=float,
+                                      skip_if=lambda raw: raw.get("frequency") == "top_1k")
+        self.assertTrue(spec.should_skip({"frequency": "top_1k"}))
+        self.assertFalse(spec.should_skip({}))
+        self.assertFalse(self.registry.get("fast").should_skip({"frequency": "top_1k"}))
+
+    def test_affordable(self):
+        spec = self.registry.register("names", lambda contexts: [], strength=float,
+                                      degraded_run=lambda contexts: [])
+        # Before any timed run, budgets are planned at the expected cost
+        self.assertEqual(spec.affordable(5, 1.0), 5)
+        self.assertEqual(spec.affordable(5, 2.5 * spec.expected_seconds), 2)
+        spec.observe(2.0, 10)
+        self.assertAlmostEqual(spec.seconds_per_item, 0.2)
+        self.assertEqual(spec.affordable(5, 0.5), 2)
+        self.assertEqual(spec.affordable(5, 0.0), 0)
+        # Without a degraded run everything runs in full
+        self.assertEqual(self.registry.get("fast").affordable(5, 0.0), 5)
+
+    def test_expected_cost_replaced_by_first_timing(self):
+        spec = self.registry.register("names", lambda contexts: [], strength=float,
+                                      degraded_run=lambda contexts: [], expected_seconds=1.0)
+        self.assertEqual(spec.affordable(5, 2.5), 2)
+        spec.observe(0.01, 10)
+        self.assertAlmostEqual(spec.seconds_per_item, 0.001)
+        self.assertEqual(spec.affordable(5, 2.5), 5)
+
+if __name__ == "__main__":
+    unittest.main()
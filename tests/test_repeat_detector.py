@@ -0,0 +1,36 @@
+import unittest
+import re
+from src.analyzer import repeat_detector
+
+class TestRepeatDetector(unittest.TestCase):
+
+    def test_z_function(self):
+        self.assertEqual(repeat_detector.z_function("aabxaab"), [0, 1, 0, 0, 3, 1, 0])
+        self.assertEqual(repeat_detector.z_function(""), [])
+
+    def test_matches_old_regex(self):
+        """Detection agrees with the `(..+)\\1+` regex it replaces"""
+        regex = re.compile(r"(..+)\1+")
+        passwords = ["", "a", "aaa", "aaaa", "abab", "abcabc", "abcab", "123123123123",
+                     "passw0rdpassw0rd", "xyzzy", "abacaba", "aabaab", "qwerty", "mississippi"]
+        for pw in passwords:
+            found = repeat_detector.find_repeated_substring(pw)
+            self.assertEqual(found is not None, bool(regex.search(pw)), msg=pw)
+
+    def test_reports_unit_and_coverage(self):
+        result = repeat_detector.find_repeated_substring("!abab xyzxyzxyz")
+        self.assertEqual(result["unit"], "xyz")
+        self.assertEqual(result["start"], 6)
+        self.assertEqual(result["length"], 9)
+        self.assertAlmostEqual(result["coverage"], 9 / 15)
+
+    def test_primitive_unit(self):
+        result = repeat_detector.find_repeated_substring("aaaaaa")
+        self.assertEqual(result["unit"], "a")
+        self.assertEqual(result["coverage"], 1.0)
+
+    def test_no_repeat(self):
+        self.assertIsNone(repeat_detector.find_repeated_substring("abcdefg"))
+
+if __name__ == "__main__":
+    unittest.main()
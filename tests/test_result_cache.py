@@ -0,0 +1,45 @@
+import unittest
+from src.utils.result_cache import ResultCache
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = ResultCache(max_size=2, ttl=60, secret=b"test-secret")
+
+    def test_hit_and_miss_counters(self):
+        self.assertIsNone(self.cache.get("password"))
+        self.cache.put("password", {"score": 0.1})
+        self.assertEqual(self.cache.get("password"), {"score": 0.1})
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_lru_eviction(self):
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.cache.get("a")          # 'b' is now least recently used
+        self.cache.put("c", 3)
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_ttl_expiry(self):
+        cache = ResultCache(ttl=0)
+        cache.put("a", 1)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_version_change_invalidates(self):
+        self.cache.put("a", 1, version=1)
+        self.assertEqual(self.cache.get("a", version=1), 1)
+        self.assertIsNone(self.cache.get("a", version=2))
+
+    def test_keys_do_not_contain_plaintext(self):
+        self.cache.put("hunter2", 1)
+        for key in self.cache._entries:
+            self.assertNotIn(b"hunter2", key)
+        self.assertNotEqual(ResultCache().key("hunter2"), self.cache.key("hunter2"))
+
+if __name__ == "__main__":
+    unittest.main()
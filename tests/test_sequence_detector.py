@@ -0,0 +1,53 @@
+import unittest
+from src.analyzer import sequence_detector
+
+def _runs(password, run_type=None):
+    return [(r["direction"], r["start"], r["length"]) for r in sequence_detector.find_runs(password)
+            if run_type is None or r["type"] == run_type]
+
+class TestSequenceDetector(unittest.TestCase):
+
+    def test_numeric_runs(self):
+        self.assertEqual(_runs("x3210y", "numeric"), [("descending", 1, 4)])
+        self.assertEqual(_runs("pass123456", "numeric"), [("ascending", 4, 6)])
+        self.assertEqual(_runs("135", "numeric"), [])
+
+    def test_number_row_wrap(self):
+        """0 follows 9 only at the end of the number row"""
+        self.assertEqual(_runs("7890", "numeric"), [("ascending", 0, 4)])
+        self.assertEqual(_runs("0987", "numeric"), [("descending", 0, 4)])
+        self.assertEqual(_runs("8901", "numeric"), [("ascending", 0, 3)])
+        self.assertEqual(_runs("19901990", "numeric"), [])
+
+    def test_alpha_runs_ignore_case(self):
+        self.assertEqual(_runs("aBcD", "alpha"), [("ascending", 0, 4)])
+        self.assertEqual(_runs("abcba", "alpha"), [("ascending", 0, 3), ("descending", 2, 3)])
+        self.assertEqual(_runs("ab12", "alpha"), [])
+
+    def test_keyboard_runs(self):
+        for pw in ["qwerty", "asdfgh", "zxcvbn", "1q2w3e", "qazwsx", "qwe", "asd", "zxc",
+                   "!@#$", "ZXCV", "azerty", "741852", "159753"]:
+            self.assertTrue(_runs(pw, "keyboard"), msg=pw)
+
+    def test_keyboard_run_lengths(self):
+        runs = [r for r in sequence_detector.find_runs("1q2w3e4r") if r["layout"] == "qwerty"]
+        self.assertEqual([(r["direction"], r["start"], r["length"]) for r in runs], [("zigzag", 0, 8)])
+        runs = [r for r in sequence_detector.find_runs("1qaz2wsx") if r["layout"] == "qwerty"]
+        self.assertEqual([(r["start"], r["length"]) for r in runs], [(0, 4), (4, 4)])
+
+    def test_back_and_forth_is_not_a_walk(self):
+        for pw in ["0101", "2020", "asasas", "aaaa"]:
+            self.assertEqual(_runs(pw, "keyboard"), [], msg=pw)
+
+    def test_number_row_sequence_not_double_counted(self):
+        self.assertEqual(sequence_detector.detect_sequences("123456"),
+                         {"sequences_numeric": [{"type": "numeric", "direction": "ascending",
+                                                 "start": 0, "length": 6}]})
+
+    def test_short_and_invalid_input(self):
+        self.assertEqual(sequence_detector.find_runs(""), [])
+        self.assertEqual(sequence_detector.find_runs("ab"), [])
+        self.assertEqual(sequence_detector.find_runs(None), [])
+
+if __name__ == "__main__":
+    unittest.main()
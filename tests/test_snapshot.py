@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.utils import snapshot
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.dir.name, "names.txt")
+        self.snapshots = os.path.join(self.dir.name, "snapshots")
+        with open(self.source, "w") as f:
+            f.write("alice\nbob\n")
+        self.builds = 0
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def build(self):
+        self.builds += 1
+        with open(self.source) as f:
+            return set(f.read().split())
+
+    def load(self, params=None, snapshot_dir=None):
+        snapshot_dir = self.snapshots if snapshot_dir is None else snapshot_dir
+        return snapshot.load_or_build("names", [self.source], self.build, params, snapshot_dir)
+
+    def test_reuses_snapshot(self):
+        self.assertEqual(self.load(), {"alice", "bob"})
+        self.assertEqual(self.load(), {"alice", "bob"})
+        self.assertEqual(self.builds, 1)
+
+    def test_changed_source_rebuilds(self):
+        self.load()
+        with open(self.source, "a") as f:
+            f.write("carol\n")
+        self.assertEqual(self.load(), {"alice", "bob", "carol"})
+        self.assertEqual(self.builds, 2)
+
+    def test_touched_but_unchanged_source_reuses(self):
+        self.load()
+        stat = os.stat(self.source)
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.load()
+        self.assertEqual(self.builds, 1)
+
+    def test_touched_source_refreshes_recorded_mtime(self):
+        """After a hash confirms an unchanged source, later loads don't hash it again"""
+        self.load()
+        stat = os.stat(self.source)
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.load()
+        with mock.patch.object(snapshot, "file_digest", side_effect=AssertionError("rehashed")):
+            self.assertEqual(self.load(), {"alice", "bob"})
+        self.assertEqual(self.builds, 1)
+
+    def test_key_depends_on_source_path(self):
+        other = os.path.join(self.dir.name, "other.txt")
+        self.assertEqual(snapshot.key("names", [self.source]), snapshot.key("names", [self.source]))
+        self.assertNotEqual(snapshot.key("names", [self.source]), snapshot.key("names", [other]))
+
+    def test_same_size_edit_rebuilds(self):
+        self.load()
+        stat = os.stat(self.source)
+        with open(self.source, "w") as f:
+            f.write("alicx\nbob\n")
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(self.load(), {"alicx", "bob"})
+
+    def test_params_are_part_of_the_key(self):
+        self.load(params=(90,))
+        self.load(params=(80,))
+        self.assertEqual(self.builds, 2)
+
+    def test_disabled(self):
+        self.load(snapshot_dir="")
+        self.load(snapshot_dir="")
+        self.assertEqual(self.builds, 2)
+        self.assertFalse(os.path.exists(self.snapshots))
+
+    def test_corrupt_snapshot_rebuilds(self):
+        self.load()
+        with open(os.path.join(self.snapshots, "names.pickle"), "wb") as f:
+            f.write(b"not a pickle")
+        self.assertEqual(self.load(), {"alice", "bob"})
+        self.assertEqual(self.builds, 2)
+
+    def test_unsupported_pickle_protocol_rebuilds(self):
+        """Unpickling errors raised as ValueError also fall back to a rebuild"""
+        self.load()
+        with open(os.path.join(self.snapshots, "names.pickle"), "wb") as f:
+            f.write(b"\x80\xff")
+        self.assertEqual(self.load(), {"alice", "bob"})
+        self.assertEqual(self.builds, 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+from src.analyzer.substring_blocklist import SubstringBlocklist
+
+class TestSubstringBlocklist(unittest.TestCase):
+
+    def setUp(self):
+        self.blocklist = SubstringBlocklist(["password", "123", "dragon", "pass", "password1", "sword"])
+
+    def test_short_entries_skipped(self):
+        self.assertEqual(len(self.blocklist), 5)
+        self.assertIsNone(self.blocklist.scan(["xx123xx"]))
+
+    def test_longest_and_most_common(self):
+        result = self.blocklist.scan(["mypassword1!"])
+        self.assertEqual(result["longest"], {"entry": "password1", "rank": 4, "start": 2, "coverage": 0.75})
+        self.assertEqual(result["most_common"], {"entry": "password", "rank": 0, "start": 2, "coverage": 0.6667})
+
+    def test_every_embedded_entry_considered(self):
+        """An entry ending where a longer one does (sword in password) still counts"""
+        blocklist = SubstringBlocklist(["sword", "password"])
+        self.assertEqual(blocklist.scan(["apassword"])["most_common"]["entry"], "sword")
+
+    def test_best_over_readings(self):
+        result = self.blocklist.scan(["xxdr4g0nxx", "xxdragonxx"])
+        self.assertEqual(result["longest"]["entry"], "dragon")
+
+    def test_no_match(self):
+        self.assertIsNone(self.blocklist.scan(["zq8$kv!lw3", ""]))
+
+if __name__ == "__main__":
+    unittest.main()
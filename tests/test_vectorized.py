@@ -0,0 +1,58 @@
+import unittest
+from unittest import mock
+from src.analyzer import vectorized, length_checker, entropy_calculator
+
+@unittest.skipUnless(vectorized.HAS_NUMPY, "requires numpy")
+class TestVectorized(unittest.TestCase):
+
+    def setUp(self):
+        self.passwords = ["", "a", "aaaaaa", "abc123", "passw0rd", "P@ssw0rd123",
+                          "Str0ngP@ssw0rd!", "uhhohhuhh", "mañana€😀", "X9$kL2mP8qR5nT1wV4yZ" * 3]
+
+    def test_encode_batch_pads_rows(self):
+        codes, lengths = vectorized.encode_batch(["ab", "", "c"])
+        self.assertEqual(lengths.tolist(), [2, 0, 1])
+        self.assertEqual(codes.tolist(), [[97, 98], [-1, -1], [99, -1]])
+
+    def test_matches_scalar_scores(self):
+        length_scores, entropy_scores = vectorized.score_length_and_entropy(self.passwords)
+        for pw, length_score, entropy_score in zip(self.passwords, length_scores, entropy_scores):
+            self.assertAlmostEqual(length_score, length_checker.check_length(pw), places=9, msg=pw)
+            self.assertAlmostEqual(entropy_score, entropy_calculator.check_entropy(pw), places=9, msg=pw)
+
+    def test_buckets_cap_padding(self):
+        """A long password gets its own bucket instead of widening every row"""
+        passwords = ["x" * 5000] + [f"pw{i}" for i in range(200)] + ["y" * 900]
+        widths = []
+        encode = vectorized.encode_batch
+
+        def recording_encode(batch):
+            codes, lengths = encode(batch)
+            widths.append(codes.shape)
+            return codes, lengths
+
+        with mock.patch.object(vectorized, "MAX_CELLS", 4096), \
+                mock.patch.object(vectorized, "encode_batch", side_effect=recording_encode):
+            scores = vectorized.score_entropies(passwords)
+        self.assertTrue(all(rows == 1 or rows * width <= 4096 for rows, width in widths), widths)
+        self.assertEqual(sum(rows for rows, _ in widths), len(passwords))
+        for pw, score in zip(passwords, scores):
+            self.assertAlmostEqual(score, entropy_calculator.check_entropy(pw), places=9, msg=pw)
+
+    def test_raw_entropy_matches_scalar(self):
+        codes, lengths = vectorized.encode_batch(self.passwords)
+        for pw, entropy in zip(self.passwords, vectorized.batch_entropy(codes, lengths).tolist()):
+            self.assertAlmostEqual(entropy, entropy_calculator.calculate_entropy(pw), places=9, msg=pw)
+
+    def test_lone_surrogates(self):
+        passwords = ["\ud800", "ab\udfffcd\ud800"] + self.passwords
+        codes, lengths = vectorized.encode_batch(passwords)
+        self.assertEqual(codes[0].tolist()[:1], [0xD800])
+        for pw, entropy_score in zip(passwords, vectorized.score_entropies(passwords)):
+            self.assertAlmostEqual(entropy_score, entropy_calculator.check_entropy(pw), places=9, msg=pw)
+
+    def test_empty_batch(self):
+        self.assertEqual(vectorized.score_length_and_entropy([]), ([], []))
+
+if __name__ == "__main__":
+    unittest.main()